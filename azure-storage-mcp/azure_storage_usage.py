@@ -0,0 +1,67 @@
+"""
+Command-line report of storage account usage.
+
+Lists the storage accounts of AZURE_SUBSCRIPTION_ID with their used
+capacity. pandas is only needed by this report, so it is imported here
+rather than by the usage library the MCP server uses.
+
+Usage:
+    python azure_storage_usage.py
+"""
+import asyncio
+import os
+import sys
+from dotenv import load_dotenv
+from utils.azure_clients import get_async_clients
+from utils.azure_storage_usage import (
+    StorageUsageError,
+    collect_storage_usage,
+    get_storage_accounts,
+    parse_account_id,
+)
+
+async def collect(accounts):
+    """Collect usage for all accounts and close the async clients."""
+    try:
+        return await collect_storage_usage(
+            [(*parse_account_id(account.id), account.name, account.location)
+             for account in accounts])
+    finally:
+        await get_async_clients().close()
+
+def main():
+    # Load environment variables from .env file
+    load_dotenv()
+
+    subscription_id = os.getenv("AZURE_SUBSCRIPTION_ID")
+    print(f"Using subscription ID: {subscription_id}")
+    if not subscription_id:
+        raise ValueError("Please set the AZURE_SUBSCRIPTION_ID environment variable.")
+
+    try:
+        accounts = get_storage_accounts(subscription_id)
+    except StorageUsageError as e:
+        print(f"\n❌ {str(e)}")
+        sys.exit(1)
+
+    print("📦 Collecting storage account usage data...\n")
+
+    storage_data = [{
+        'Storage Account': usage['storage_account'],
+        'Resource Group': usage['resource_group'],
+        'Subscription ID': usage['subscription_id'],
+        'Used Capacity': usage['used_capacity']
+    } for usage in asyncio.run(collect(accounts))]
+
+    import pandas as pd
+
+    # Display the results
+    storage_list = pd.DataFrame(storage_data)
+    print(storage_list.to_string(index=False, justify='left'))
+
+    # Save to CSV (optional)
+    # storage_list.to_csv('storage_accounts_usage.csv', index=False)
+    # print("\n✅ Done. Data shows GB or TiB based on size.")
+
+if __name__ == "__main__":
+    main()
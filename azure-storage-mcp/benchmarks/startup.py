@@ -0,0 +1,87 @@
+"""
+Benchmark the cold start of the Azure Storage MCP server.
+
+Each run starts a fresh Python process and measures:
+- import: time to import storage_mcp_server, and whether that loaded pandas
+- initialize: time from spawning the server over stdio until the MCP
+  handshake and a tools/list request complete
+
+No Azure calls should be made during either phase. The server is started
+without AZURE_SUBSCRIPTION_ID and with the usage refresher disabled, so the
+benchmark runs without credentials.
+
+Usage:
+    python benchmarks/startup.py [--runs N]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import storage_mcp_server
+print(json.dumps({"seconds": time.perf_counter() - start,
+                  "pandas": "pandas" in sys.modules}))
+"""
+
+def _server_env():
+    """Get the server environment, without anything that calls Azure."""
+    # Set rather than removed so that a .env file cannot fill them in
+    return dict(os.environ, AZURE_SUBSCRIPTION_ID="",
+                STORAGE_USAGE_REFRESH_INTERVAL="0")
+
+def measure_import():
+    """Import the server module in a fresh process."""
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE], cwd=PROJECT_DIR,
+        env=_server_env(), capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+async def measure_initialize():
+    """Start the server over stdio and complete the MCP handshake."""
+    server_params = StdioServerParameters(
+        command=sys.executable, args=["storage_mcp_server.py"],
+        cwd=PROJECT_DIR, env=_server_env())
+    start = time.perf_counter()
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            await session.list_tools()
+            return time.perf_counter() - start
+
+def summarize(name, seconds):
+    """Print a table row with min, mean and max in milliseconds."""
+    ms = [value * 1000 for value in seconds]
+    print(f"| {name} | {min(ms):.0f} | {statistics.mean(ms):.0f} | "
+          f"{max(ms):.0f} |")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.runs)]
+    initializes = [asyncio.run(measure_initialize())
+                   for _ in range(args.runs)]
+
+    print(f"{args.runs} cold starts of storage_mcp_server\n")
+    print("| Phase | Min (ms) | Mean (ms) | Max (ms) |")
+    print("| ---- | ---- | ---- | ---- |")
+    summarize("import", [result["seconds"] for result in imports])
+    summarize("initialize + list tools", initializes)
+    print(f"\npandas loaded on import: "
+          f"{'yes' if any(result['pandas'] for result in imports) else 'no'}")
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,49 @@
 """Azure Storage MCP Server Implementation."""
+import asyncio
+import contextlib
 import os
+import sys
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from typing import Dict, Any, List
-from utils.azure_storage_usage import get_storage_accounts, get_used_capacity
+from utils.azure_clients import close_async_clients
+from utils.usage_snapshot import get_refresh_interval, get_snapshot, run_refresher
+
+@contextlib.asynccontextmanager
+async def lifespan(server):
+    """Refresh the usage snapshot in the background while the server runs."""
+    subscription_id = os.getenv("AZURE_SUBSCRIPTION_ID")
+    interval = get_refresh_interval()
+    refresher = None
+    if subscription_id and interval > 0:
+        refresher = asyncio.create_task(run_refresher(subscription_id, interval))
+    try:
+        yield
+    finally:
+        if refresher is not None:
+            refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await refresher
+        await close_async_clients()
 
 # Initialize FastMCP server with the name "azure-storage"
-mcp = FastMCP("azure-storage")
+mcp = FastMCP("azure-storage", lifespan=lifespan)
 
 @mcp.tool()
-async def list_storage_accounts_with_usage() -> Dict[str, Any]:
+async def list_storage_accounts_with_usage(force_refresh: bool = False) -> Dict[str, Any]:
     """
     List all storage accounts in the subscription with their usage information.
     
+    Usage is served from a snapshot refreshed in the background, since
+    UsedCapacity is only updated hourly. Each account carries its
+    age_seconds, and snapshot_age_seconds is the age of the oldest one. If
+    some accounts fail, the others are still returned, the status is
+    "partial" and each failed account carries an "error" message.
+    
+    Args:
+        force_refresh: Re-read the usage of every account now instead of
+            using the snapshot. Only needed when live data is required.
+    
     Returns:
         Dict containing the list of storage accounts with their usage data
     """
@@ -25,28 +56,15 @@ async def list_storage_accounts_with_usage() -> Dict[str, Any]:
                 "message": "AZURE_SUBSCRIPTION_ID environment variable not set"
             }
 
-        # Get storage accounts
-        accounts = get_storage_accounts(subscription_id)
-        storage_data = []
-
-        # Collect usage data for each account
-        for account in accounts:
-            account_name = account.name
-            resource_group = account.id.split("/")[4]
-            sub_id = account.id.split("/")[2]
-
-            used_capacity_str = get_used_capacity(sub_id, resource_group, account_name)
-
-            storage_data.append({
-                'storage_account': account_name,
-                'resource_group': resource_group,
-                'subscription_id': sub_id,
-                'used_capacity': used_capacity_str
-            })
+        storage_data, snapshot_age = await get_snapshot(
+            subscription_id).get_all(force_refresh)
+        failed = sum(1 for usage in storage_data if "error" in usage)
 
         return {
-            "status": "success",
-            "storage_accounts": storage_data
+            "status": "partial" if failed else "success",
+            "storage_accounts": storage_data,
+            "failed_accounts": failed,
+            "snapshot_age_seconds": snapshot_age
         }
 
     except Exception as e:
@@ -56,13 +74,19 @@ async def list_storage_accounts_with_usage() -> Dict[str, Any]:
         }
 
 @mcp.tool()
-async def get_storage_account_usage(resource_group: str, account_name: str) -> Dict[str, Any]:
+async def get_storage_account_usage(resource_group: str, account_name: str,
+                                    force_refresh: bool = False) -> Dict[str, Any]:
     """
     Get the usage information for a specific storage account.
     
+    Usage is served from the background-refreshed snapshot when the account
+    is in it, with its age_seconds; otherwise it is read live.
+    
     Args:
         resource_group: The name of the resource group
         account_name: The name of the storage account
+        force_refresh: Read the account's usage now instead of using the
+            snapshot
     
     Returns:
         Dict containing the usage information for the specified storage account
@@ -75,16 +99,17 @@ async def get_storage_account_usage(resource_group: str, account_name: str) -> D
                 "message": "AZURE_SUBSCRIPTION_ID environment variable not set"
             }
 
-        used_capacity = get_used_capacity(subscription_id, resource_group, account_name)
+        usage = await get_snapshot(subscription_id).get_account(
+            resource_group, account_name, force_refresh)
+        if "error" in usage:
+            return {
+                "status": "error",
+                "message": usage["error"]
+            }
         
         return {
             "status": "success",
-            "data": {
-                "storage_account": account_name,
-                "resource_group": resource_group,
-                "subscription_id": subscription_id,
-                "used_capacity": used_capacity
-            }
+            "data": usage
         }
 
     except Exception as e:
@@ -97,9 +122,9 @@ async def get_storage_account_usage(resource_group: str, account_name: str) -> D
 load_dotenv()
 
 if __name__ == "__main__":
-    # Run the MCP server
-    print("Starting Azure Storage MCP Server...")
-    print("Available tools:")
-    print("1. list_storage_accounts_with_usage")
-    print("2. get_storage_account_usage")
+    # Run the MCP server; stdout carries the protocol, so log to stderr
+    print("Starting Azure Storage MCP Server...", file=sys.stderr)
+    print("Available tools:", file=sys.stderr)
+    print("1. list_storage_accounts_with_usage", file=sys.stderr)
+    print("2. get_storage_account_usage", file=sys.stderr)
     mcp.run(transport="stdio")
@@ -0,0 +1,154 @@
+"""
+Shared Azure credentials and management clients.
+
+Creating a credential probes the credential chain, and every new credential
+instance acquires its own tokens. The credential and the clients built on
+it are therefore created once and reused: Azure Identity credentials keep
+acquired tokens in memory and refresh them shortly before they expire, and
+management clients are cached per subscription.
+
+Sync clients are shared by the whole process. Async clients hold sessions
+bound to an event loop, so they are shared per running event loop.
+"""
+import asyncio
+import os
+import sys
+import threading
+
+from azure.identity import DefaultAzureCredential, ClientSecretCredential
+from azure.identity.aio import (
+    DefaultAzureCredential as AsyncDefaultAzureCredential,
+    ClientSecretCredential as AsyncClientSecretCredential,
+)
+from azure.mgmt.monitor import MonitorManagementClient
+from azure.mgmt.monitor.aio import (
+    MonitorManagementClient as AsyncMonitorManagementClient,
+)
+from azure.mgmt.storage import StorageManagementClient
+from azure.monitor.querymetrics.aio import MetricsClient
+
+_lock = threading.Lock()
+_credential = None
+_storage_clients = {}
+_monitor_clients = {}
+_async_clients = None
+
+def _get_service_principal():
+    """Get (tenant_id, client_id, client_secret) if all are configured."""
+    values = (os.getenv("AZURE_TENANT_ID"), os.getenv("AZURE_CLIENT_ID"),
+              os.getenv("AZURE_CLIENT_SECRET"))
+    return values if all(values) else None
+
+def get_azure_credential():
+    """Get Azure credential based on available environment variables."""
+    service_principal = _get_service_principal()
+
+    # Diagnostics go to stderr since stdout carries the MCP protocol
+    if not service_principal:
+        print("Warning: Service Principal credentials not found in environment variables.",
+              file=sys.stderr)
+        print("Attempting to use DefaultAzureCredential...", file=sys.stderr)
+        return DefaultAzureCredential()
+
+    tenant_id, client_id, client_secret = service_principal
+    try:
+        return ClientSecretCredential(
+            tenant_id=tenant_id,
+            client_id=client_id,
+            client_secret=client_secret
+        )
+    except Exception as e:
+        print(f"Error creating ClientSecretCredential: {str(e)}", file=sys.stderr)
+        print("Falling back to DefaultAzureCredential...", file=sys.stderr)
+        return DefaultAzureCredential()
+
+def get_shared_credential():
+    """Get the process-wide credential, creating it on first use."""
+    global _credential
+    with _lock:
+        if _credential is None:
+            _credential = get_azure_credential()
+        return _credential
+
+def get_storage_client(subscription_id):
+    """Get the shared StorageManagementClient of a subscription."""
+    credential = get_shared_credential()
+    with _lock:
+        if subscription_id not in _storage_clients:
+            _storage_clients[subscription_id] = StorageManagementClient(
+                credential, subscription_id)
+        return _storage_clients[subscription_id]
+
+def get_monitor_client(subscription_id):
+    """Get the shared MonitorManagementClient of a subscription."""
+    credential = get_shared_credential()
+    with _lock:
+        if subscription_id not in _monitor_clients:
+            _monitor_clients[subscription_id] = MonitorManagementClient(
+                credential, subscription_id)
+        return _monitor_clients[subscription_id]
+
+class AsyncAzureClients:
+    """Async credential and per-subscription clients of one event loop."""
+
+    def __init__(self, loop):
+        self.loop = loop
+        service_principal = _get_service_principal()
+        if service_principal:
+            tenant_id, client_id, client_secret = service_principal
+            self.credential = AsyncClientSecretCredential(
+                tenant_id=tenant_id,
+                client_id=client_id,
+                client_secret=client_secret
+            )
+        else:
+            self.credential = AsyncDefaultAzureCredential()
+        self._monitor_clients = {}
+        self._metrics_clients = {}
+
+    def get_monitor_client(self, subscription_id):
+        """Get the async MonitorManagementClient of a subscription."""
+        if subscription_id not in self._monitor_clients:
+            self._monitor_clients[subscription_id] = (
+                AsyncMonitorManagementClient(self.credential, subscription_id))
+        return self._monitor_clients[subscription_id]
+
+    def get_metrics_client(self, region):
+        """Get the async metrics batch client of a region."""
+        if region not in self._metrics_clients:
+            self._metrics_clients[region] = MetricsClient(
+                f"https://{region}.metrics.monitor.azure.com", self.credential)
+        return self._metrics_clients[region]
+
+    async def close(self):
+        """Close all clients and the credential."""
+        for client in [*self._monitor_clients.values(),
+                       *self._metrics_clients.values()]:
+            await client.close()
+        self._monitor_clients.clear()
+        self._metrics_clients.clear()
+        await self.credential.close()
+
+def get_async_clients():
+    """
+    Get the async clients of the running event loop.
+
+    Clients created for an earlier event loop are dropped; they cannot be
+    closed once their loop has stopped.
+
+    Returns:
+        AsyncAzureClients shared by all callers on the current event loop
+    """
+    global _async_clients
+    loop = asyncio.get_running_loop()
+    if _async_clients is None or _async_clients.loop is not loop:
+        _async_clients = AsyncAzureClients(loop)
+    return _async_clients
+
+async def close_async_clients():
+    """Close the async clients of the running event loop, if any."""
+    global _async_clients
+    if _async_clients is not None and \
+            _async_clients.loop is asyncio.get_running_loop():
+        clients, _async_clients = _async_clients, None
+        await clients.close()
@@ -1,123 +1,196 @@
+"""
+Storage account usage collection.
+
+Importing this module has no side effects: it does not read .env files,
+call Azure or load pandas. The command-line report lives in
+azure_storage_usage.py at the project root.
+"""
+import asyncio
 import os
 import sys
-from dotenv import load_dotenv
-from azure.identity import DefaultAzureCredential, ClientSecretCredential
-from azure.mgmt.storage import StorageManagementClient
-from azure.mgmt.monitor import MonitorManagementClient
+from datetime import timedelta
 from azure.core.exceptions import ClientAuthenticationError
-import pandas as pd
+from utils.azure_clients import (
+    get_async_clients,
+    get_storage_client,
+)
 
-# Load environment variables from .env file
-load_dotenv()
+# Default number of UsedCapacity requests in flight at the same time
+DEFAULT_USAGE_CONCURRENCY = 16
 
-def get_azure_credential():
-    """Get Azure credential based on available environment variables."""
-    tenant_id = os.getenv("AZURE_TENANT_ID")
-    client_id = os.getenv("AZURE_CLIENT_ID")
-    client_secret = os.getenv("AZURE_CLIENT_SECRET")
+# Most resources the Azure Monitor metrics batch API accepts per request
+MAX_BATCH_RESOURCES = 50
 
-    if not all([tenant_id, client_id, client_secret]):
-        print("Warning: Service Principal credentials not found in environment variables.")
-        print("Attempting to use DefaultAzureCredential...")
-        return DefaultAzureCredential()
-
-    try:
-        return ClientSecretCredential(
-            tenant_id=tenant_id,
-            client_id=client_id,
-            client_secret=client_secret
-        )
-    except Exception as e:
-        print(f"Error creating ClientSecretCredential: {str(e)}")
-        print("Falling back to DefaultAzureCredential...")
-        return DefaultAzureCredential()
+class StorageUsageError(Exception):
+    """Raised when storage accounts cannot be listed."""
 
 def get_storage_accounts(subscription_id):
+    """
+    List the storage accounts of a subscription.
+
+    Raises:
+        StorageUsageError: If authentication or the listing fails
+    """
     try:
-        credential = get_azure_credential()
-        storage_client = StorageManagementClient(credential, subscription_id)
+        storage_client = get_storage_client(subscription_id)
         accounts = list(storage_client.storage_accounts.list())
         return accounts
     except ClientAuthenticationError as auth_error:
-        print("\n❌ Authentication Error:")
-        print(str(auth_error))
-        print("\nPlease ensure your .env file contains the correct values for:")
-        print("- AZURE_TENANT_ID")
-        print("- AZURE_CLIENT_ID")
-        print("- AZURE_CLIENT_SECRET")
-        print("- AZURE_SUBSCRIPTION_ID")
-        sys.exit(1)
+        raise StorageUsageError(
+            f"Authentication Error: {str(auth_error)}\n"
+            "Please ensure your .env file contains the correct values for "
+            "AZURE_TENANT_ID, AZURE_CLIENT_ID, AZURE_CLIENT_SECRET and "
+            "AZURE_SUBSCRIPTION_ID."
+        ) from auth_error
     except Exception as e:
-        print(f"\n❌ Error listing storage accounts: {str(e)}")
-        sys.exit(1)
+        raise StorageUsageError(
+            f"Error listing storage accounts: {str(e)}") from e
 
-def get_used_capacity(subscription_id, resource_group_name, account_name):
-    credential = DefaultAzureCredential()
-    monitor_client = MonitorManagementClient(credential, subscription_id)
+def parse_account_id(account_id):
+    """Get the (subscription ID, resource group) of a storage account ID."""
+    parts = account_id.split("/")
+    return parts[2], parts[4]
 
-    resource_id = (
+def _get_resource_id(subscription_id, resource_group_name, account_name):
+    return (
         f"/subscriptions/{subscription_id}/resourceGroups/{resource_group_name}"
         f"/providers/Microsoft.Storage/storageAccounts/{account_name}"
     )
 
-    try:
-        metrics_data = monitor_client.metrics.list(
-            resource_id,
-            timespan="PT12H",
-            interval="PT1H",
-            metricnames="UsedCapacity",
-            aggregation="Average",
-            metricnamespace="Microsoft.Storage/storageAccounts"
-        )
-
-        for item in metrics_data.value:
-            for timeseries in item.timeseries:
-                for data in reversed(timeseries.data):  # Most recent first
-                    if data.average is not None:
-                        used_bytes = data.average
-                        gb = used_bytes / (1024 ** 3)
-                        tib = used_bytes / (1024 ** 4)
-
-                        if tib >= 1:
-                            return f"{round(tib, 2)} TiB"
-                        else:
-                            return f"{round(gb, 2)} GB"
-
-        return "N/A"
-
-    except Exception as e:
-        print(f"❌ Error retrieving UsedCapacity for {account_name}: {str(e)}")
-        return "N/A"
-
-# Replace with your subscription ID or from environment
-subscription_id = os.getenv("AZURE_SUBSCRIPTION_ID")
-print(f"Using subscription ID: {subscription_id}")
-if not subscription_id:
-    raise ValueError("Please set the AZURE_SUBSCRIPTION_ID environment variable.")
-
-accounts = get_storage_accounts(subscription_id)
-storage_data = []
-
-print("📦 Collecting storage account usage data...\n")
-
-for account in accounts:
-    account_name = account.name
-    resource_group = account.id.split("/")[4]
-    sub_id = account.id.split("/")[2]
-
-    used_capacity_str = get_used_capacity(sub_id, resource_group, account_name)
-
-    storage_data.append({
-        'Storage Account': account_name,
-        'Resource Group': resource_group,
-        'Subscription ID': sub_id,
-        'Used Capacity': used_capacity_str
-    })
-
-# Display the results
-storage_list = pd.DataFrame(storage_data)
-print(storage_list.to_string(index=False, justify='left'))
-
-# Save to CSV (optional)
-# storage_list.to_csv('storage_accounts_usage.csv', index=False)
-# print("\n✅ Done. Data shows GB or TiB based on size.")
+def _format_used_capacity(metrics):
+    """Format the most recent UsedCapacity average as GB or TiB."""
+    for item in metrics:
+        for timeseries in item.timeseries:
+            for data in reversed(timeseries.data):  # Most recent first
+                if data.average is not None:
+                    used_bytes = data.average
+                    gb = used_bytes / (1024 ** 3)
+                    tib = used_bytes / (1024 ** 4)
+
+                    if tib >= 1:
+                        return f"{round(tib, 2)} TiB"
+                    else:
+                        return f"{round(gb, 2)} GB"
+
+    return "N/A"
+
+_METRIC_NAMESPACE = "Microsoft.Storage/storageAccounts"
+
+_METRICS_QUERY = dict(
+    timespan="PT12H",
+    interval="PT1H",
+    metricnames="UsedCapacity",
+    aggregation="Average",
+    metricnamespace=_METRIC_NAMESPACE
+)
+
+# The same query for the metrics batch API
+_BATCH_METRICS_QUERY = dict(
+    metric_namespace=_METRIC_NAMESPACE,
+    metric_names=["UsedCapacity"],
+    timespan=timedelta(hours=12),
+    granularity=timedelta(hours=1),
+    aggregations=["Average"]
+)
+
+def _get_metric_resource_id(metric_id):
+    """Get the lower-cased resource ID a metric ID belongs to."""
+    return metric_id.lower().split("/providers/microsoft.insights/metrics")[0]
+
+async def collect_storage_usage(accounts, concurrency=None):
+    """
+    Fetch UsedCapacity for many storage accounts concurrently.
+
+    Accounts with a known location are grouped by subscription and region,
+    and each group is queried with the Azure Monitor metrics batch API, up
+    to MAX_BATCH_RESOURCES accounts per request. Accounts without a
+    location, missing from a batch response, or in a batch that failed are
+    queried one by one.
+
+    Requests run on the shared async Azure SDK clients of the running event
+    loop, at most `concurrency` at a time (default:
+    STORAGE_USAGE_CONCURRENCY environment variable). A failed request does
+    not fail the others: its account is returned with used_capacity "N/A"
+    and an error message.
+
+    Args:
+        accounts: Iterable of (subscription_id, resource_group, account_name)
+            or (subscription_id, resource_group, account_name, location)
+        concurrency: Maximum number of requests in flight
+
+    Returns:
+        List of usage dicts in the order of `accounts`
+    """
+    if concurrency is None:
+        concurrency = int(os.getenv("STORAGE_USAGE_CONCURRENCY",
+                                    DEFAULT_USAGE_CONCURRENCY))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    clients = get_async_clients()
+
+    usages = []
+    groups = {}
+    singles = []
+    for subscription_id, resource_group, account_name, *location in accounts:
+        usage = {
+            'storage_account': account_name,
+            'resource_group': resource_group,
+            'subscription_id': subscription_id,
+            'used_capacity': "N/A"
+        }
+        usages.append(usage)
+        region = location[0].lower() if location and location[0] else None
+        if region:
+            groups.setdefault((subscription_id, region), []).append(usage)
+        else:
+            singles.append(usage)
+
+    def resource_id_of(usage):
+        return _get_resource_id(usage['subscription_id'],
+                                usage['resource_group'],
+                                usage['storage_account'])
+
+    async def fetch_one(usage):
+        monitor_client = clients.get_monitor_client(usage['subscription_id'])
+        try:
+            async with semaphore:
+                metrics_data = await monitor_client.metrics.list(
+                    resource_id_of(usage), **_METRICS_QUERY)
+            usage['used_capacity'] = _format_used_capacity(metrics_data.value)
+        except Exception as e:
+            usage['error'] = str(e)
+
+    async def fetch_batch(region, batch):
+        metrics_client = clients.get_metrics_client(region)
+        try:
+            async with semaphore:
+                results = await metrics_client.query_resources(
+                    resource_ids=[resource_id_of(usage) for usage in batch],
+                    **_BATCH_METRICS_QUERY)
+        except Exception as e:
+            # Each account of the batch is then read on its own
+            print(f"Storage usage batch query for {len(batch)} accounts in "
+                  f"{region} failed: {str(e)}", file=sys.stderr)
+            results = []
+
+        metrics_by_resource = {}
+        for result in results:
+            for metric in result.metrics:
+                metrics_by_resource[_get_metric_resource_id(metric.id)] = (
+                    result.metrics)
+
+        missing = []
+        for usage in batch:
+            metrics = metrics_by_resource.get(resource_id_of(usage).lower())
+            if metrics is None:
+                missing.append(usage)
+            else:
+                usage['used_capacity'] = _format_used_capacity(metrics)
+        await asyncio.gather(*(fetch_one(usage) for usage in missing))
+
+    tasks = [fetch_one(usage) for usage in singles]
+    for (subscription_id, region), group in groups.items():
+        for start in range(0, len(group), MAX_BATCH_RESOURCES):
+            tasks.append(
+                fetch_batch(region, group[start:start + MAX_BATCH_RESOURCES]))
+    await asyncio.gather(*tasks)
+    return usages
@@ -0,0 +1,237 @@
+"""
+Cached snapshot of storage account usage.
+
+UsedCapacity is an hourly metric, so tools answer from a snapshot that a
+background task refreshes every STORAGE_USAGE_REFRESH_INTERVAL seconds
+(default: 3600). The first refresh reads every account at once; later
+refreshes are staggered: accounts are split into slices of up to
+MAX_BATCH_RESOURCES accounts of the same subscription and region, and the
+slices are refreshed one after another, spread evenly over the interval.
+
+When no refresher runs (STORAGE_USAGE_REFRESH_INTERVAL=0), reads refresh
+usage older than STORAGE_USAGE_MAX_AGE seconds (default: 3600) first.
+"""
+import asyncio
+import os
+import sys
+import time
+from utils.azure_storage_usage import (
+    MAX_BATCH_RESOURCES,
+    collect_storage_usage,
+    get_storage_accounts,
+    parse_account_id,
+)
+
+# Default number of seconds between refreshes of an account's usage
+DEFAULT_REFRESH_INTERVAL = 3600
+
+def get_refresh_interval():
+    """Get the refresh interval in seconds; 0 disables the refresher."""
+    return float(os.getenv("STORAGE_USAGE_REFRESH_INTERVAL",
+                           DEFAULT_REFRESH_INTERVAL))
+
+def get_max_age():
+    """Get the age in seconds after which reads refresh usage themselves."""
+    return float(os.getenv("STORAGE_USAGE_MAX_AGE", DEFAULT_REFRESH_INTERVAL))
+
+def _account_key(resource_group, account_name):
+    return resource_group.lower(), account_name.lower()
+
+class UsageSnapshot:
+    """Latest known usage of the storage accounts of a subscription."""
+
+    def __init__(self, subscription_id):
+        self.subscription_id = subscription_id
+        self.usages = {}
+        self.refreshed_at = None
+        self.refresher_running = False
+        self.max_age = get_max_age()
+        self._known = None
+        self._listed_at = None
+        self._lock = asyncio.Lock()
+
+    def _store(self, usages, known=None):
+        """
+        Store fresh usages, keeping the previous value of failed accounts.
+
+        Args:
+            usages: Usage dicts returned by collect_storage_usage
+            known: Optional keys of all existing accounts; others are dropped
+        """
+        now = time.time()
+        if known is not None:
+            self.usages = {key: usage for key, usage in self.usages.items()
+                           if key in known}
+        for usage in usages:
+            key = _account_key(usage['resource_group'],
+                               usage['storage_account'])
+            if known is not None and key not in known:
+                continue
+            previous = self.usages.get(key)
+            if 'error' in usage and previous and 'error' not in previous:
+                # An older value is more useful than none; its age shows it
+                continue
+            self.usages[key] = {**usage, 'updated_at': now}
+
+    @staticmethod
+    def _with_age(usage, now):
+        result = {key: value for key, value in usage.items()
+                  if key != 'updated_at'}
+        result['age_seconds'] = round(now - usage['updated_at'])
+        return result
+
+    def _is_stale(self, updated_at):
+        """Check whether a read must refresh usage updated at a time."""
+        return updated_at is None or (
+            not self.refresher_running and
+            time.time() - updated_at > self.max_age)
+
+    async def _list_accounts(self):
+        """
+        List the subscription's accounts as collect_storage_usage input.
+
+        The keys of the listed accounts are kept as the known accounts
+        unless a listing that started later has already replaced them.
+        """
+        started = time.time()
+        accounts = await asyncio.to_thread(get_storage_accounts,
+                                           self.subscription_id)
+        accounts = [(*parse_account_id(account.id), account.name,
+                     account.location) for account in accounts]
+        if self._listed_at is None or self._listed_at < started:
+            self._known = {_account_key(account[1], account[2])
+                           for account in accounts}
+            self._listed_at = started
+        return accounts
+
+    async def refresh(self, since=None):
+        """
+        Re-read the usage of every account of the subscription.
+
+        Args:
+            since: Optional time; the refresh is skipped if another one
+                completed after it, e.g. while this call waited for the lock
+        """
+        async with self._lock:
+            if since is not None and self.refreshed_at is not None and \
+                    self.refreshed_at >= since:
+                return
+            accounts = await self._list_accounts()
+            usages = await collect_storage_usage(accounts)
+            self._store(usages, known=self._known)
+            self.refreshed_at = time.time()
+
+    async def refresh_account(self, resource_group, account_name):
+        """Re-read the usage of one account and return it."""
+        [usage] = await collect_storage_usage(
+            [(self.subscription_id, resource_group, account_name)])
+        if 'error' not in usage:
+            self._store([usage])
+        return {**usage, 'age_seconds': 0}
+
+    async def refresh_staggered(self, interval):
+        """
+        Refresh all accounts in slices spread over the interval.
+
+        Each slice is read and stored under the lock, and pruned against the
+        latest account listing, which a forced refresh may have renewed
+        since this pass started.
+        """
+        accounts = await self._list_accounts()
+        groups = {}
+        for account in accounts:
+            groups.setdefault((account[0], str(account[3]).lower()),
+                              []).append(account)
+        slices = [group[start:start + MAX_BATCH_RESOURCES]
+                  for group in groups.values()
+                  for start in range(0, len(group), MAX_BATCH_RESOURCES)]
+
+        for index, accounts_slice in enumerate(slices):
+            if index:
+                await asyncio.sleep(interval / len(slices))
+            async with self._lock:
+                self._store(await collect_storage_usage(accounts_slice),
+                            known=self._known)
+        self.refreshed_at = time.time()
+
+    async def get_all(self, force_refresh=False):
+        """
+        Get the usage of every account, refreshing first if needed.
+
+        The snapshot is refreshed first when it is empty, or when it is
+        older than max_age and no refresher keeps it fresh.
+
+        Args:
+            force_refresh: Re-read every account even if a snapshot exists
+
+        Returns:
+            Tuple of (usage dicts with their age, age of the oldest entry
+            in seconds)
+        """
+        if force_refresh or self._is_stale(self.refreshed_at):
+            await self.refresh(since=time.time())
+        now = time.time()
+        usages = [self._with_age(usage, now)
+                  for usage in self.usages.values()]
+        oldest = max((usage['age_seconds'] for usage in usages), default=0)
+        return usages, oldest
+
+    async def get_account(self, resource_group, account_name,
+                          force_refresh=False):
+        """
+        Get the usage of one account, reading it live if not in the snapshot.
+
+        The account is also read live when its usage is older than max_age
+        and no refresher keeps it fresh.
+
+        Args:
+            resource_group: The name of the resource group
+            account_name: The name of the storage account
+            force_refresh: Re-read the account even if it is in the snapshot
+
+        Returns:
+            Usage dict with its age
+        """
+        usage = self.usages.get(_account_key(resource_group, account_name))
+        if force_refresh or self._is_stale(usage and usage['updated_at']):
+            return await self.refresh_account(resource_group, account_name)
+        return self._with_age(usage, time.time())
+
+_snapshots = {}
+
+def get_snapshot(subscription_id):
+    """Get the usage snapshot of a subscription."""
+    if subscription_id not in _snapshots:
+        _snapshots[subscription_id] = UsageSnapshot(subscription_id)
+    return _snapshots[subscription_id]
+
+async def run_refresher(subscription_id, interval):
+    """
+    Keep a subscription's snapshot fresh until cancelled.
+
+    The first pass reads every account at once so tools have data quickly;
+    later passes are staggered over the interval. A failed pass is retried
+    after the interval.
+    """
+    snapshot = get_snapshot(subscription_id)
+    snapshot.refresher_running = True
+    first = True
+    try:
+        while True:
+            started = time.monotonic()
+            try:
+                if first:
+                    # Skipped if a tool call already filled the snapshot
+                    await snapshot.refresh(since=0)
+                else:
+                    await snapshot.refresh_staggered(interval)
+                first = False
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Storage usage refresh failed: {str(e)}",
+                      file=sys.stderr)
+            await asyncio.sleep(
+                max(0, interval - (time.monotonic() - started)))
+    finally:
+        snapshot.refresher_running = False
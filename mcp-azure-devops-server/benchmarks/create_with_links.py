@@ -0,0 +1,177 @@
+"""
+Benchmark creating work items with a parent link.
+
+Compares the previous two-request path (create the work item, then add the
+parent link with update_work_item) with the single-request path used by
+_create_work_item_impl, against a local mock Azure DevOps server that adds a
+fixed latency to every request.
+
+Usage:
+    python benchmarks/create_with_links.py [--items N] [--latency-ms MS]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from msrest.authentication import BasicAuthentication
+
+from mcp_azure_devops.features.work_items.tools.create import (
+    PARENT_LINK_TYPE,
+    _build_field_document,
+    _build_link_document,
+    _create_work_item_impl,
+)
+
+# Resource locations returned by the mock for OPTIONS /_apis
+RESOURCE_LOCATIONS = [
+    {
+        "id": "62d3d110-0047-428c-ad3c-4fe872c91c74",
+        "area": "wit",
+        "resourceName": "workItems",
+        "routeTemplate": "{project}/_apis/{area}/workitems/${type}",
+        "resourceVersion": 3,
+        "minVersion": "1.0",
+        "maxVersion": "7.1",
+        "releasedVersion": "7.1",
+    },
+    {
+        "id": "72c7ddf8-2cdc-4f60-90cd-ab71c14a399b",
+        "area": "wit",
+        "resourceName": "workItems",
+        "routeTemplate": "{project}/_apis/{area}/workitems/{id}",
+        "resourceVersion": 3,
+        "minVersion": "1.0",
+        "maxVersion": "7.1",
+        "releasedVersion": "7.1",
+    },
+]
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Minimal work item create/update endpoint with simulated latency."""
+
+    latency = 0.0
+    lock = threading.Lock()
+    next_id = 1
+    request_count = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, body: dict) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_patch(self) -> list:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"[]")
+
+    def _work_item(self, item_id: int, rev: int, patch: list) -> dict:
+        fields = {op["path"][len("/fields/"):]: op["value"]
+                  for op in patch if op["path"].startswith("/fields/")}
+        relations = [op["value"] for op in patch
+                     if op["path"] == "/relations/-"]
+        return {"id": item_id, "rev": rev, "fields": fields,
+                "relations": relations}
+
+    def do_OPTIONS(self):
+        self._reply({"count": len(RESOURCE_LOCATIONS),
+                     "value": RESOURCE_LOCATIONS})
+
+    def do_POST(self):
+        patch = self._read_patch()
+        time.sleep(self.latency)
+        with self.lock:
+            MockHandler.request_count += 1
+            item_id = MockHandler.next_id
+            MockHandler.next_id += 1
+        self._reply(self._work_item(item_id, 1, patch))
+
+    def do_PATCH(self):
+        patch = self._read_patch()
+        time.sleep(self.latency)
+        with self.lock:
+            MockHandler.request_count += 1
+        item_id = int(self.path.split("?")[0].rstrip("/").split("/")[-1])
+        self._reply(self._work_item(item_id, 2, patch))
+
+
+def create_then_link(wit_client, project: str, fields: dict,
+                     parent_id: int, org_url: str) -> None:
+    """Previous behaviour: create the work item, then add the parent."""
+    work_item = wit_client.create_work_item(
+        document=_build_field_document(fields),
+        project=project,
+        type="Task"
+    )
+    wit_client.update_work_item(
+        document=_build_link_document(parent_id, PARENT_LINK_TYPE, org_url),
+        id=work_item.id,
+        project=project
+    )
+
+
+def run(label: str, items: int, create) -> None:
+    """Create the given number of items and print timing statistics."""
+    MockHandler.request_count = 0
+    timings = []
+    for index in range(items):
+        start = time.perf_counter()
+        create({"System.Title": f"{label} {index}"})
+        timings.append(time.perf_counter() - start)
+
+    timings.sort()
+    total = sum(timings)
+    print(f"| {label} | {MockHandler.request_count} | {total * 1000:.0f} | "
+          f"{total / items * 1000:.1f} | "
+          f"{timings[int(len(timings) * 0.95) - 1] * 1000:.1f} |")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--items", type=int, default=50,
+                        help="Work items to create per path")
+    parser.add_argument("--latency-ms", type=float, default=25,
+                        help="Simulated latency per request")
+    args = parser.parse_args()
+
+    MockHandler.latency = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    org_url = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ["AZURE_DEVOPS_ORGANIZATION_URL"] = org_url
+    wit_client = WorkItemTrackingClient(
+        base_url=org_url, creds=BasicAuthentication("", "benchmark"))
+
+    # Warm up the resource location lookup and the HTTP session
+    _create_work_item_impl({"System.Title": "warm-up"}, "Bench", "Task",
+                           wit_client, parent_id=1)
+
+    print(f"{args.items} work items with a parent link, "
+          f"{args.latency_ms:g} ms simulated latency per request\n")
+    print("| Path | Requests | Total (ms) | Mean (ms) | p95 (ms) |")
+    print("| ---- | ---- | ---- | ---- | ---- |")
+    run("create + update", args.items,
+        lambda fields: create_then_link(wit_client, "Bench", fields, 1,
+                                        org_url))
+    run("single create", args.items,
+        lambda fields: _create_work_item_impl(fields, "Bench", "Task",
+                                              wit_client, parent_id=1))
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
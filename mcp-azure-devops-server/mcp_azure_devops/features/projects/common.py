@@ -5,7 +5,7 @@ This module provides shared functionality used by both tools and resources.
 """
 from azure.devops.v7_1.core import CoreClient
 
-from mcp_azure_devops.utils.azure_client import get_connection
+from mcp_azure_devops.utils.azure_client import get_client, get_connection
 
 
 class AzureDevOpsClientError(Exception):
@@ -32,8 +32,8 @@ def get_core_client() -> CoreClient:
             "environment variables."
         )
     
-    # Get the core client
-    core_client = connection.clients.get_core_client()
+    # Get the pooled core client
+    core_client = get_client("get_core_client")
     
     if core_client is None:
         raise AzureDevOpsClientError("Failed to get core client.")
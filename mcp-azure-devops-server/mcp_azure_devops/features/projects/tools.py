@@ -12,6 +12,10 @@ from mcp_azure_devops.features.projects.common import (
     AzureDevOpsClientError,
     get_core_client,
 )
+from mcp_azure_devops.utils.concurrency import async_tool, fetch_all_pages
+
+# Number of projects requested per page in all-pages mode
+PROJECTS_PAGE_SIZE = 100
 
 
 def _format_project(project: TeamProjectReference) -> str:
@@ -51,10 +55,31 @@ def _format_project(project: TeamProjectReference) -> str:
     return "\n".join(formatted_info)
 
 
+def _format_projects_compact(projects: list[TeamProjectReference]) -> str:
+    """
+    Format projects as a table with one row per project.
+    
+    Args:
+        projects: Projects to format
+        
+    Returns:
+        Markdown table of project names, IDs, states and visibility
+    """
+    result = [f"# Projects ({len(projects)})",
+              "| Name | ID | State | Visibility |",
+              "| ---- | ---- | ---- | ---- |"]
+    for project in projects:
+        result.append(f"| {project.name} | {project.id} | "
+                      f"{project.state or ''} | {project.visibility or ''} |")
+    return "\n".join(result)
+
+
 def _get_projects_impl(
     core_client: CoreClient,
     state_filter: Optional[str] = None,
-    top: Optional[int] = None
+    top: Optional[int] = None,
+    all_pages: bool = False,
+    compact: bool = False
 ) -> str:
     """
     Implementation of projects retrieval.
@@ -63,16 +88,32 @@ def _get_projects_impl(
         core_client: Core client
         state_filter: Filter on team projects in a specific state
         top: Maximum number of projects to return
+        all_pages: Whether to page through all projects instead of making
+            a single request
+        compact: Whether to return one table row per project
             
     Returns:
         Formatted string containing project information
     """
     try:
-        projects = core_client.get_projects(state_filter=state_filter, top=top)
+        if all_pages:
+            # The SDK drops the continuation token header, but the token is
+            # only the number of projects read so far, so skip is equivalent
+            projects = fetch_all_pages(
+                lambda skip, page_top: core_client.get_projects(
+                    state_filter=state_filter, top=page_top, skip=skip),
+                PROJECTS_PAGE_SIZE, max_items=top,
+                key=lambda project: project.id)
+        else:
+            projects = core_client.get_projects(state_filter=state_filter,
+                                                top=top)
         
         if not projects:
             return "No projects found."
         
+        if compact:
+            return _format_projects_compact(projects)
+        
         formatted_projects = []
         for project in projects:
             formatted_projects.append(_format_project(project))
@@ -92,9 +133,12 @@ def register_tools(mcp) -> None:
     """
     
     @mcp.tool()
+    @async_tool
     def get_projects(
         state_filter: Optional[str] = None,
-        top: Optional[int] = None
+        top: Optional[int] = None,
+        all_pages: bool = False,
+        compact: bool = False
     ) -> str:
         """
         Retrieves all projects accessible to the authenticated user 
@@ -106,10 +150,18 @@ def register_tools(mcp) -> None:
         - Check project states and visibility settings
         - Locate specific projects by name
         
+        IMPORTANT: A single request returns only the first page of projects
+        in large organizations. Use all_pages=True with compact=True to list
+        every project in one call.
+        
         Args:
             state_filter: Filter on team projects in a specific state 
                 (e.g., "WellFormed", "Deleting")
             top: Maximum number of projects to return
+            all_pages: Whether to retrieve every page of projects, fetching
+                pages concurrently (default: False)
+            compact: Whether to return a table with one row per project
+                instead of a section per project (default: False)
                 
         Returns:
             Formatted string containing project information including names,
@@ -118,6 +170,7 @@ def register_tools(mcp) -> None:
         """
         try:
             core_client = get_core_client()
-            return _get_projects_impl(core_client, state_filter, top)
+            return _get_projects_impl(core_client, state_filter, top,
+                                      all_pages, compact)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
@@ -3,10 +3,28 @@ Common utilities for Azure DevOps teams features.
 
 This module provides shared functionality used by both tools and resources.
 """
+import os
+from typing import Any, Callable
+
 from azure.devops.v7_1.core import CoreClient
 from azure.devops.v7_1.work import WorkClient
 
-from mcp_azure_devops.utils.azure_client import get_connection
+from mcp_azure_devops.utils.azure_client import (
+    get_client,
+    get_connection,
+    get_credentials,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+
+# Teams, members, iterations and area paths rarely change, so the data
+# returned by the API is cached and refreshed in the background shortly
+# before it expires
+team_cache = TTLCache(
+    ttl=float(os.environ.get("AZURE_DEVOPS_TEAM_CACHE_TTL", 3600)),
+    max_entries=int(os.environ.get("AZURE_DEVOPS_TEAM_CACHE_SIZE", 2048)),
+    refresh_ahead=float(
+        os.environ.get("AZURE_DEVOPS_TEAM_CACHE_REFRESH_AHEAD", 600)),
+)
 
 
 class AzureDevOpsClientError(Exception):
@@ -33,8 +51,8 @@ def get_core_client() -> CoreClient:
             "environment variables."
         )
     
-    # Get the core client
-    core_client = connection.clients.get_core_client()
+    # Get the pooled core client
+    core_client = get_client("get_core_client")
     
     if core_client is None:
         raise AzureDevOpsClientError("Failed to get core client.")
@@ -61,10 +79,34 @@ def get_work_client() -> WorkClient:
             "environment variables."
         )
     
-    # Get the work client
-    work_client = connection.clients.get_work_client()
+    # Get the pooled work client
+    work_client = get_client("get_work_client")
     
     if work_client is None:
         raise AzureDevOpsClientError("Failed to get work client.")
     
     return work_client
+
+
+def get_cached_team_data(kind: str, key_parts: list,
+                         factory: Callable[[], Any]) -> Any:
+    """
+    Get team data from the cache, retrieving it on a miss.
+    
+    The cached data is shared by every caller and must not be modified.
+    Exceptions raised by the factory are passed on and nothing is cached.
+    
+    Args:
+        kind: Kind of team data (e.g. "team_members"), used as the key
+            prefix so a whole kind can be invalidated at once
+        key_parts: Values identifying the request (project, team, ...)
+        factory: Function retrieving the data from the API on a miss
+        
+    Returns:
+        Team data as returned by the API
+    """
+    _, organization_url = get_credentials()
+    key = "|".join([kind, (organization_url or "").rstrip("/").lower()] +
+                   [str(part if part is not None else "").lower()
+                    for part in key_parts])
+    return team_cache.get_or_set(key, factory)
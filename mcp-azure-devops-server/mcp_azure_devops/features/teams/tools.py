@@ -3,7 +3,9 @@ Team tools for Azure DevOps.
 
 This module provides MCP tools for working with Azure DevOps teams.
 """
-from typing import Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 
 from azure.devops.v7_1.core import CoreClient
 from azure.devops.v7_1.core.models import WebApiTeam
@@ -11,9 +13,22 @@ from azure.devops.v7_1.work.models import TeamContext
 
 from mcp_azure_devops.features.teams.common import (
     AzureDevOpsClientError,
+    get_cached_team_data,
     get_core_client,
     get_work_client,
+    team_cache,
 )
+from mcp_azure_devops.utils.concurrency import async_tool, fetch_all_pages
+
+# Kinds of team data stored in the team cache
+TEAM_DATA_KINDS = ["team_members", "team_area_paths", "team_iterations"]
+
+# Number of teams requested per page in all-pages mode
+TEAMS_PAGE_SIZE = 100
+
+# Default number of team lookups run concurrently by the cache warm-up and
+# get_all_team_details
+DEFAULT_TEAM_WORKERS = 8
 
 
 def _format_team(team: WebApiTeam) -> str:
@@ -158,12 +173,67 @@ def _format_team_iteration(iteration) -> str:
     return "\n".join(formatted_info)
 
 
+def _format_teams_compact(teams: list[WebApiTeam]) -> str:
+    """
+    Format teams as a table with one row per team.
+    
+    Args:
+        teams: Teams to format
+        
+    Returns:
+        Markdown table of team names, projects and IDs
+    """
+    result = [f"# Teams ({len(teams)})",
+              "| Team | Project | ID |",
+              "| ---- | ---- | ---- |"]
+    for team in teams:
+        result.append(f"| {team.name} | {team.project_name or ''} | "
+                      f"{team.id} |")
+    return "\n".join(result)
+
+
+def _list_all_teams(
+    core_client: CoreClient,
+    user_is_member_of: Optional[bool] = None,
+    top: Optional[int] = None,
+    skip: Optional[int] = None,
+    project: Optional[str] = None
+) -> list[WebApiTeam]:
+    """
+    Retrieve every page of teams, fetching pages concurrently.
+    
+    Args:
+        core_client: Core client
+        user_is_member_of: If true, only list teams the user is a member of
+        top: Optional maximum number of teams to return
+        skip: Number of teams to skip
+        project: Optional project name or ID to list the teams of; all
+            teams of the organization are listed when omitted
+        
+    Returns:
+        List of teams
+    """
+    def fetch_page(page_skip: int, page_top: int) -> list[WebApiTeam]:
+        if project:
+            return core_client.get_teams(
+                project_id=project, mine=user_is_member_of, top=page_top,
+                skip=(skip or 0) + page_skip)
+        return core_client.get_all_teams(
+            mine=user_is_member_of, top=page_top,
+            skip=(skip or 0) + page_skip)
+    
+    return fetch_all_pages(fetch_page, TEAMS_PAGE_SIZE, max_items=top,
+                           key=lambda team: team.id)
+
+
 def _get_all_teams_impl(
     core_client: CoreClient,
     user_is_member_of: Optional[bool] = None,
     top: Optional[int] = None,
     skip: Optional[int] = None,
-    expand_identity: Optional[bool] = None
+    expand_identity: Optional[bool] = None,
+    all_pages: bool = False,
+    compact: bool = False
 ) -> str:
     """
     Implementation of teams retrieval.
@@ -175,22 +245,31 @@ def _get_all_teams_impl(
                           access.
         top: Maximum number of teams to return
         skip: Number of teams to skip
+        all_pages: Whether to page through all teams instead of making a
+                   single request
+        compact: Whether to return one table row per team
             
     Returns:
         Formatted string containing team information
     """
     try:
-        # Call the SDK function - note we're mapping user_is_member_of to mine
-        # param
-        teams = core_client.get_all_teams(
-            mine=user_is_member_of,
-            top=top,
-            skip=skip
-        )
+        if all_pages:
+            teams = _list_all_teams(core_client, user_is_member_of, top, skip)
+        else:
+            # Call the SDK function - note we're mapping user_is_member_of to
+            # mine param
+            teams = core_client.get_all_teams(
+                mine=user_is_member_of,
+                top=top,
+                skip=skip
+            )
         
         if not teams:
             return "No teams found."
         
+        if compact:
+            return _format_teams_compact(teams)
+        
         formatted_teams = []
         for team in teams:
             formatted_teams.append(_format_team(team))
@@ -201,8 +280,36 @@ def _get_all_teams_impl(
         return f"Error retrieving teams: {str(e)}"
 
 
+def _get_team_members(project_id: str, team_id: str,
+                      top: Optional[int] = None,
+                      skip: Optional[int] = None) -> list:
+    """Get team members through the team cache."""
+    return get_cached_team_data(
+        "team_members", [project_id, team_id, top, skip],
+        lambda: get_core_client().get_team_members_with_extended_properties(
+            project_id=project_id, team_id=team_id, top=top, skip=skip))
+
+
+def _get_team_area_paths(project_name_or_id: str, team_name_or_id: str):
+    """Get team field values (area paths) through the team cache."""
+    return get_cached_team_data(
+        "team_area_paths", [project_name_or_id, team_name_or_id],
+        lambda: get_work_client().get_team_field_values(TeamContext(
+            project=project_name_or_id, team=team_name_or_id)))
+
+
+def _get_team_iterations(project_name_or_id: str, team_name_or_id: str,
+                         current: Optional[bool] = None) -> list:
+    """Get team iterations through the team cache."""
+    return get_cached_team_data(
+        "team_iterations", [project_name_or_id, team_name_or_id, current],
+        lambda: get_work_client().get_team_iterations(
+            team_context=TeamContext(project=project_name_or_id,
+                                     team=team_name_or_id),
+            timeframe="Current" if current else None))
+
+
 def _get_team_members_impl(
-    core_client: CoreClient,
     project_id: str,
     team_id: str,
     top: Optional[int] = None,
@@ -212,7 +319,6 @@ def _get_team_members_impl(
     Implementation of team members retrieval.
     
     Args:
-        core_client: Core client
         project_id: The name or ID (GUID) of the team project the team 
                     belongs to
         team_id: The name or ID (GUID) of the team
@@ -223,29 +329,24 @@ def _get_team_members_impl(
         Formatted string containing team members information
     """
     try:
-        team_members = core_client.get_team_members_with_extended_properties(
-            project_id=project_id,
-            team_id=team_id,
-            top=top,
-            skip=skip
-        )
-        
-        if not team_members:
-            return (f"No members found for team {team_id} in "
-                    f"project {project_id}.")
-        
-        formatted_members = []
-        for member in team_members:
-            formatted_members.append(_format_team_member(member))
-        
-        return "\n\n".join(formatted_members)
-            
+        team_members = _get_team_members(project_id, team_id, top, skip)
+    except AzureDevOpsClientError:
+        raise
     except Exception as e:
         return f"Error retrieving team members: {str(e)}"
+    
+    if not team_members:
+        return (f"No members found for team {team_id} in "
+                f"project {project_id}.")
+    
+    formatted_members = []
+    for member in team_members:
+        formatted_members.append(_format_team_member(member))
+    
+    return "\n\n".join(formatted_members)
 
 
 def _get_team_area_paths_impl(
-    work_client,
     project_name_or_id: str,
     team_name_or_id: str
 ) -> str:
@@ -253,7 +354,6 @@ def _get_team_area_paths_impl(
     Implementation of team area paths retrieval.
     
     Args:
-        work_client: Work client
         project_name_or_id: The name or ID of the team project
         team_name_or_id: The name or ID of the team
             
@@ -261,27 +361,21 @@ def _get_team_area_paths_impl(
         Formatted string containing team area path information
     """
     try:
-        # Create a TeamContext object
-        team_context = TeamContext(
-            project=project_name_or_id,
-            team=team_name_or_id
-        )
-        
-        # Get the team field values
-        team_field_values = work_client.get_team_field_values(team_context)
-        
-        if not team_field_values:
-            return (f"No area paths found for team {team_name_or_id} "
-                    f"in project {project_name_or_id}.")
-        
-        return _format_team_area_path(team_field_values)
-            
+        team_field_values = _get_team_area_paths(project_name_or_id,
+                                                 team_name_or_id)
+    except AzureDevOpsClientError:
+        raise
     except Exception as e:
         return f"Error retrieving team area paths: {str(e)}"
+    
+    if not team_field_values:
+        return (f"No area paths found for team {team_name_or_id} "
+                f"in project {project_name_or_id}.")
+    
+    return _format_team_area_path(team_field_values)
 
 
 def _get_team_iterations_impl(
-    work_client,
     project_name_or_id: str,
     team_name_or_id: str,
     current: Optional[bool] = None
@@ -290,7 +384,6 @@ def _get_team_iterations_impl(
     Implementation of team iterations retrieval.
     
     Args:
-        work_client: Work client
         project_name_or_id: The name or ID of the team project
         team_name_or_id: The name or ID of the team
         current: If True, return only the current iteration
@@ -299,33 +392,212 @@ def _get_team_iterations_impl(
         Formatted string containing team iteration information
     """
     try:
-        # Create a TeamContext object
-        team_context = TeamContext(
-            project=project_name_or_id,
-            team=team_name_or_id
-        )
-        
-        # Set timeframe parameter if current is True
-        timeframe = "Current" if current else None
-        
-        # Get the team iterations
-        team_iterations = work_client.get_team_iterations(
-            team_context=team_context,
-            timeframe=timeframe
-        )
-        
-        if not team_iterations:
-            return (f"No iterations found for team {team_name_or_id} "
-                    f"in project {project_name_or_id}.")
-        
-        formatted_iterations = []
-        for iteration in team_iterations:
-            formatted_iterations.append(_format_team_iteration(iteration))
-        
-        return "\n\n".join(formatted_iterations)
-            
+        team_iterations = _get_team_iterations(project_name_or_id,
+                                               team_name_or_id, current)
+    except AzureDevOpsClientError:
+        raise
     except Exception as e:
         return f"Error retrieving team iterations: {str(e)}"
+    
+    if not team_iterations:
+        return (f"No iterations found for team {team_name_or_id} "
+                f"in project {project_name_or_id}.")
+    
+    formatted_iterations = []
+    for iteration in team_iterations:
+        formatted_iterations.append(_format_team_iteration(iteration))
+    
+    return "\n\n".join(formatted_iterations)
+
+
+def _get_team_workers() -> int:
+    """Get the number of team lookups to run concurrently."""
+    return int(os.environ.get("AZURE_DEVOPS_TEAM_WORKERS",
+                              DEFAULT_TEAM_WORKERS))
+
+
+def _format_date(value) -> str:
+    """Format an iteration date without its time."""
+    return str(value).split()[0].split("T")[0] if value else ""
+
+
+def _format_team_details(team: WebApiTeam, members, area_paths,
+                         iterations) -> str:
+    """
+    Format a team's members, area paths and iterations compactly.
+    
+    Each lookup result is the team data stored in the team cache, or the
+    exception raised while retrieving it.
+    
+    Args:
+        team: Team to format
+        members: Team members
+        area_paths: Team field values holding the area paths
+        iterations: Team iterations
+        
+    Returns:
+        Markdown section with one line per kind of detail
+    """
+    result = [f"## {team.name} ({team.project_name})"]
+    
+    if isinstance(members, Exception):
+        result.append(f"Members: Error: {str(members)}")
+    else:
+        names = []
+        for member in members or []:
+            identity = member.identity
+            name = ((identity.display_name or identity.id) if identity
+                    else "Unknown Member")
+            names.append(f"{name} (admin)" if member.is_team_admin
+                         else name)
+        result.append(f"Members ({len(names)}): {', '.join(names) or '-'}")
+    
+    if isinstance(area_paths, Exception):
+        result.append(f"Area Paths: Error: {str(area_paths)}")
+    elif area_paths:
+        paths = [f"{area_path.value} (incl. sub-areas)"
+                 if area_path.include_children else area_path.value
+                 for area_path in area_paths.values or []]
+        result.append(f"Area Paths (default {area_paths.default_value}): "
+                      f"{', '.join(paths) or '-'}")
+    else:
+        result.append("Area Paths: -")
+    
+    if isinstance(iterations, Exception):
+        result.append(f"Iterations: Error: {str(iterations)}")
+    else:
+        formatted = []
+        for iteration in iterations or []:
+            attributes = iteration.attributes
+            details = []
+            if attributes and attributes.start_date:
+                details.append(f"{_format_date(attributes.start_date)} to "
+                               f"{_format_date(attributes.finish_date)}")
+            if attributes and attributes.time_frame:
+                details.append(attributes.time_frame)
+            formatted.append(f"{iteration.name} ({', '.join(details)})"
+                             if details else iteration.name)
+        result.append(f"Iterations ({len(formatted)}): "
+                      f"{'; '.join(formatted) or '-'}")
+    
+    return "\n".join(result)
+
+
+def _lookup_team_data(lookup, team: WebApiTeam):
+    """Run a cached team data lookup, returning any exception it raises."""
+    try:
+        return lookup(team.project_id, team.id)
+    except Exception as e:
+        return e
+
+
+def _get_all_team_details_impl(
+    core_client: CoreClient,
+    project: Optional[str] = None,
+    user_is_member_of: Optional[bool] = None,
+    max_teams: Optional[int] = None
+) -> str:
+    """
+    Implementation of organization-wide team details retrieval.
+    
+    The teams of the project, or of the whole organization, are listed
+    first. Then the member, area path and iteration lookups of every team
+    run concurrently through the team cache, so cached results are reused
+    and new ones are stored for the single-team tools.
+    
+    Args:
+        core_client: Core client
+        project: Optional project name or ID to limit the teams to
+        user_is_member_of: If true, only include teams the user is a member
+            of
+        max_teams: Optional maximum number of teams to include
+        
+    Returns:
+        Markdown section per team with its members, area paths and
+        iterations
+    """
+    try:
+        teams = _list_all_teams(core_client, user_is_member_of,
+                                project=project)
+    except Exception as e:
+        return f"Error retrieving teams: {str(e)}"
+    
+    if not teams:
+        return "No teams found."
+    truncated = max_teams is not None and len(teams) > max_teams
+    teams = teams[:max_teams] if truncated else teams
+    
+    with ThreadPoolExecutor(max_workers=_get_team_workers()) as executor:
+        futures = [(team, *(executor.submit(_lookup_team_data, lookup, team)
+                            for lookup in (_get_team_members,
+                                           _get_team_area_paths,
+                                           _get_team_iterations)))
+                   for team in teams]
+        sections = [_format_team_details(team, members.result(),
+                                         area_paths.result(),
+                                         iterations.result())
+                    for team, members, area_paths, iterations in futures]
+    
+    result = [f"# Team Details ({len(teams)} teams)", ""]
+    result.append("\n\n".join(sections))
+    if truncated:
+        result.append(f"\nShowing the first {max_teams} teams. Pass project "
+                      f"or a higher max_teams to see more.")
+    return "\n".join(result)
+
+
+def _invalidate_team_cache_impl(kind: Optional[str] = None) -> str:
+    """
+    Implementation of team cache invalidation.
+    
+    Args:
+        kind: Optional kind of team data to invalidate
+        
+    Returns:
+        Message describing how many entries were removed
+    """
+    if kind and kind not in TEAM_DATA_KINDS:
+        return (f"Error: Unknown team data kind '{kind}'. Valid kinds are: "
+                f"{', '.join(TEAM_DATA_KINDS)}")
+    
+    removed = team_cache.invalidate(f"{kind}|" if kind else "")
+    scope = f"'{kind}' " if kind else ""
+    return f"Invalidated {removed} cached {scope}team entries."
+
+
+def warm_up_team_cache(max_workers: Optional[int] = None) -> Dict[str, int]:
+    """
+    Prefetch all teams with their members, iterations and area paths.
+    
+    Teams are listed page by page, then the lookups for every team run
+    concurrently and their results are stored in the team cache, so the
+    first tool calls for any team by project and team ID are served from
+    the cache.
+    
+    Args:
+        max_workers: Number of lookups to run at the same time. Defaults to
+            the AZURE_DEVOPS_TEAM_WORKERS environment variable.
+            
+    Returns:
+        Dictionary with the number of teams found and lookups that failed
+    """
+    if max_workers is None:
+        max_workers = _get_team_workers()
+    
+    teams = _list_all_teams(get_core_client())
+    
+    # By ID, as get_all_teams lists them for the team tools
+    lookups = [(lookup, team) for team in teams
+               for lookup in (_get_team_members, _get_team_area_paths,
+                              _get_team_iterations)]
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        results = list(executor.map(
+            lambda lookup: _lookup_team_data(*lookup), lookups))
+    
+    return {"teams": len(teams),
+            "failed": sum(1 for result in results
+                          if isinstance(result, Exception))}
 
 
 def register_tools(mcp) -> None:
@@ -337,10 +609,13 @@ def register_tools(mcp) -> None:
     """
     
     @mcp.tool()
+    @async_tool
     def get_all_teams(
         user_is_member_of: Optional[bool] = None,
         top: Optional[int] = None,
-        skip: Optional[int] = None
+        skip: Optional[int] = None,
+        all_pages: bool = False,
+        compact: bool = False
     ) -> str:
         """
         Retrieves all teams in the Azure DevOps organization.
@@ -351,12 +626,20 @@ def register_tools(mcp) -> None:
         - Determine which teams exist in the organization
         - Locate specific teams by name
         
+        IMPORTANT: A single request returns only one page of teams in large
+        organizations. Use all_pages=True with compact=True to list every
+        team in one call instead of paging with skip.
+        
         Args:
             user_is_member_of: If true, return only teams where the current 
                 user is a member. Otherwise return all teams the user 
                 has read access to.
             top: Maximum number of teams to return
             skip: Number of teams to skip
+            all_pages: Whether to retrieve every page of teams, fetching
+                pages concurrently (default: False)
+            compact: Whether to return a table with one row per team
+                instead of a section per team (default: False)
                 
         Returns:
             Formatted string containing team information including names,
@@ -369,12 +652,54 @@ def register_tools(mcp) -> None:
                 core_client, 
                 user_is_member_of,
                 top,
-                skip
+                skip,
+                all_pages=all_pages,
+                compact=compact
             )
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
     
     @mcp.tool()
+    @async_tool
+    def get_all_team_details(
+        project: Optional[str] = None,
+        user_is_member_of: Optional[bool] = None,
+        max_teams: Optional[int] = None
+    ) -> str:
+        """
+        Retrieves members, area paths and iterations of every team at once.
+        
+        Use this tool when you need to:
+        - Document the team structure of a project or the organization
+        - Compare area paths and sprint schedules across teams
+        - Find which teams a person belongs to
+        
+        IMPORTANT: All teams are listed and their lookups run concurrently
+        through the same cache as the single-team tools, so this replaces
+        calling get_team_members, get_team_area_paths and
+        get_team_iterations for each team. Output is compact: one line of
+        members, area paths and iterations per team.
+        
+        Args:
+            project: Optional name or ID of a project to limit the teams to
+            user_is_member_of: If true, only include teams where the current
+                user is a member
+            max_teams: Optional maximum number of teams to include
+            
+        Returns:
+            A section per team listing its members (with administrators
+            marked), its default and assigned area paths, and its
+            iterations with dates and time frames
+        """
+        try:
+            core_client = get_core_client()
+            return _get_all_team_details_impl(core_client, project,
+                                              user_is_member_of, max_teams)
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+    
+    @mcp.tool()
+    @async_tool
     def get_team_members(
         project_id: str,
         team_id: str,
@@ -403,18 +728,12 @@ def register_tools(mcp) -> None:
             as markdown with each member clearly separated
         """
         try:
-            core_client = get_core_client()
-            return _get_team_members_impl(
-                core_client,
-                project_id,
-                team_id,
-                top,
-                skip
-            )
+            return _get_team_members_impl(project_id, team_id, top, skip)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
     
     @mcp.tool()
+    @async_tool
     def get_team_area_paths(
         project_name_or_id: str,
         team_name_or_id: str
@@ -442,16 +761,13 @@ def register_tools(mcp) -> None:
             paths that include sub-areas
         """
         try:
-            work_client = get_work_client()
-            return _get_team_area_paths_impl(
-                work_client,
-                project_name_or_id,
-                team_name_or_id
-            )
+            return _get_team_area_paths_impl(project_name_or_id,
+                                             team_name_or_id)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
     
     @mcp.tool()
+    @async_tool
     def get_team_iterations(
         project_name_or_id: str,
         team_name_or_id: str,
@@ -481,12 +797,30 @@ def register_tools(mcp) -> None:
             formatted as markdown
         """
         try:
-            work_client = get_work_client()
-            return _get_team_iterations_impl(
-                work_client,
-                project_name_or_id,
-                team_name_or_id,
-                current
-            )
+            return _get_team_iterations_impl(project_name_or_id,
+                                             team_name_or_id, current)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
+    
+    @mcp.tool()
+    def invalidate_team_cache(kind: Optional[str] = None) -> str:
+        """
+        Clears cached team members, area paths and iterations.
+        
+        Use this tool when you need to:
+        - See a member who was just added to or removed from a team
+        - Pick up new iterations or area path assignments right away
+        
+        IMPORTANT: Team data is cached because it rarely changes, and
+        entries in use are refreshed in the background before they expire.
+        Only invalidate the cache when you know a team has changed.
+        
+        Args:
+            kind: Optional kind of team data to clear. One of
+                "team_members", "team_area_paths" or "team_iterations".
+                Clears everything when omitted.
+                
+        Returns:
+            Message with the number of cache entries removed
+        """
+        return _invalidate_team_cache_impl(kind)
@@ -3,9 +3,40 @@ Common utilities for Azure DevOps work item features.
 
 This module provides shared functionality used by both tools and resources.
 """
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
 from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+from mcp_azure_devops.utils.azure_client import (
+    get_cache_scope,
+    get_client,
+    get_connection,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+
+# Maximum number of IDs accepted by a single get_work_items request
+MAX_BATCH_SIZE = 200
+
+# Default number of batches fetched concurrently
+DEFAULT_MAX_WORKERS = 4
 
-from mcp_azure_devops.utils.azure_client import get_connection
+# Work item types, fields, processes and templates rarely change, so their
+# formatted results are cached for an hour by default
+metadata_cache = TTLCache(
+    ttl=float(os.environ.get("AZURE_DEVOPS_METADATA_CACHE_TTL", 3600)),
+    max_entries=int(os.environ.get("AZURE_DEVOPS_METADATA_CACHE_SIZE", 512)),
+    persist_path=os.environ.get("AZURE_DEVOPS_METADATA_CACHE_FILE"),
+)
+
+# Project of recently seen work items, filled from read, query and create
+# responses so that operations needing the project can skip a lookup
+_project_index = TTLCache(
+    ttl=float(os.environ.get("AZURE_DEVOPS_PROJECT_INDEX_TTL", 86400)),
+    max_entries=int(os.environ.get("AZURE_DEVOPS_PROJECT_INDEX_SIZE", 10000)),
+)
 
 
 class AzureDevOpsClientError(Exception):
@@ -13,6 +44,16 @@ class AzureDevOpsClientError(Exception):
     pass
 
 
+class MetadataFailure(str):
+    """
+    Message describing a failed metadata lookup.
+    
+    Metadata implementations return failures (errors, missing projects,
+    types or processes) as this str subclass so that get_cached_metadata
+    can tell them apart from successful results and never cache them.
+    """
+
+
 def get_work_item_client() -> WorkItemTrackingClient:
     """
     Get the work item tracking client.
@@ -32,11 +73,181 @@ def get_work_item_client() -> WorkItemTrackingClient:
             "environment variables."
         )
     
-    # Get the work item tracking client
-    wit_client = connection.clients.get_work_item_tracking_client()
+    # Get the pooled work item tracking client
+    wit_client = get_client("get_work_item_tracking_client")
     
     if wit_client is None:
         raise AzureDevOpsClientError(
             "Failed to get work item tracking client.")
     
     return wit_client
+
+
+def get_expand_and_fields(
+    fields: Optional[List[str]] = None,
+    relations: bool = True
+) -> Tuple[Optional[str], Optional[List[str]]]:
+    """
+    Work out the expand and fields parameters for a work item request.
+    
+    The REST API rejects requests that combine expand with a field list, so
+    when relations are needed alongside a projection the full field set is
+    fetched and the projection is applied when formatting.
+    
+    Args:
+        fields: Optional list of field reference names to retrieve
+        relations: Whether relations should be included
+        
+    Returns:
+        Tuple of (expand, fields) to pass to the client
+    """
+    if not fields:
+        return ("all" if relations else None), None
+    if relations:
+        return "relations", None
+    return None, list(fields)
+
+
+def _chunk(ids: List[int], size: int) -> List[List[int]]:
+    """Split a list of IDs into chunks of at most size items."""
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+
+def get_work_items_batched(
+    wit_client: WorkItemTrackingClient,
+    ids: List[int],
+    expand: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> Tuple[List[WorkItem], List[str]]:
+    """
+    Retrieve work items in API-sized chunks fetched concurrently.
+    
+    Args:
+        wit_client: Work item tracking client
+        ids: Work item IDs in the order results should be returned
+        expand: Optional expand parameter passed to get_work_items
+        fields: Optional list of fields to retrieve
+        max_workers: Maximum number of chunks fetched at once. Defaults to
+            the AZURE_DEVOPS_MAX_WORKERS environment variable.
+        progress: Optional callback called with (IDs processed, total IDs)
+            as each chunk completes
+            
+    Returns:
+        Tuple of (work items in the order of ids, error messages for chunks
+        that failed)
+    """
+    if max_workers is None:
+        max_workers = int(os.environ.get("AZURE_DEVOPS_MAX_WORKERS",
+                                         DEFAULT_MAX_WORKERS))
+    
+    chunks = _chunk(ids, MAX_BATCH_SIZE)
+    
+    def fetch(chunk: List[int]) -> List[WorkItem]:
+        return wit_client.get_work_items(ids=chunk,
+                                         expand=expand,
+                                         fields=fields,
+                                         error_policy="omit")
+    
+    by_id = {}
+    errors = []
+    with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+        futures = {executor.submit(fetch, chunk): chunk for chunk in chunks}
+        processed = 0
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                for work_item in future.result() or []:
+                    if work_item:  # Skip None values (failed retrievals)
+                        by_id[work_item.id] = work_item
+            except Exception as e:
+                errors.append(
+                    f"Error retrieving work items {chunk[0]}-{chunk[-1]} "
+                    f"({len(chunk)} items): {str(e)}")
+            processed += len(chunk)
+            if progress:
+                progress(processed, len(ids))
+    
+    # Reassemble in the order the IDs were requested
+    work_items = [by_id[item_id] for item_id in ids if item_id in by_id]
+    return work_items, errors
+
+
+def get_cached_metadata(kind: str, key_parts: list,
+                        factory: Callable[[], str]) -> str:
+    """
+    Get a formatted metadata result from the cache, computing it on a miss.
+    
+    Failures (MetadataFailure or error results) are returned but never
+    cached.
+    
+    Args:
+        kind: Kind of metadata (e.g. "work_item_types"), used as the key
+            prefix so a whole kind can be invalidated at once
+        key_parts: Values identifying the request (project, type, ...)
+        factory: Function producing the formatted result on a miss
+        
+    Returns:
+        Formatted metadata string
+    """
+    key = "|".join([kind, get_cache_scope()] +
+                   [str(part or "").lower() for part in key_parts])
+    return metadata_cache.get_or_set(
+        key, factory,
+        cacheable=lambda result: not (isinstance(result, MetadataFailure) or
+                                      result.startswith("Error")))
+
+
+def remember_work_item_projects(work_items: Iterable[WorkItem]) -> None:
+    """
+    Record the project of work items that include System.TeamProject.
+    
+    Args:
+        work_items: Work items from any response
+    """
+    for work_item in work_items:
+        fields = getattr(work_item, "fields", None) or {}
+        project = fields.get("System.TeamProject")
+        if work_item.id and project:
+            _project_index.set(str(work_item.id), project)
+
+
+def get_work_item_projects(
+    wit_client: WorkItemTrackingClient,
+    ids: List[int]
+) -> Dict[int, str]:
+    """
+    Get the project of each work item.
+    
+    Projects of recently seen work items are taken from the index; the rest
+    are looked up with a batched request for System.TeamProject only.
+    
+    Args:
+        wit_client: Work item tracking client
+        ids: Work item IDs
+        
+    Returns:
+        Dictionary mapping work item ID to project name. IDs that could not
+        be retrieved are missing.
+    """
+    projects = {}
+    unknown = []
+    for item_id in ids:
+        project = _project_index.get(str(item_id))
+        if project:
+            projects[item_id] = project
+        else:
+            unknown.append(item_id)
+    
+    if unknown:
+        work_items, _ = get_work_items_batched(
+            wit_client, unknown, fields=["System.TeamProject"])
+        remember_work_item_projects(work_items)
+        for work_item in work_items:
+            project = (work_item.fields or {}).get("System.TeamProject")
+            if project:
+                projects[work_item.id] = project
+    
+    return projects
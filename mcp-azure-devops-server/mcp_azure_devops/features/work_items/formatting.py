@@ -1,41 +1,92 @@
 """
 Formatting utilities for Azure DevOps work items.
 
-This module provides functions to format work items for display.
+This module provides functions to format work items for display. Work
+items can be rendered as verbose markdown, as compact markdown table rows
+or as JSON lines.
 """
+import json
+from typing import Any, Callable, Optional
+
 from azure.devops.v7_1.work_item_tracking.models import WorkItem
 
+# Supported output formats for work item lists
+OUTPUT_FORMATS = ("markdown", "table", "jsonl")
 
-def _format_field_value(field_value) -> str:
+# Longest value shown in a table cell before it is truncated
+_MAX_CELL_LENGTH = 100
+
+
+def _format_none(field_value) -> str:
+    """Format a missing value."""
+    return "None"
+
+
+def _format_dict(field_value: dict) -> str:
+    """Format a dictionary as key-value pairs."""
+    return ", ".join([f"{k}: {v}" for k, v in field_value.items()])
+
+
+def _format_identity_dict(field_value: dict) -> str:
+    """Format a people reference dictionary."""
+    if 'displayName' not in field_value:
+        return _format_dict(field_value)
+    return (f"{field_value.get('displayName')} "
+            f"({field_value.get('uniqueName', '')})")
+
+
+def _format_identity_object(field_value) -> str:
+    """Format an object with display_name and unique_name."""
+    return f"{field_value.display_name} ({field_value.unique_name})"
+
+
+def _format_display_name_object(field_value) -> str:
+    """Format an object with just display_name."""
+    return field_value.display_name
+
+
+def _select_value_formatter(field_value) -> Callable[[Any], str]:
     """
-    Format a field value based on its type.
+    Select the formatter for a field value based on its type.
     
     Args:
-        field_value: The value to format
+        field_value: A sample value of the field
         
     Returns:
-        Formatted string representation of the value
+        Function formatting values of that type
     """
     if field_value is None:
-        return "None"
+        return _format_none
     elif isinstance(field_value, dict):
         # Handle dictionary fields like people references
         if 'displayName' in field_value:
-            return (f"{field_value.get('displayName')} "
-                  f"({field_value.get('uniqueName', '')})")
+            return _format_identity_dict
         else:
             # For other dictionaries, format as key-value pairs
-            return ", ".join([f"{k}: {v}" for k, v in field_value.items()])
-    elif (hasattr(field_value, 'display_name') and 
+            return _format_dict
+    elif (hasattr(field_value, 'display_name') and
           hasattr(field_value, 'unique_name')):
         # Handle objects with display_name and unique_name
-        return f"{field_value.display_name} ({field_value.unique_name})"
+        return _format_identity_object
     elif hasattr(field_value, 'display_name'):
         # Handle objects with just display_name
-        return field_value.display_name
+        return _format_display_name_object
     else:
         # For everything else, use string representation
-        return str(field_value)
+        return str
+
+
+def _format_field_value(field_value) -> str:
+    """
+    Format a field value based on its type.
+    
+    Args:
+        field_value: The value to format
+        
+    Returns:
+        Formatted string representation of the value
+    """
+    return _select_value_formatter(field_value)(field_value)
 
 
 def _format_board_info(fields: dict) -> list[str]:
@@ -89,31 +140,206 @@ def _format_build_info(fields: dict) -> list[str]:
     return build_info
 
 
-def format_work_item(work_item: WorkItem) -> str:
+def _format_table_cell(value: str) -> str:
+    """Make a value safe and short enough for a markdown table cell."""
+    value = value.replace("|", "\\|").replace("\n", " ")
+    if len(value) > _MAX_CELL_LENGTH:
+        value = value[:_MAX_CELL_LENGTH - 3] + "..."
+    return value
+
+
+class WorkItemFormatter:
+    """
+    Format work items in one of the supported output formats.
+    
+    A value formatter is chosen once per field and value shape (its type,
+    and for dictionaries whether they hold a displayName) and reused for
+    every following work item, so large result sets avoid re-inspecting
+    each value.
+    """
+    
+    def __init__(self, output_format: str = "markdown",
+                 fields: Optional[list[str]] = None):
+        """
+        Create a formatter.
+        
+        Args:
+            output_format: One of "markdown", "table" or "jsonl"
+            fields: Optional list of field reference names to include. All
+                fields are included when omitted.
+                
+        Raises:
+            ValueError: If the output format is not supported
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unknown output format '{output_format}'. Valid formats "
+                f"are: {', '.join(OUTPUT_FORMATS)}")
+        self.output_format = output_format
+        self._wanted = ({field_name.lower() for field_name in fields}
+                        if fields else None)
+        self._value_formatters: dict[tuple, Callable[[Any], str]] = {}
+    
+    def _format_value(self, field_name: str, field_value) -> str:
+        """Format a value with the formatter cached for its field and shape."""
+        # Identity references and other dictionaries share a type, so the
+        # key also records whether a dictionary is an identity reference
+        is_identity = (isinstance(field_value, dict) and
+                       "displayName" in field_value)
+        key = (field_name, type(field_value), is_identity)
+        formatter = self._value_formatters.get(key)
+        if formatter is None:
+            formatter = _select_value_formatter(field_value)
+            self._value_formatters[key] = formatter
+        return formatter(field_value)
+    
+    def _fields(self, work_item: WorkItem) -> dict:
+        """Get the work item fields to show."""
+        fields = work_item.fields or {}
+        if self._wanted is None:
+            return fields
+        return {name: value for name, value in fields.items()
+                if name.lower() in self._wanted}
+    
+    def format_markdown(self, work_item: WorkItem) -> str:
+        """
+        Format a work item as verbose markdown.
+        
+        Args:
+            work_item: Work item object to format
+            
+        Returns:
+            String with formatted work item details
+        """
+        fields = self._fields(work_item)
+        details = [f"# Work Item {work_item.id}"]
+        
+        # List all fields alphabetically for consistent output
+        for field_name in sorted(fields.keys()):
+            formatted_value = self._format_value(field_name,
+                                                 fields[field_name])
+            details.append(f"- **{field_name}**: {formatted_value}")
+        
+        # Add related items if available
+        if hasattr(work_item, 'relations') and work_item.relations:
+            details.append("\n## Related Items")
+            for link in work_item.relations:
+                details.append(f"- {link.rel} URL: {link.url}")
+                if hasattr(link, 'attributes') and link.attributes:
+                    details.append(f"  :: Attributes: {link.attributes}")
+        
+        return "\n".join(details)
+    
+    def format_table(self, work_items: list[WorkItem]) -> str:
+        """
+        Format work items as a compact markdown table, one row per item.
+        
+        Args:
+            work_items: Work item objects to format
+            
+        Returns:
+            Markdown table with an ID column and one column per field
+        """
+        rows_fields = [self._fields(work_item) for work_item in work_items]
+        columns = sorted({name for fields in rows_fields for name in fields})
+        show_relations = any(getattr(work_item, 'relations', None)
+                             for work_item in work_items)
+        
+        headers = ["ID"] + columns + (["Relations"] if show_relations else [])
+        result = ["| " + " | ".join(headers) + " |",
+                  "| " + " | ".join(["----"] * len(headers)) + " |"]
+        
+        for work_item, fields in zip(work_items, rows_fields):
+            cells = [str(work_item.id)]
+            for column in columns:
+                if column in fields:
+                    cells.append(_format_table_cell(
+                        self._format_value(column, fields[column])))
+                else:
+                    cells.append("")
+            if show_relations:
+                cells.append(str(len(work_item.relations or [])))
+            result.append("| " + " | ".join(cells) + " |")
+        
+        return "\n".join(result)
+    
+    def format_json_line(self, work_item: WorkItem) -> str:
+        """
+        Format a work item as a single line of JSON.
+        
+        Args:
+            work_item: Work item object to format
+            
+        Returns:
+            JSON object with id, fields and (if present) relations
+        """
+        fields = {}
+        for field_name, field_value in self._fields(work_item).items():
+            if isinstance(field_value, (str, int, float, bool)):
+                fields[field_name] = field_value
+            else:
+                fields[field_name] = self._format_value(field_name,
+                                                        field_value)
+        
+        item = {"id": work_item.id, "fields": fields}
+        if getattr(work_item, 'relations', None):
+            item["relations"] = [{"rel": link.rel, "url": link.url}
+                                 for link in work_item.relations]
+        return json.dumps(item, separators=(",", ":"))
+    
+    def format(self, work_items: list[WorkItem]) -> str:
+        """
+        Format a list of work items in the configured output format.
+        
+        Args:
+            work_items: Work item objects to format
+            
+        Returns:
+            Formatted work items
+        """
+        if not work_items:
+            return ""
+        if self.output_format == "table":
+            return self.format_table(work_items)
+        if self.output_format == "jsonl":
+            return "\n".join(self.format_json_line(work_item)
+                             for work_item in work_items)
+        return "\n\n".join(self.format_markdown(work_item)
+                           for work_item in work_items)
+
+
+def format_work_item(work_item: WorkItem,
+                     fields: Optional[list[str]] = None) -> str:
     """
     Format work item information for display.
     
     Args:
         work_item: Work item object to format
+        fields: Optional list of field reference names to include. All
+            fields are included when omitted.
         
     Returns:
         String with formatted work item details
     """
-    fields = work_item.fields or {}
-    details = [f"# Work Item {work_item.id}"]
-    
-    # List all fields alphabetically for consistent output
-    for field_name in sorted(fields.keys()):
-        field_value = fields[field_name]
-        formatted_value = _format_field_value(field_value)
-        details.append(f"- **{field_name}**: {formatted_value}")
-    
-    # Add related items if available
-    if hasattr(work_item, 'relations') and work_item.relations:
-        details.append("\n## Related Items")
-        for link in work_item.relations:
-            details.append(f"- {link.rel} URL: {link.url}")
-            if hasattr(link, 'attributes') and link.attributes:
-                details.append(f"  :: Attributes: {link.attributes}")
-    
-    return "\n".join(details)
+    return WorkItemFormatter("markdown", fields).format_markdown(work_item)
+
+
+def format_work_items(work_items: list[WorkItem],
+                      output_format: str = "markdown",
+                      fields: Optional[list[str]] = None) -> str:
+    """
+    Format a list of work items for display.
+    
+    Args:
+        work_items: Work item objects to format
+        output_format: One of "markdown" (verbose), "table" (one compact
+            row per item) or "jsonl" (one JSON object per line)
+        fields: Optional list of field reference names to include
+        
+    Returns:
+        String with the formatted work items
+        
+    Raises:
+        ValueError: If the output format is not supported
+    """
+    return WorkItemFormatter(output_format, fields).format(work_items)
@@ -0,0 +1,381 @@
+"""
+Local SQLite mirror of Azure DevOps work items.
+
+The mirror keeps the latest revision of every work item of the projects it
+has synced. Syncs are incremental: the reporting work item revisions API
+returns a watermark after each batch, and the next sync only reads the
+revisions made after it. Reads are served from the mirror only while the
+project's last sync is more recent than AZURE_DEVOPS_MIRROR_MAX_AGE
+seconds.
+
+The mirror is enabled by setting AZURE_DEVOPS_MIRROR_PATH to the path of
+the SQLite database file.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+from mcp_azure_devops.utils.cache import SingleFlight
+
+# Default number of seconds a synced project is considered fresh
+DEFAULT_MIRROR_MAX_AGE = 300
+
+# Fields commonly filtered on in WIQL, indexed by their lower-cased value
+# within a project so that local queries on them use an index
+INDEXED_FIELDS = [
+    "System.State",
+    "System.WorkItemType",
+    "System.AreaPath",
+    "System.IterationPath",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_items (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL COLLATE NOCASE,
+    rev INTEGER,
+    fields TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS work_items_project ON work_items (project);
+{field_indexes}
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY COLLATE NOCASE,
+    watermark TEXT,
+    synced_at REAL NOT NULL
+);
+"""
+
+_FIELD_INDEX = """
+CREATE INDEX IF NOT EXISTS "work_items_{name}" ON work_items (
+    project, lower(json_extract(fields, '$."{field}"'))
+);"""
+
+
+def _get_batch_property(batch, attribute: str, key: str):
+    """
+    Get a property of a reporting revisions batch.
+    
+    The SDK model declares no attributes, so the deserialized batch keeps
+    the response properties in additional_properties under their JSON names.
+    
+    Args:
+        batch: ReportingWorkItemRevisionsBatch returned by the SDK
+        attribute: Model attribute name
+        key: JSON property name
+        
+    Returns:
+        Property value, or None if the batch does not have it
+    """
+    value = getattr(batch, attribute, None)
+    if value is None:
+        value = (getattr(batch, "additional_properties", None) or {}).get(key)
+    return value
+
+
+class WorkItemMirror:
+    """
+    SQLite store holding the latest revision of mirrored work items.
+    
+    A single connection is shared by all threads and guarded by a lock.
+    Network calls made while syncing happen outside the lock, and concurrent
+    syncs of the same project share one sync.
+    """
+    
+    def __init__(self, path: str, max_age: float = DEFAULT_MIRROR_MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._syncs = SingleFlight()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA.format(field_indexes="".join(
+                _FIELD_INDEX.format(name=field.lower().replace(".", "_"),
+                                    field=field)
+                for field in INDEXED_FIELDS)))
+            self._db.commit()
+    
+    def _get_sync_state(self, project: str) -> Optional[tuple]:
+        """Get the (watermark, synced_at) row of a project."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT watermark, synced_at FROM sync_state "
+                "WHERE project = ?", (project,)).fetchone()
+    
+    def is_fresh(self, project: str) -> bool:
+        """
+        Check whether a project was synced within the freshness bound.
+        
+        Args:
+            project: Project name
+            
+        Returns:
+            True if reads for the project can be served from the mirror
+        """
+        state = self._get_sync_state(project)
+        return bool(state) and time.time() - state[1] <= self.max_age
+    
+    def refresh(self, wit_client: WorkItemTrackingClient,
+                project: str) -> bool:
+        """
+        Make sure a mirrored project is fresh, syncing it if it is stale.
+        
+        Args:
+            wit_client: Work item tracking client
+            project: Project name
+            
+        Returns:
+            True if the project is mirrored and fresh, False if it has never
+            been synced or the sync failed
+        """
+        if self.is_fresh(project):
+            return True
+        if self._get_sync_state(project) is None:
+            return False
+        try:
+            self.sync(wit_client, project)
+        except Exception:
+            return False
+        return self.is_fresh(project)
+    
+    def has_work_items(self, project: str) -> bool:
+        """
+        Check whether any work items of a project are mirrored.
+        
+        Args:
+            project: Project name
+            
+        Returns:
+            True if the mirror holds at least one work item of the project
+        """
+        with self._lock:
+            return self._db.execute(
+                "SELECT 1 FROM work_items WHERE project = ? LIMIT 1",
+                (project,)).fetchone() is not None
+    
+    def select(self, sql: str, params: list) -> list:
+        """
+        Run a read-only SQL query against the mirror.
+        
+        Args:
+            sql: SELECT statement over the work_items table
+            params: Statement parameters
+            
+        Returns:
+            List of result rows
+        """
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+    
+    def _store_batch(self, project: str, values: list) -> tuple[int, int]:
+        """
+        Store a batch of latest work item revisions.
+        
+        Args:
+            project: Project the batch was read from
+            values: Revisions returned by the reporting revisions API
+            
+        Returns:
+            Tuple of (work items stored, work items deleted)
+        """
+        upserts = []
+        deletes = []
+        for value in values:
+            fields = value.get("fields") or {}
+            if fields.get("System.IsDeleted"):
+                deletes.append((value["id"],))
+            else:
+                upserts.append((value["id"],
+                                fields.get("System.TeamProject") or project,
+                                value.get("rev"), json.dumps(fields)))
+        
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO work_items (id, project, rev, fields) "
+                "VALUES (?, ?, ?, ?)", upserts)
+            self._db.executemany("DELETE FROM work_items WHERE id = ?",
+                                 deletes)
+            self._db.commit()
+        return len(upserts), len(deletes)
+    
+    def _sync(self, wit_client: WorkItemTrackingClient, project: str,
+              full: bool) -> Dict[str, int]:
+        """
+        Read revisions since the project's watermark into the mirror.
+        
+        The sync state is not recorded when the revisions API returned no
+        watermark, or when a first or full sync stored no work items, so
+        such a project is not served from the mirror.
+        """
+        state = self._get_sync_state(project)
+        watermark = state[0] if state and not full else None
+        
+        if full:
+            # The project is not served from the mirror until the sync ends
+            with self._lock:
+                self._db.execute("DELETE FROM sync_state WHERE project = ?",
+                                 (project,))
+                self._db.execute("DELETE FROM work_items WHERE project = ?",
+                                 (project,))
+                self._db.commit()
+        
+        stored = deleted = batches = 0
+        while True:
+            batch = wit_client.read_reporting_revisions_get(
+                project=project,
+                continuation_token=watermark,
+                include_identity_ref=True,
+                include_deleted=True,
+                include_latest_only=True,
+                expand="fields"
+            )
+            values = _get_batch_property(batch, "values", "values") or []
+            batch_stored, batch_deleted = self._store_batch(project, values)
+            stored += batch_stored
+            deleted += batch_deleted
+            batches += 1
+            
+            continuation_token = _get_batch_property(
+                batch, "continuation_token", "continuationToken")
+            if continuation_token:
+                watermark = continuation_token
+            if (_get_batch_property(batch, "is_last_batch", "isLastBatch")
+                    or not values):
+                break
+        
+        result = {"stored": stored, "deleted": deleted, "batches": batches,
+                  "recorded": False}
+        incremental = bool(state and state[0]) and not full
+        if watermark is None or not (incremental or stored):
+            return result
+        
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync_state (project, watermark, "
+                "synced_at) VALUES (?, ?, ?)",
+                (project, watermark, time.time()))
+            self._db.commit()
+        
+        result["recorded"] = True
+        return result
+    
+    def sync(self, wit_client: WorkItemTrackingClient, project: str,
+             full: bool = False) -> Dict[str, int]:
+        """
+        Sync a project into the mirror.
+        
+        Args:
+            wit_client: Work item tracking client
+            project: Project name
+            full: Whether to discard the watermark and re-read everything
+            
+        Returns:
+            Dictionary with the number of work items stored and deleted,
+            the number of batches read and whether the sync was recorded
+        """
+        return self._syncs.do(f"{project.lower()}|{full}",
+                              lambda: self._sync(wit_client, project, full))
+    
+    def _read_rows(self, ids: List[int]) -> list:
+        """Read the stored rows of work items."""
+        rows = []
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                rows.extend(self._db.execute(
+                    f"SELECT id, project, rev, fields FROM work_items WHERE "
+                    f"id IN ({','.join('?' * len(chunk))})", chunk))
+        return rows
+    
+    def get_work_items(
+        self,
+        ids: List[int],
+        wit_client: Optional[WorkItemTrackingClient] = None
+    ) -> Dict[int, WorkItem]:
+        """
+        Get mirrored work items from fresh projects.
+        
+        When a client is given, mirrored projects whose last sync is older
+        than the freshness bound are synced incrementally first.
+        
+        Args:
+            ids: Work item IDs
+            wit_client: Optional work item tracking client used to refresh
+                stale projects
+                
+        Returns:
+            Dictionary mapping work item ID to WorkItem for every ID found
+            in a fresh project
+        """
+        rows = self._read_rows(ids)
+        
+        if wit_client is not None:
+            stale = {row[1].lower(): row[1] for row in rows
+                     if not self.is_fresh(row[1])}
+            refreshed = False
+            for project in stale.values():
+                refreshed = self.refresh(wit_client, project) or refreshed
+            if refreshed:
+                # Rows may have changed; read them again after the sync
+                rows = self._read_rows(ids)
+        
+        fresh = {}
+        work_items = {}
+        for item_id, project, rev, fields in rows:
+            if project.lower() not in fresh:
+                fresh[project.lower()] = self.is_fresh(project)
+            if fresh[project.lower()]:
+                work_items[item_id] = WorkItem(id=item_id, rev=rev,
+                                               fields=json.loads(fields))
+        return work_items
+    
+    def status(self) -> List[dict]:
+        """
+        Get the sync status of every mirrored project.
+        
+        Returns:
+            List of dictionaries with project, work item count, seconds since
+            the last sync and whether the project is fresh
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT s.project, s.synced_at, COUNT(w.id) FROM sync_state s "
+                "LEFT JOIN work_items w ON w.project = s.project "
+                "GROUP BY s.project ORDER BY s.project").fetchall()
+        now = time.time()
+        return [{"project": project, "work_items": count,
+                 "age": now - synced_at,
+                 "fresh": now - synced_at <= self.max_age}
+                for project, synced_at, count in rows]
+
+
+_mirror: Optional[WorkItemMirror] = None
+_mirror_lock = threading.Lock()
+
+
+def get_mirror() -> Optional[WorkItemMirror]:
+    """
+    Get the work item mirror configured by environment variables.
+    
+    Returns:
+        WorkItemMirror instance, or None if AZURE_DEVOPS_MIRROR_PATH is not
+        set
+    """
+    global _mirror
+    path = os.environ.get("AZURE_DEVOPS_MIRROR_PATH")
+    if not path:
+        return None
+    
+    with _mirror_lock:
+        if _mirror is None or _mirror.path != path:
+            _mirror = WorkItemMirror(
+                path,
+                float(os.environ.get("AZURE_DEVOPS_MIRROR_MAX_AGE",
+                                     DEFAULT_MIRROR_MAX_AGE)))
+        return _mirror
@@ -0,0 +1,93 @@
+"""
+Project and work item type resolution for Azure DevOps work items.
+
+This module resolves projects to their process and work item type names to
+their reference names. Results are memoized and shared across tools, and
+concurrent lookups for the same key share a single request. Keys include the
+organization URL, so organizations with equally named projects do not share
+results.
+"""
+import os
+from typing import Optional
+
+from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
+from mcp_azure_devops.utils.azure_client import (
+    get_cache_scope,
+    get_core_client,
+)
+from mcp_azure_devops.utils.cache import TTLCache
+
+_resolver_cache = TTLCache(
+    ttl=float(os.environ.get("AZURE_DEVOPS_RESOLVER_CACHE_TTL", 3600)),
+    max_entries=int(os.environ.get("AZURE_DEVOPS_RESOLVER_CACHE_SIZE", 1024)),
+)
+
+
+def _lookup_project_process(project: str) -> Optional[dict]:
+    """
+    Look up the process used by a project.
+    
+    Args:
+        project: Project ID or project name
+        
+    Returns:
+        Dictionary with process_id, process_name and project_name, or None
+        if the project has no process template
+    """
+    core_client = get_core_client()
+    project_details = core_client.get_project(
+        project, include_capabilities=True)
+    process_template = project_details.capabilities.get(
+        "processTemplate", {})
+    
+    process_id = process_template.get("templateTypeId")
+    if not process_id:
+        return None
+    
+    return {
+        "process_id": process_id,
+        "process_name": process_template.get("templateName"),
+        "project_name": project_details.name,
+    }
+
+
+def resolve_project_process(project: str) -> Optional[dict]:
+    """
+    Resolve the process used by a project.
+    
+    Args:
+        project: Project ID or project name
+        
+    Returns:
+        Dictionary with process_id, process_name and project_name, or None
+        if the process could not be determined
+    """
+    return _resolver_cache.get_or_set(
+        f"process|{get_cache_scope()}|{project.lower()}",
+        lambda: _lookup_project_process(project))
+
+
+def resolve_work_item_type_reference(
+    project: str,
+    type_name: str,
+    wit_client: WorkItemTrackingClient
+) -> Optional[str]:
+    """
+    Resolve a work item type name to its reference name.
+    
+    Args:
+        project: Project ID or project name
+        type_name: The name of the work item type
+        wit_client: Work item tracking client
+        
+    Returns:
+        Reference name of the work item type, or None if not found
+    """
+    def lookup() -> Optional[str]:
+        wit = wit_client.get_work_item_type(project, type_name)
+        return wit.reference_name if wit else None
+    
+    return _resolver_cache.get_or_set(
+        f"type|{get_cache_scope()}|{project.lower()}|{type_name.lower()}",
+        lookup)
@@ -2,12 +2,16 @@
 Work item tools for Azure DevOps.
 """
 from mcp_azure_devops.features.work_items.tools import (
+    aggregate,
+    cache,
     comments,
     create,
+    mirror,
     process,
     query,
     read,
     templates,
+    tree,
     types,
 )
 
@@ -20,9 +24,13 @@ def register_tools(mcp) -> None:
         mcp: The FastMCP server instance
     """
     query.register_tools(mcp)
+    aggregate.register_tools(mcp)
     read.register_tools(mcp)
+    tree.register_tools(mcp)
     comments.register_tools(mcp)
     create.register_tools(mcp)
     types.register_tools(mcp)
     templates.register_tools(mcp)
     process.register_tools(mcp)
+    mirror.register_tools(mcp)
+    cache.register_tools(mcp)
@@ -0,0 +1,274 @@
+"""
+Aggregation operations for Azure DevOps work items.
+
+This module provides MCP tools for counting and rolling up work items.
+"""
+import re
+from typing import Callable, Optional
+
+from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from mcp.server.fastmcp import Context
+
+from mcp_azure_devops.features.work_items.common import (
+    AzureDevOpsClientError,
+    get_work_item_client,
+    get_work_items_batched,
+)
+from mcp_azure_devops.features.work_items.mirror import get_mirror
+from mcp_azure_devops.features.work_items.tools.query import (
+    find_work_item_ids,
+)
+from mcp_azure_devops.utils.concurrency import (
+    make_progress_callback,
+    run_blocking,
+)
+
+# Most work items a WIQL query can return
+MAX_AGGREGATE_ITEMS = 20000
+
+_AGGREGATE_PATTERN = re.compile(
+    r"^\s*(count|sum|avg)\s*(?:\(\s*\[?\s*([\w.]*)\s*\]?\s*\))?\s*$",
+    re.IGNORECASE)
+
+
+def _parse_aggregates(aggregates: list[str]) -> list[tuple[str, str]]:
+    """
+    Parse aggregate expressions such as "count" or "sum(Field)".
+    
+    Args:
+        aggregates: Aggregate expressions
+        
+    Returns:
+        List of (function, field) tuples; the field is empty for count
+        
+    Raises:
+        ValueError: If an expression is not valid
+    """
+    parsed = []
+    for aggregate in aggregates:
+        match = _AGGREGATE_PATTERN.match(aggregate)
+        if not match:
+            raise ValueError(f"Invalid aggregate '{aggregate}'. Use count, "
+                             f"sum(Field) or avg(Field)")
+        function, field_name = match.group(1).lower(), match.group(2) or ""
+        if function != "count" and not field_name:
+            raise ValueError(f"{function} needs a field, e.g. "
+                             f"{function}(Microsoft.VSTS.Scheduling."
+                             f"StoryPoints)")
+        parsed.append((function, field_name))
+    return parsed
+
+
+def _build_query(query: str) -> str:
+    """
+    Build a WIQL query from a full query or a WHERE condition.
+    
+    Args:
+        query: A WIQL query, or only the condition of its WHERE clause
+        
+    Returns:
+        WIQL query string
+    """
+    if re.match(r"^\s*SELECT\s", query, re.IGNORECASE):
+        return query
+    return f"SELECT [System.Id] FROM WorkItems WHERE {query}"
+
+
+def _canonical_field_names(work_items: list) -> dict[str, str]:
+    """
+    Map lower-cased field names to the reference names the API returns.
+    
+    Args:
+        work_items: Retrieved work items
+        
+    Returns:
+        Dictionary from lower-cased name to canonical reference name
+    """
+    names = {}
+    for work_item in work_items:
+        for field_name in work_item.fields or {}:
+            names.setdefault(field_name.lower(), field_name)
+    return names
+
+
+def _group_value(value) -> str:
+    """Format a field value as a group key."""
+    if value is None or value == "":
+        return "(empty)"
+    if isinstance(value, dict):
+        return str(value.get("displayName") or value)
+    return str(value)
+
+
+def _number(value) -> Optional[float]:
+    """Convert a field value to a number, or None if it is not numeric."""
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _format_number(value: Optional[float]) -> str:
+    """Format an aggregate value without needless decimals."""
+    if value is None:
+        return ""
+    return f"{value:g}" if value == int(value) else f"{value:.2f}"
+
+
+def _aggregate_work_items_impl(
+    query: str,
+    group_by: list[str],
+    aggregates: list[str],
+    wit_client: WorkItemTrackingClient,
+    use_mirror: bool = False,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> str:
+    """
+    Implementation of work item aggregation.
+    
+    Only the group-by and aggregated fields of the matching work items are
+    retrieved, and the groups are computed from them.
+    
+    Args:
+        query: A WIQL query, or only the condition of its WHERE clause
+        group_by: Field reference names to group by
+        aggregates: Aggregate expressions (count, sum(Field), avg(Field))
+        wit_client: Work item tracking client
+        use_mirror: Whether to answer from the local mirror when possible
+        progress: Optional callback called with (items fetched, total)
+        
+    Returns:
+        Markdown table with one row per group
+    """
+    try:
+        parsed = _parse_aggregates(aggregates)
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    
+    ids = find_work_item_ids(_build_query(query), MAX_AGGREGATE_ITEMS,
+                             wit_client, use_mirror)
+    if not ids:
+        return "No work items found matching the query."
+    
+    aggregated = list(dict.fromkeys(
+        field_name for _, field_name in parsed if field_name))
+    fields = list(dict.fromkeys(group_by + aggregated))
+    mirror = get_mirror() if use_mirror else None
+    mirrored = mirror.get_work_items(ids, wit_client) if mirror else {}
+    missing = [item_id for item_id in ids if item_id not in mirrored]
+    work_items, errors = (get_work_items_batched(
+        wit_client, missing, fields=fields or ["System.Id"],
+        progress=progress) if missing else ([], []))
+    work_items.extend(mirrored.values())
+    
+    # Field names are case-insensitive, but the returned keys are not
+    canonical = _canonical_field_names(work_items)
+    group_by = [canonical.get(field_name.lower(), field_name)
+                for field_name in group_by]
+    parsed = [(function, canonical.get(field_name.lower(), field_name))
+              for function, field_name in parsed]
+    aggregated = list(dict.fromkeys(
+        field_name for _, field_name in parsed if field_name))
+    
+    # Group the work items and collect the numeric values to aggregate
+    groups = {}
+    for work_item in work_items:
+        item_fields = work_item.fields or {}
+        key = tuple(_group_value(item_fields.get(field_name))
+                    for field_name in group_by)
+        group = groups.setdefault(key, {"count": 0, "values": {}})
+        group["count"] += 1
+        for field_name in aggregated:
+            number = _number(item_fields.get(field_name))
+            if number is not None:
+                group["values"].setdefault(field_name, []).append(number)
+    
+    headers = list(group_by) + [
+        f"{function}({field_name})" if field_name else function
+        for function, field_name in parsed]
+    result = [f"| {' | '.join(headers)} |",
+              f"| {' | '.join('----' for _ in headers)} |"]
+    for key in sorted(groups):
+        group = groups[key]
+        cells = list(key)
+        for function, field_name in parsed:
+            values = group["values"].get(field_name, [])
+            if function == "count":
+                cells.append(str(group["count"]))
+            elif function == "sum":
+                cells.append(_format_number(sum(values)))
+            else:
+                cells.append(_format_number(
+                    sum(values) / len(values) if values else None))
+        cells = [cell.replace("|", "\\|") for cell in cells]
+        result.append(f"| {' | '.join(cells)} |")
+    
+    result.append(f"\n{len(work_items)} work items in {len(groups)} groups.")
+    if len(ids) >= MAX_AGGREGATE_ITEMS:
+        result.append(f"The query matched {MAX_AGGREGATE_ITEMS} or more "
+                      f"work items; only the first {MAX_AGGREGATE_ITEMS} "
+                      f"are included.")
+    result.extend(errors)
+    return "\n".join(result)
+
+
+def register_tools(mcp) -> None:
+    """
+    Register work item aggregation tools with the MCP server.
+    
+    Args:
+        mcp: The FastMCP server instance
+    """
+    
+    @mcp.tool()
+    async def aggregate_work_items(
+        query: str,
+        group_by: Optional[list[str]] = None,
+        aggregates: Optional[list[str]] = None,
+        use_mirror: bool = False,
+        ctx: Context = None
+    ) -> str:
+        """
+        Counts and rolls up work items matching a query, grouped by fields.
+        
+        Use this tool when you need to:
+        - Count active bugs per area path or state
+        - Total story points or remaining work per iteration or assignee
+        - Get averages such as mean priority per work item type
+        - Summarize a large set of work items without listing them
+        
+        IMPORTANT: Only the group-by and aggregated fields are retrieved, so
+        this is much cheaper than reading every work item with
+        query_work_items. Non-numeric and empty values are ignored by sum
+        and avg.
+        
+        Args:
+            query: A WIQL query, or only its WHERE condition (e.g.,
+                "[System.TeamProject] = 'Web' AND [System.WorkItemType] =
+                'Bug'")
+            group_by: Optional field reference names to group by (e.g.,
+                ["System.AreaPath"]). All work items form one group when
+                omitted.
+            aggregates: Aggregates to compute: "count", "sum(Field)" or
+                "avg(Field)" (default: ["count"])
+            use_mirror: Whether to answer from the local work item mirror
+                when it is enabled and recently synced (default: False).
+                Queries the mirror cannot evaluate, and projects without
+                mirrored work items, are aggregated on the server.
+                
+        Returns:
+            Markdown table with one row per group showing the group-by
+            values and the computed aggregates
+        """
+        try:
+            wit_client = get_work_item_client()
+            return await run_blocking(
+                _aggregate_work_items_impl, query, group_by or [],
+                aggregates or ["count"], wit_client, use_mirror,
+                make_progress_callback(ctx))
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+        except Exception as e:
+            return f"Error aggregating work items: {str(e)}"
@@ -0,0 +1,114 @@
+"""
+Cache operations for Azure DevOps work items.
+
+This module provides MCP tools for managing cached work item metadata and
+inspecting cache statistics.
+"""
+from typing import Optional
+
+from mcp_azure_devops.features.work_items.common import metadata_cache
+from mcp_azure_devops.features.work_items.tools.query import (
+    get_query_cache_stats,
+)
+
+# Kinds of metadata stored in the metadata cache
+METADATA_KINDS = [
+    "work_item_types",
+    "work_item_type_fields",
+    "process_details",
+    "processes",
+    "work_item_templates",
+]
+
+
+def _invalidate_metadata_cache_impl(kind: Optional[str] = None) -> str:
+    """
+    Implementation of metadata cache invalidation.
+    
+    Args:
+        kind: Optional kind of metadata to invalidate
+        
+    Returns:
+        Message describing how many entries were removed
+    """
+    if kind and kind not in METADATA_KINDS:
+        return (f"Error: Unknown metadata kind '{kind}'. Valid kinds are: "
+                f"{', '.join(METADATA_KINDS)}")
+    
+    removed = metadata_cache.invalidate(f"{kind}|" if kind else "")
+    scope = f"'{kind}' " if kind else ""
+    return f"Invalidated {removed} cached {scope}metadata entries."
+
+
+def _get_cache_stats_impl() -> str:
+    """
+    Implementation of cache statistics retrieval.
+    
+    Returns:
+        Markdown table of cache statistics
+    """
+    metadata_stats = metadata_cache.stats()
+    query_stats = get_query_cache_stats()
+    
+    result = ["# Cache Statistics"]
+    result.append("| Cache | Hits | Misses | Entries |")
+    result.append("| ---- | ---- | ---- | ---- |")
+    for name, stats in [("Metadata", metadata_stats),
+                        ("Query work items", query_stats)]:
+        result.append(f"| {name} | {stats['hits']} | {stats['misses']} | "
+                      f"{stats['size']} |")
+    
+    result.append(f"\nCached query work items revalidated: "
+                  f"{query_stats['revalidated']}")
+    result.append(f"Cached query work items refetched after a change: "
+                  f"{query_stats['refetched']}")
+    return "\n".join(result)
+
+
+def register_tools(mcp) -> None:
+    """
+    Register work item cache tools with the MCP server.
+    
+    Args:
+        mcp: The FastMCP server instance
+    """
+    
+    @mcp.tool()
+    def invalidate_metadata_cache(kind: Optional[str] = None) -> str:
+        """
+        Clears cached work item metadata so it is fetched again.
+        
+        Use this tool when you need to:
+        - Pick up a newly added work item type, field or template
+        - See changes made to a process since it was last retrieved
+        - Force fresh results from the metadata tools
+        
+        IMPORTANT: Work item types, fields, processes and templates are
+        cached because they rarely change. Only invalidate the cache when
+        you know the configuration has changed.
+        
+        Args:
+            kind: Optional kind of metadata to clear. One of
+                "work_item_types", "work_item_type_fields",
+                "process_details", "processes" or "work_item_templates".
+                Clears everything when omitted.
+                
+        Returns:
+            Message with the number of cache entries removed
+        """
+        return _invalidate_metadata_cache_impl(kind)
+    
+    @mcp.tool()
+    def get_cache_stats() -> str:
+        """
+        Gets hit and miss statistics for the server's caches.
+        
+        Use this tool when you need to:
+        - Check whether repeated queries are being served from cache
+        - See how many cached query work items had to be re-downloaded
+        
+        Returns:
+            A table of hits, misses and entries for the metadata and query
+            work item caches, plus work item revalidation counts
+        """
+        return _get_cache_stats_impl()
@@ -3,15 +3,24 @@ Comment operations for Azure DevOps work items.
 
 This module provides MCP tools for retrieving and adding work item comments.
 """
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Optional
 
 from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 from azure.devops.v7_1.work_item_tracking.models import CommentCreate
 
 from mcp_azure_devops.features.work_items.common import (
+    DEFAULT_MAX_WORKERS,
     AzureDevOpsClientError,
     get_work_item_client,
+    get_work_item_projects,
 )
+from mcp_azure_devops.utils.concurrency import async_tool
+
+# Sort orders accepted by get_comments
+COMMENT_ORDERS = ("asc", "desc")
 
 
 def _format_comment(comment) -> str:
@@ -51,6 +60,9 @@ def _get_project_for_work_item(
     """
     Get the project name for a work item.
     
+    Uses the project index when the work item was seen recently, otherwise
+    retrieves only the work item's System.TeamProject field.
+    
     Args:
         item_id: The work item ID
         wit_client: Work item tracking client
@@ -59,19 +71,130 @@ def _get_project_for_work_item(
         Project name or None if not found
     """
     try:
-        work_item = wit_client.get_work_item(item_id)
-        if work_item and work_item.fields:
-            return work_item.fields.get("System.TeamProject")
+        return get_work_item_projects(wit_client, [item_id]).get(item_id)
     except Exception:
-        pass
+        return None
+
+
+def _parse_since(since: str) -> datetime:
+    """
+    Parse a since date, treating dates without a timezone as UTC.
     
-    return None
+    Args:
+        since: ISO 8601 date or date and time (e.g., "2024-05-01")
+        
+    Returns:
+        Timezone-aware datetime
+        
+    Raises:
+        ValueError: If the date cannot be parsed
+    """
+    parsed = datetime.fromisoformat(since)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _token_mode(order: Optional[str], since: Optional[datetime]) -> str:
+    """
+    Get the paging mode a continuation token belongs to.
+    
+    Tokens issued for one mode page in a different order or stop at a
+    different date than the others, so they are only accepted in the mode
+    that issued them.
+    
+    Args:
+        order: Sort order of the call
+        since: Parsed since date of the call
+        
+    Returns:
+        "since=" and the since date in UTC when reading newest first from a
+        date, else the order
+    """
+    if since:
+        return f"since={since.astimezone(timezone.utc).isoformat()}"
+    return order or "default"
+
+
+def _encode_token(mode: str, token: Optional[str]) -> Optional[str]:
+    """Prefix a continuation token from the API with its paging mode."""
+    return f"{mode}:{token}" if token else None
+
+
+def _decode_token(mode: str, token: str) -> str:
+    """
+    Get the API continuation token from a token issued by this tool.
+    
+    Args:
+        mode: Paging mode of the current call
+        token: Continuation token passed by the caller
+        
+    Returns:
+        Continuation token to pass to the API
+        
+    Raises:
+        ValueError: If the token was issued for a different paging mode
+    """
+    prefix = f"{mode}:"
+    if not token.startswith(prefix) or len(token) == len(prefix):
+        raise ValueError(token)
+    return token[len(prefix):]
+
+
+def _get_comments_since(
+    item_id: int,
+    project: str,
+    wit_client: WorkItemTrackingClient,
+    since: datetime,
+    top: Optional[int] = None,
+    continuation_token: Optional[str] = None
+) -> tuple[list, Optional[str], Optional[int]]:
+    """
+    Get the comments created at or after a date.
+    
+    Pages are read newest first, so paging stops at the first comment older
+    than the date instead of reading the whole discussion.
+    
+    Args:
+        item_id: The work item ID
+        project: Project name
+        wit_client: Work item tracking client
+        since: Only comments created at or after this time are returned
+        top: Optional maximum number of comments to return
+        continuation_token: Optional token returned by a previous page
+        
+    Returns:
+        Tuple of (comments newest first, continuation token if more comments
+        may match, total comment count)
+    """
+    comments = []
+    total_count = None
+    while True:
+        # Only ask for what is still missing so the result stays within top
+        page = wit_client.get_comments(
+            project=project, work_item_id=item_id,
+            top=top - len(comments) if top else None,
+            continuation_token=continuation_token, order="desc")
+        total_count = page.total_count
+        for comment in page.comments or []:
+            if comment.created_date and comment.created_date < since:
+                return comments[:top] if top else comments, None, total_count
+            comments.append(comment)
+        
+        continuation_token = page.continuation_token
+        if not continuation_token or (top and len(comments) >= top):
+            return (comments[:top] if top else comments, continuation_token,
+                    total_count)
 
 
 def _get_work_item_comments_impl(
     item_id: int,
     wit_client: WorkItemTrackingClient,
-    project: Optional[str] = None
+    project: Optional[str] = None,
+    top: Optional[int] = None,
+    continuation_token: Optional[str] = None,
+    order: Optional[str] = None,
+    since: Optional[str] = None
 ) -> str:
     """
     Implementation of work item comments retrieval.
@@ -80,10 +203,29 @@ def _get_work_item_comments_impl(
         item_id: The work item ID
         wit_client: Work item tracking client
         project: Optional project name
+        top: Optional maximum number of comments to return
+        continuation_token: Optional token returned by a previous page
+        order: Optional sort order, "asc" or "desc"
+        since: Optional ISO 8601 date; only newer comments are returned
             
     Returns:
         Formatted string containing work item comments
     """
+    try:
+        since_date = _parse_since(since) if since else None
+    except ValueError:
+        return (f"Error: Invalid since date '{since}'. Use an ISO 8601 date "
+                f"such as 2024-05-01 or 2024-05-01T12:00:00Z")
+    
+    mode = _token_mode(order, since_date)
+    if continuation_token:
+        try:
+            continuation_token = _decode_token(mode, continuation_token)
+        except ValueError:
+            return ("Error: The continuation token belongs to a call with a "
+                    "different order or since date. Pass the same order and "
+                    "since as the call that returned it.")
+    
     # If project is not provided, try to get it from the work item
     if not project:
         project = _get_project_for_work_item(item_id, wit_client)
@@ -91,20 +233,91 @@ def _get_work_item_comments_impl(
         if not project:
             return f"Error retrieving work item {item_id} to determine project"
     
-    # Get comments using the project if available
-    comments = wit_client.get_comments(project=project, work_item_id=item_id)
+    if since_date:
+        comments, next_token, total_count = _get_comments_since(
+            item_id, project, wit_client, since_date, top,
+            continuation_token)
+        if order == "asc":
+            comments.reverse()
+    else:
+        # Get one page of comments using the project
+        page = wit_client.get_comments(
+            project=project, work_item_id=item_id, top=top,
+            continuation_token=continuation_token, order=order)
+        comments = page.comments or []
+        next_token = page.continuation_token
+        total_count = page.total_count
+    next_token = _encode_token(mode, next_token)
     
     # Format the comments
     formatted_comments = [
-        _format_comment(comment) for comment in comments.comments
+        _format_comment(comment) for comment in comments
     ]
     
-    if not formatted_comments:
+    if not formatted_comments and not next_token:
         return "No comments found for this work item."
     
+    if next_token:
+        total = f" of {total_count}" if total_count else ""
+        formatted_comments.append(
+            f"---\nShowing {len(comments)}{total} comments. More comments "
+            f"are available: call get_work_item_comments with "
+            f"continuation_token=\"{next_token}\"")
+    
     return "\n\n".join(formatted_comments)
 
 
+def _get_comments_for_work_items_impl(
+    item_ids: list[int],
+    wit_client: WorkItemTrackingClient,
+    project: Optional[str] = None,
+    top: Optional[int] = None,
+    order: Optional[str] = None,
+    since: Optional[str] = None
+) -> str:
+    """
+    Implementation of comments retrieval for several work items.
+    
+    Projects of all work items are resolved together, then the comments of
+    each work item are retrieved concurrently.
+    
+    Args:
+        item_ids: The work item IDs
+        wit_client: Work item tracking client
+        project: Optional project name shared by all work items
+        top: Optional maximum number of comments per work item
+        order: Optional sort order, "asc" or "desc"
+        since: Optional ISO 8601 date; only newer comments are returned
+        
+    Returns:
+        Formatted string containing the comments of each work item
+    """
+    if project:
+        projects = {item_id: project for item_id in item_ids}
+    else:
+        projects = get_work_item_projects(wit_client, item_ids)
+    
+    def get_comments(item_id: int) -> str:
+        if item_id not in projects:
+            return (f"Error retrieving work item {item_id} to determine "
+                    f"project")
+        try:
+            return _get_work_item_comments_impl(
+                item_id, wit_client, projects[item_id], top=top, order=order,
+                since=since)
+        except Exception as e:
+            return f"Error retrieving comments: {str(e)}"
+    
+    max_workers = int(os.environ.get("AZURE_DEVOPS_MAX_WORKERS",
+                                     DEFAULT_MAX_WORKERS))
+    with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(item_ids)))) as executor:
+        results = list(executor.map(get_comments, item_ids))
+    
+    return "\n\n".join(f"# Comments for work item {item_id}\n\n{result}"
+                       for item_id, result in zip(item_ids, results))
+
+
 def _add_work_item_comment_impl(
     item_id: int,
     text: str,
@@ -152,37 +365,66 @@ def register_tools(mcp) -> None:
     """
     
     @mcp.tool()
+    @async_tool
     def get_work_item_comments(
-        id: int,
-        project: Optional[str] = None
+        id: int | list[int],
+        project: Optional[str] = None,
+        top: Optional[int] = None,
+        continuation_token: Optional[str] = None,
+        order: Optional[str] = None,
+        since: Optional[str] = None
     ) -> str:
         """
-        Retrieves all comments associated with a specific work item.
+        Retrieves all comments associated with one or multiple work items.
     
         Use this tool when you need to:
         - Review discussion history about a work item
         - See feedback or notes left by team members
         - Check if specific questions have been answered
         - Understand the context and evolution of a work item
+        - Read the discussions of several work items at once
         
         Args:
-            id: The work item ID
+            id: The work item ID or a list of work item IDs
             project: Optional project name. If not provided, will be 
                 determined from the work item.
+            top: Optional maximum number of comments to return per work
+                item. When more comments remain, the output ends with a
+                continuation token.
+            continuation_token: Token from a previous call to get the next
+                page of comments (single work item only). Pass the same
+                order and since as that call.
+            order: Optional sort order, "asc" (oldest first) or "desc"
+                (newest first)
+            since: Optional ISO 8601 date or time (e.g., "2024-05-01"). Only
+                comments created at or after it are returned; pages are
+                then read newest first.
             
         Returns:
-            Formatted string containing all comments on the work item, 
+            Formatted string containing all comments on the work item(s),
             including author names, timestamps, and content, organized 
             chronologically and formatted as markdown
         """
+        if order and order not in COMMENT_ORDERS:
+            return (f"Error: Unknown order '{order}'. Valid orders are: "
+                    f"{', '.join(COMMENT_ORDERS)}")
+        if isinstance(id, list) and continuation_token:
+            return ("Error: continuation_token can only be used with a "
+                    "single work item ID")
         try:
             wit_client = get_work_item_client()
-            return _get_work_item_comments_impl(id, wit_client, project)
+            if isinstance(id, list):
+                return _get_comments_for_work_items_impl(
+                    id, wit_client, project, top, order, since)
+            return _get_work_item_comments_impl(
+                id, wit_client, project, top, continuation_token, order,
+                since)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
     
     
     @mcp.tool()
+    @async_tool
     def add_work_item_comment(
         id: int,
         text: str,
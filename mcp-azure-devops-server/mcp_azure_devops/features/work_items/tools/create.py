@@ -3,17 +3,39 @@ Create operations for Azure DevOps work items.
 
 This module provides MCP tools for creating work items.
 """
+import json
+import math
 import os
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
 
 from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
-from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
+from azure.devops.v7_1.work_item_tracking.models import (
+    JsonPatchOperation,
+    WorkItem,
+)
 
 from mcp_azure_devops.features.work_items.common import (
+    DEFAULT_MAX_WORKERS,
     AzureDevOpsClientError,
     get_work_item_client,
+    remember_work_item_projects,
 )
 from mcp_azure_devops.features.work_items.formatting import format_work_item
+from mcp_azure_devops.utils.concurrency import async_tool
+
+# Maximum number of requests the $batch API accepts in one call
+MAX_BATCH_REQUESTS = 200
+
+# API version used for $batch calls and the requests inside them
+BATCH_API_VERSION = "7.1"
+
+# Link type from a child work item to its parent
+PARENT_LINK_TYPE = "System.LinkTypes.Hierarchy-Reverse"
+
+# Link type used for relations that do not specify one
+DEFAULT_LINK_TYPE = "System.LinkTypes.Related"
 
 
 def _build_field_document(fields: Dict[str, Any], 
@@ -80,61 +102,368 @@ def _build_link_document(target_id: int, link_type: str, org_url: str) -> list:
     ]
 
 
+def _build_relations_document(
+    org_url: str,
+    parent_id: Optional[int] = None,
+    relations: Optional[List[Dict[str, Any]]] = None
+) -> list:
+    """
+    Build a document adding the parent link and other relations.
+    
+    Args:
+        org_url: Base organization URL
+        parent_id: Optional ID of the parent work item
+        relations: Optional list of relations, each with a target_id and an
+            optional link_type (defaults to System.LinkTypes.Related)
+            
+    Returns:
+        List of JsonPatchOperation objects
+        
+    Raises:
+        ValueError: If a relation has no target_id
+    """
+    document = []
+    
+    if parent_id:
+        document.extend(_build_link_document(
+            parent_id, PARENT_LINK_TYPE, org_url))
+    
+    for relation in relations or []:
+        if not relation.get("target_id"):
+            raise ValueError("Each relation must have a target_id")
+        document.extend(_build_link_document(
+            relation["target_id"],
+            relation.get("link_type") or DEFAULT_LINK_TYPE,
+            org_url
+        ))
+    
+    return document
+
+
 def _create_work_item_impl(
     fields: Dict[str, Any],
     project: str,
     work_item_type: str,
     wit_client: WorkItemTrackingClient,
     parent_id: Optional[int] = None,
+    relations: Optional[List[Dict[str, Any]]] = None,
 ) -> str:
     """
     Implementation of creating a work item.
     
+    The parent link and any other relations are part of the create request,
+    so the work item is created together with its links or not at all.
+    
     Args:
         fields: Dictionary of field name/value pairs to set
         project: The project name or ID
         work_item_type: Type of work item (e.g., "User Story", "Bug", "Task")
         wit_client: Work item tracking client
         parent_id: Optional ID of parent work item for hierarchy
+        relations: Optional list of relations to other work items, each
+            with a target_id and an optional link_type
         
     Returns:
         Formatted string containing the created work item details
     """
     document = _build_field_document(fields)
+    document.extend(_build_relations_document(
+        _get_organization_url(), parent_id, relations))
     
-    # Create the work item
+    # Create the work item with its links
     new_work_item = wit_client.create_work_item(
         document=document,
         project=project,
         type=work_item_type
     )
+    remember_work_item_projects([new_work_item])
     
-    # If parent_id is provided, establish parent-child relationship
-    if parent_id:
+    # Format and return the created work item
+    return format_work_item(new_work_item)
+
+
+def _to_patch_json(document: list) -> List[Dict[str, Any]]:
+    """
+    Convert JsonPatchOperation objects to plain dictionaries.
+    
+    Args:
+        document: List of JsonPatchOperation objects
+        
+    Returns:
+        List of dictionaries that can be serialized as JSON
+    """
+    return [{"op": operation.op, "path": operation.path,
+             "value": operation.value} for operation in document]
+
+
+def _parse_batch_response(response: Dict[str, Any]) -> tuple[int, dict]:
+    """
+    Parse one response returned by the $batch API.
+    
+    Args:
+        response: Response entry with a status code and a JSON body
+        
+    Returns:
+        Tuple of (status code, parsed body)
+    """
+    body = response.get("body") or {}
+    if isinstance(body, str):
         try:
-            # Get organization URL from environment
-            org_url = _get_organization_url()
+            body = json.loads(body)
+        except ValueError:
+            body = {"message": body}
+    return int(response.get("code", 0)), body
+
+
+def _send_work_item_batch(
+    wit_client: WorkItemTrackingClient,
+    batch_requests: List[Dict[str, Any]]
+) -> List[tuple[int, dict]]:
+    """
+    Send work item requests through the $batch API in a single call.
+    
+    The project of every work item returned successfully is recorded.
+    
+    Args:
+        wit_client: Work item tracking client
+        batch_requests: Requests with method, uri, headers and body
+        
+    Returns:
+        List of (status code, body) tuples in request order
+    """
+    url = (f"{_get_organization_url()}/_apis/wit/$batch"
+           f"?api-version={BATCH_API_VERSION}")
+    request = wit_client._client.post(url)
+    response = wit_client._send_request(
+        request,
+        headers={"Content-Type": "application/json",
+                 "Accept": "application/json"},
+        content=batch_requests
+    )
+    responses = [_parse_batch_response(entry)
+                 for entry in response.json().get("value", [])]
+    remember_work_item_projects(
+        WorkItem(id=body.get("id"), fields=body.get("fields"))
+        for code, body in responses if 200 <= code < 300)
+    return responses
+
+
+def _get_batch_error(body: dict) -> str:
+    """
+    Get the error message from a failed $batch response body.
+    
+    Args:
+        body: Parsed response body
+        
+    Returns:
+        Error message
+    """
+    error = body.get("value", body)
+    if isinstance(error, dict):
+        return error.get("message") or json.dumps(error)
+    return str(error)
+
+
+def _order_batch_items(items: List[dict]) -> List[int]:
+    """
+    Order batch items so that parents come before their children.
+    
+    Args:
+        items: Normalized batch items, with parent_index set for items whose
+            parent is another item in the batch
             
-            # Create parent-child relationship
-            link_document = _build_link_document(
-                target_id=parent_id,
-                link_type="System.LinkTypes.Hierarchy-Reverse",
-                org_url=org_url
-            )
+    Returns:
+        Item indexes in creation order
+        
+    Raises:
+        ValueError: If parent references form a cycle
+    """
+    order = []
+    state = {}
+    for start in range(len(items)):
+        # Walk up the parent chain, then emit it from the top down
+        chain = []
+        index = start
+        while index is not None and state.get(index) != "done":
+            if state.get(index) == "visiting":
+                raise ValueError(
+                    f"Parent references form a cycle at item {index + 1}")
+            state[index] = "visiting"
+            chain.append(index)
+            index = items[index]["parent_index"]
+        for index in reversed(chain):
+            state[index] = "done"
+            order.append(index)
+    return order
+
+
+def _normalize_batch_items(items: List[Dict[str, Any]]) -> List[dict]:
+    """
+    Validate batch items and resolve their fields and parent references.
+    
+    Args:
+        items: Items as given to create_work_items
+        
+    Returns:
+        List of dictionaries with type, fields, ref, parent_id and
+        parent_index
+        
+    Raises:
+        ValueError: If an item is missing required values or references an
+            unknown item
+    """
+    refs = {}
+    for index, item in enumerate(items):
+        ref = item.get("ref")
+        if ref is not None:
+            if str(ref) in refs:
+                raise ValueError(f"Duplicate ref '{ref}'")
+            refs[str(ref)] = index
+    
+    normalized = []
+    for index, item in enumerate(items):
+        fields = _prepare_standard_fields(
+            item.get("title"), item.get("description"), item.get("state"),
+            item.get("assigned_to"), item.get("iteration_path"),
+            item.get("area_path"), item.get("story_points"),
+            item.get("priority"), item.get("tags")
+        )
+        for field_name, field_value in (item.get("fields") or {}).items():
+            fields[_ensure_system_prefix(field_name)] = field_value
+        
+        if not item.get("work_item_type"):
+            raise ValueError(f"Item {index + 1} has no work_item_type")
+        if not fields.get("System.Title"):
+            raise ValueError(f"Item {index + 1} has no title")
+        
+        if any(not relation.get("target_id")
+               for relation in item.get("relations") or []):
+            raise ValueError(f"Item {index + 1} has a relation without a "
+                             f"target_id")
+        
+        parent_ref = item.get("parent_ref")
+        if parent_ref is not None and str(parent_ref) not in refs:
+            raise ValueError(
+                f"Item {index + 1} references unknown parent_ref "
+                f"'{parent_ref}'")
+        
+        normalized.append({
+            "type": item["work_item_type"],
+            "fields": fields,
+            "ref": item.get("ref"),
+            "parent_id": item.get("parent_id"),
+            "parent_index": (refs[str(parent_ref)]
+                             if parent_ref is not None else None),
+            "relations": item.get("relations") or [],
+        })
+    return normalized
+
+
+def _format_batch_results(items: List[dict], results: List[dict]) -> str:
+    """
+    Format per-item results of a batch operation as a table.
+    
+    Args:
+        items: Normalized batch items
+        results: Result for each item with id and status
+        
+    Returns:
+        Summary line followed by a markdown table
+    """
+    created = sum(1 for result in results if result["id"] is not None)
+    lines = [f"Created {created} of {len(items)} work items.", "",
+             "| # | Ref | ID | Type | Title | Result |",
+             "| ---- | ---- | ---- | ---- | ---- | ---- |"]
+    for index, (item, result) in enumerate(zip(items, results)):
+        title = str(item["fields"]["System.Title"]).replace("|", "\\|")
+        lines.append(
+            f"| {index + 1} | {item['ref'] or ''} | "
+            f"{result['id'] or ''} | {item['type']} | {title} | "
+            f"{result['status']} |")
+    return "\n".join(lines)
+
+
+def _create_work_items_impl(
+    items: List[Dict[str, Any]],
+    project: str,
+    wit_client: WorkItemTrackingClient,
+) -> str:
+    """
+    Implementation of creating several work items through the $batch API.
+    
+    Items are created parents first. Items referencing a parent in the same
+    $batch call use its temporary ID; parents created by an earlier call are
+    referenced by their real ID.
+    
+    Args:
+        items: Items to create, see create_work_items
+        project: The project name or ID
+        wit_client: Work item tracking client
+        
+    Returns:
+        Summary table with the result for each item
+    """
+    try:
+        normalized = _normalize_batch_items(items)
+        order = _order_batch_items(normalized)
+    except ValueError as e:
+        return f"Error: {str(e)}"
+    
+    org_url = _get_organization_url()
+    results = [{"id": None, "status": "Not submitted"} for _ in normalized]
+    
+    for start in range(0, len(order), MAX_BATCH_REQUESTS):
+        chunk = order[start:start + MAX_BATCH_REQUESTS]
+        submitted = []
+        batch_requests = []
+        
+        for index in chunk:
+            item = normalized[index]
+            parent_index = item["parent_index"]
+            parent_id = item["parent_id"]
+            if parent_index is not None:
+                if results[parent_index]["id"] is not None:
+                    parent_id = results[parent_index]["id"]
+                elif parent_index in submitted:
+                    parent_id = -(parent_index + 1)
+                else:
+                    results[index]["status"] = "Skipped: parent failed"
+                    continue
             
-            # Update the work item to add the parent link
-            new_work_item = wit_client.update_work_item(
-                document=link_document,
-                id=new_work_item.id,
-                project=project
-            )
+            # A negative ID lets later requests in this call link to it
+            document = [{"op": "add", "path": "/id", "value": -(index + 1)}]
+            document.extend(_to_patch_json(
+                _build_field_document(item["fields"])))
+            document.extend(_to_patch_json(_build_relations_document(
+                org_url, parent_id, item["relations"])))
+            
+            batch_requests.append({
+                "method": "PATCH",
+                "uri": (f"/{quote(project)}/_apis/wit/workitems/"
+                        f"${quote(item['type'])}"
+                        f"?api-version={BATCH_API_VERSION}"),
+                "headers": {"Content-Type": "application/json-patch+json"},
+                "body": document,
+            })
+            submitted.append(index)
+        
+        if not batch_requests:
+            continue
+        
+        try:
+            responses = _send_work_item_batch(wit_client, batch_requests)
         except Exception as e:
-            return (f"Work item created successfully, but failed to establish "
-                   f"parent-child relationship: {str(e)}\n\n"
-                   f"{format_work_item(new_work_item)}")
+            for index in submitted:
+                results[index]["status"] = f"Failed: {str(e)}"
+            continue
+        
+        for index, (code, body) in zip(submitted, responses):
+            if 200 <= code < 300 and body.get("id"):
+                results[index] = {"id": body["id"], "status": "Created"}
+            else:
+                results[index]["status"] = f"Failed: {_get_batch_error(body)}"
     
-    # Format and return the created work item
-    return format_work_item(new_work_item)
+    return _format_batch_results(normalized, results)
 
 
 def _update_work_item_impl(
@@ -163,10 +492,112 @@ def _update_work_item_impl(
         id=id,
         project=project
     )
+    remember_work_item_projects([updated_work_item])
     
     return format_work_item(updated_work_item)
 
 
+def _build_update_fields(update: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Collect the fields to set for one entry of a bulk update.
+    
+    Args:
+        update: Update entry with optional standard field values and a
+            fields dictionary
+            
+    Returns:
+        Dictionary of field reference name/value pairs
+    """
+    fields = _prepare_standard_fields(
+        update.get("title"), update.get("description"), update.get("state"),
+        update.get("assigned_to"), update.get("iteration_path"),
+        update.get("area_path"), update.get("story_points"),
+        update.get("priority"), update.get("tags")
+    )
+    for field_name, field_value in (update.get("fields") or {}).items():
+        fields[_ensure_system_prefix(field_name)] = field_value
+    return fields
+
+
+def _update_work_items_impl(
+    updates: List[Dict[str, Any]],
+    wit_client: WorkItemTrackingClient,
+    max_parallel: Optional[int] = None,
+) -> str:
+    """
+    Implementation of updating several work items through the $batch API.
+    
+    Updates are split into up to max_parallel $batch calls (each with at most
+    MAX_BATCH_REQUESTS updates) that are sent concurrently.
+    
+    Args:
+        updates: List of updates, each with an id and the fields to set
+        wit_client: Work item tracking client
+        max_parallel: Maximum number of $batch calls in flight. Defaults to
+            the AZURE_DEVOPS_MAX_WORKERS environment variable.
+            
+    Returns:
+        Summary table with the new revision or error for each work item
+    """
+    if max_parallel is None:
+        max_parallel = int(os.environ.get("AZURE_DEVOPS_MAX_WORKERS",
+                                          DEFAULT_MAX_WORKERS))
+    max_parallel = max(1, max_parallel)
+    
+    batch_requests = []
+    for index, update in enumerate(updates):
+        if not update.get("id"):
+            return f"Error: Update {index + 1} has no id"
+        fields = _build_update_fields(update)
+        if not fields:
+            return (f"Error: Update {index + 1} (work item {update['id']}) "
+                    f"has no fields to update")
+        batch_requests.append({
+            "method": "PATCH",
+            "uri": (f"/_apis/wit/workitems/{int(update['id'])}"
+                    f"?api-version={BATCH_API_VERSION}"),
+            "headers": {"Content-Type": "application/json-patch+json"},
+            "body": _to_patch_json(_build_field_document(fields, "replace")),
+        })
+    
+    # Spread the updates over the allowed number of calls, since the
+    # server applies the requests inside one $batch call one after another
+    chunk_size = min(MAX_BATCH_REQUESTS,
+                     math.ceil(len(batch_requests) / max_parallel))
+    starts = range(0, len(batch_requests), chunk_size)
+    
+    def send(start: int) -> List[tuple[int, dict]]:
+        return _send_work_item_batch(
+            wit_client, batch_requests[start:start + chunk_size])
+    
+    results = []
+    with ThreadPoolExecutor(
+            max_workers=min(max_parallel, len(starts))) as executor:
+        futures = [executor.submit(send, start) for start in starts]
+        for start, future in zip(starts, futures):
+            chunk = updates[start:start + chunk_size]
+            try:
+                responses = future.result()
+            except Exception as e:
+                results.extend((update["id"], None, f"Failed: {str(e)}")
+                               for update in chunk)
+                continue
+            for update, (code, body) in zip(chunk, responses):
+                if 200 <= code < 300:
+                    results.append((update["id"], body.get("rev"), "Updated"))
+                else:
+                    results.append((update["id"], None,
+                                    f"Failed: {_get_batch_error(body)}"))
+    
+    updated = sum(1 for _, _, status in results if status == "Updated")
+    lines = [f"Updated {updated} of {len(updates)} work items.", "",
+             "| ID | Rev | Result |",
+             "| ---- | ---- | ---- |"]
+    for item_id, rev, status in results:
+        lines.append(f"| {item_id} | {rev or ''} | {status} |")
+    return "\n".join(lines)
+
+
 def _add_link_to_work_item_impl(
     source_id: int,
     target_id: int,
@@ -312,6 +743,7 @@ def register_tools(mcp) -> None:
     """
     
     @mcp.tool()
+    @async_tool
     def create_work_item(
         title: str,
         project: str,
@@ -326,6 +758,7 @@ def register_tools(mcp) -> None:
         story_points: Optional[float] = None,
         priority: Optional[int] = None,
         tags: Optional[str] = None,
+        relations: Optional[List[Dict[str, Any]]] = None,
     ) -> str:
         """
         Creates a new work item in Azure DevOps.
@@ -338,7 +771,8 @@ def register_tools(mcp) -> None:
         
         IMPORTANT: The work item will be created immediately and visible to all
         users with access to the specified project. It will also trigger any
-        configured notifications or automation rules.
+        configured notifications or automation rules. The parent link and
+        other relations are created in the same request as the work item.
         
         Args:
             title: The title of the work item
@@ -356,6 +790,10 @@ def register_tools(mcp) -> None:
             story_points: Optional story points value
             priority: Optional priority value
             tags: Optional tags as comma-separated string
+            relations: Optional list of links to other work items. Each is a
+                dictionary with a target_id and an optional link_type
+                reference name (e.g., "System.LinkTypes.Dependency-Forward",
+                default: "System.LinkTypes.Related")
             
         Returns:
             Formatted string containing the created work item details including
@@ -385,7 +823,8 @@ def register_tools(mcp) -> None:
                 project=project,
                 work_item_type=work_item_type,
                 wit_client=wit_client,
-                parent_id=parent_id
+                parent_id=parent_id,
+                relations=relations
             )
             
         except AzureDevOpsClientError as e:
@@ -395,6 +834,64 @@ def register_tools(mcp) -> None:
     
     
     @mcp.tool()
+    @async_tool
+    def create_work_items(
+        project: str,
+        items: List[Dict[str, Any]],
+    ) -> str:
+        """
+        Creates several work items at once, including their hierarchy.
+        
+        Use this tool when you need to:
+        - Break a feature or story down into many tasks in one step
+        - Create a whole hierarchy of epics, features, stories and tasks
+        - Import a list of bugs or requirements
+        
+        IMPORTANT: Items are submitted through the Azure DevOps $batch API,
+        up to 200 per request, instead of one request per item. Each item is
+        created independently, so some items may be created even if others
+        fail; check the result of each item. Items whose parent failed to be
+        created are skipped.
+        
+        Args:
+            project: The project name or ID where the work items will be
+                created
+            items: List of work items to create. Each item is a dictionary
+                with:
+                - work_item_type: Type of work item (required)
+                - title: Title of the work item (required)
+                - ref: Optional name other items can use to refer to this
+                  item as their parent
+                - parent_ref: Optional ref of another item in this list to
+                  use as the parent
+                - parent_id: Optional ID of an existing parent work item
+                - description, state, assigned_to, iteration_path,
+                  area_path, story_points, priority, tags: Optional
+                  standard field values
+                - fields: Optional dictionary of additional field name/value
+                  pairs
+                - relations: Optional list of links to existing work items,
+                  each with a target_id and an optional link_type
+                  
+        Returns:
+            Number of work items created, followed by a table with the ID
+            and result of each item
+        """
+        try:
+            if not items:
+                return "Error: At least one work item must be specified"
+            
+            wit_client = get_work_item_client()
+            return _create_work_items_impl(items, project, wit_client)
+        
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+        except Exception as e:
+            return f"Error creating work items: {str(e)}"
+    
+    
+    @mcp.tool()
+    @async_tool
     def update_work_item(
         id: int,
         fields: Optional[Dict[str, Any]] = None,
@@ -475,6 +972,56 @@ def register_tools(mcp) -> None:
     
     
     @mcp.tool()
+    @async_tool
+    def update_work_items(
+        updates: List[Dict[str, Any]],
+        max_parallel: Optional[int] = None,
+    ) -> str:
+        """
+        Modifies the fields of several work items at once.
+        
+        Use this tool when you need to:
+        - Move many work items to a new state
+        - Reassign a set of work items to another team member
+        - Move work items to a different iteration or area
+        - Apply the same or different field changes to many items
+        
+        IMPORTANT: Updates are submitted through the Azure DevOps $batch API
+        and applied immediately. Each work item is updated independently, so
+        some updates may succeed while others fail; check the result of each
+        item. The result is a compact summary rather than the full details
+        of every work item.
+        
+        Args:
+            updates: List of updates. Each is a dictionary with:
+                - id: ID of the work item to update (required)
+                - title, description, state, assigned_to, iteration_path,
+                  area_path, story_points, priority, tags: Optional new
+                  standard field values
+                - fields: Optional dictionary of other field name/value
+                  pairs to update
+            max_parallel: Optional maximum number of requests sent at once
+                (default: 4)
+                
+        Returns:
+            Number of work items updated, followed by a table with the new
+            revision or the error for each work item
+        """
+        try:
+            if not updates:
+                return "Error: At least one update must be specified"
+            
+            wit_client = get_work_item_client()
+            return _update_work_items_impl(updates, wit_client, max_parallel)
+        
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+        except Exception as e:
+            return f"Error updating work items: {str(e)}"
+    
+    
+    @mcp.tool()
+    @async_tool
     def add_parent_child_link(
         parent_id: int,
         child_id: int,
@@ -509,7 +1056,7 @@ def register_tools(mcp) -> None:
             return _add_link_to_work_item_impl(
                 source_id=child_id,
                 target_id=parent_id,
-                link_type="System.LinkTypes.Hierarchy-Reverse",
+                link_type=PARENT_LINK_TYPE,
                 wit_client=wit_client,
                 project=project
             )
@@ -0,0 +1,135 @@
+"""
+Mirror operations for Azure DevOps work items.
+
+This module provides MCP tools for syncing the local work item mirror and
+checking its status.
+"""
+from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
+from mcp_azure_devops.features.work_items.common import (
+    AzureDevOpsClientError,
+    get_work_item_client,
+)
+from mcp_azure_devops.features.work_items.mirror import get_mirror
+from mcp_azure_devops.utils.concurrency import async_tool
+
+_MIRROR_DISABLED = ("Error: The work item mirror is not enabled. Set "
+                    "AZURE_DEVOPS_MIRROR_PATH to the path of a SQLite "
+                    "database file to enable it.")
+
+
+def _sync_work_item_mirror_impl(
+    project: str,
+    wit_client: WorkItemTrackingClient,
+    full: bool = False
+) -> str:
+    """
+    Implementation of work item mirror sync.
+    
+    Args:
+        project: Project name
+        wit_client: Work item tracking client
+        full: Whether to re-read all work items instead of only changes
+        
+    Returns:
+        Summary of the sync
+    """
+    mirror = get_mirror()
+    if mirror is None:
+        return _MIRROR_DISABLED
+    
+    result = mirror.sync(wit_client, project, full)
+    if not result["recorded"]:
+        return (f"Error: No work items were read for project '{project}', "
+                "so it is not served from the mirror. Check the project "
+                "name and that the PAT can read its work items.")
+    
+    kind = "Full" if full else "Incremental"
+    return (f"{kind} sync of project '{project}' complete: "
+            f"{result['stored']} work items stored, {result['deleted']} "
+            f"removed, {result['batches']} batches read.")
+
+
+def _get_mirror_status_impl() -> str:
+    """
+    Implementation of work item mirror status retrieval.
+    
+    Returns:
+        Markdown table of mirrored projects
+    """
+    mirror = get_mirror()
+    if mirror is None:
+        return _MIRROR_DISABLED
+    
+    projects = mirror.status()
+    if not projects:
+        return "No projects have been synced into the work item mirror."
+    
+    result = [f"# Work Item Mirror ({mirror.path})",
+              f"Projects are served from the mirror for "
+              f"{mirror.max_age:g} seconds after a sync.", "",
+              "| Project | Work Items | Last Sync (s ago) | Fresh |",
+              "| ---- | ---- | ---- | ---- |"]
+    for project in projects:
+        result.append(f"| {project['project']} | {project['work_items']} | "
+                      f"{project['age']:.0f} | "
+                      f"{'Yes' if project['fresh'] else 'No'} |")
+    return "\n".join(result)
+
+
+def register_tools(mcp) -> None:
+    """
+    Register work item mirror tools with the MCP server.
+    
+    Args:
+        mcp: The FastMCP server instance
+    """
+    
+    @mcp.tool()
+    @async_tool
+    def sync_work_item_mirror(project: str, full: bool = False) -> str:
+        """
+        Syncs a project's work items into the local work item mirror.
+        
+        Use this tool when you need to:
+        - Start mirroring a project so reads can be served locally
+        - Bring a mirrored project up to date right away
+        
+        IMPORTANT: The mirror must be enabled with the
+        AZURE_DEVOPS_MIRROR_PATH environment variable. The first sync of a
+        project reads all of its work items and can take a while; later
+        syncs only read work items changed since the previous sync.
+        get_work_item and query_work_items read from the mirror when called
+        with use_mirror=True.
+        
+        Args:
+            project: The project name
+            full: Whether to discard mirrored data and re-read all work
+                items (default: False)
+                
+        Returns:
+            Number of work items stored and removed by the sync
+        """
+        try:
+            wit_client = get_work_item_client()
+            return _sync_work_item_mirror_impl(project, wit_client, full)
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+        except Exception as e:
+            return f"Error syncing work item mirror: {str(e)}"
+    
+    @mcp.tool()
+    @async_tool
+    def get_mirror_status() -> str:
+        """
+        Gets the sync status of the local work item mirror.
+        
+        Use this tool when you need to:
+        - See which projects are mirrored and how many work items they hold
+        - Check whether reads for a project are served from the mirror
+        
+        Returns:
+            A table of mirrored projects with their work item count, time
+            since the last sync and whether they are fresh
+        """
+        return _get_mirror_status_impl()
@@ -3,10 +3,17 @@ Process operations for Azure DevOps.
 
 This module provides MCP tools for retrieving process information.
 """
+from mcp_azure_devops.features.work_items.common import (
+    MetadataFailure,
+    get_cached_metadata,
+)
+from mcp_azure_devops.features.work_items.resolver import (
+    resolve_project_process,
+)
 from mcp_azure_devops.utils.azure_client import (
-    get_core_client,
     get_work_item_tracking_process_client,
 )
+from mcp_azure_devops.utils.concurrency import async_tool
 
 
 def _format_table(headers, rows):
@@ -21,27 +28,21 @@ def _format_table(headers, rows):
 def _get_project_process_id_impl(project: str) -> str:
     """Implementation of project process ID retrieval."""
     try:
-        # Get project details with process information
-        core_client = get_core_client()
-        project_details = core_client.get_project(
-            project, include_capabilities=True)
-        process_template = project_details.capabilities.get(
-            "processTemplate", {})
+        # Resolve the project process (memoized across tools)
+        process = resolve_project_process(project)
         
-        process_id = process_template.get("templateTypeId")
-        process_name = process_template.get("templateName")
-        
-        if not process_id:
-            return f"Could not determine process ID for project {project}."
+        if not process:
+            return MetadataFailure(
+                f"Could not determine process ID for project {project}.")
         
-        result = [f"# Process for Project: {project_details.name}"]
-        result.append(f"Process Name: {process_name}")
-        result.append(f"Process ID: {process_id}")
+        result = [f"# Process for Project: {process['project_name']}"]
+        result.append(f"Process Name: {process['process_name']}")
+        result.append(f"Process ID: {process['process_id']}")
         
         return "\n".join(result)
     except Exception as e:
-        return (f"Error retrieving process ID for project '{project}': "
-                f"{str(e)}")
+        return MetadataFailure(
+            f"Error retrieving process ID for project '{project}': {str(e)}")
 
 
 def _get_process_details_impl(process_id: str) -> str:
@@ -51,7 +52,8 @@ def _get_process_details_impl(process_id: str) -> str:
         process = process_client.get_process_by_its_id(process_id)
         
         if not process:
-            return f"Process with ID '{process_id}' not found."
+            return MetadataFailure(
+                f"Process with ID '{process_id}' not found.")
         
         result = [f"# Process: {process.name}"]
         
@@ -88,8 +90,9 @@ def _get_process_details_impl(process_id: str) -> str:
         
         return "\n".join(result)
     except Exception as e:
-        return (f"Error retrieving process details for process ID "
-                f"'{process_id}': {str(e)}")
+        return MetadataFailure(
+            "Error retrieving process details for process ID "
+            f"'{process_id}': {str(e)}")
 
 
 def _list_processes_impl() -> str:
@@ -99,7 +102,7 @@ def _list_processes_impl() -> str:
         processes = process_client.get_list_of_processes()
         
         if not processes:
-            return "No processes found in the organization."
+            return MetadataFailure("No processes found in the organization.")
         
         result = ["# Available Processes"]
         
@@ -118,7 +121,7 @@ def _list_processes_impl() -> str:
         result.append(_format_table(headers, rows))
         return "\n".join(result)
     except Exception as e:
-        return f"Error retrieving processes: {str(e)}"
+        return MetadataFailure(f"Error retrieving processes: {str(e)}")
 
 
 def register_tools(mcp) -> None:
@@ -130,6 +133,7 @@ def register_tools(mcp) -> None:
     """
     
     @mcp.tool()
+    @async_tool
     def get_project_process_id(project: str) -> str:
         """
         Gets the process ID associated with a project.
@@ -151,6 +155,7 @@ def register_tools(mcp) -> None:
             return f"Error: {str(e)}"
     
     @mcp.tool()
+    @async_tool
     def get_process_details(process_id: str) -> str:
         """
         Gets detailed information about a specific process.
@@ -168,11 +173,14 @@ def register_tools(mcp) -> None:
             available work item types
         """
         try:
-            return _get_process_details_impl(process_id)
+            return get_cached_metadata(
+                "process_details", [process_id],
+                lambda: _get_process_details_impl(process_id))
         except Exception as e:
             return f"Error: {str(e)}"
     
     @mcp.tool()
+    @async_tool
     def list_processes() -> str:
         """
         Lists all available processes in the organization.
@@ -187,6 +195,6 @@ def register_tools(mcp) -> None:
             descriptions
         """
         try:
-            return _list_processes_impl()
+            return get_cached_metadata("processes", [], _list_processes_impl)
         except Exception as e:
             return f"Error: {str(e)}"
@@ -3,52 +3,389 @@ Query operations for Azure DevOps work items.
 
 This module provides MCP tools for querying work items.
 """
-from typing import Optional
+import os
+import re
+import secrets
+import threading
+from typing import Callable, Optional
 
 from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 from azure.devops.v7_1.work_item_tracking.models import Wiql
+from mcp.server.fastmcp import Context
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
+    get_expand_and_fields,
     get_work_item_client,
+    get_work_items_batched,
+    remember_work_item_projects,
+)
+from mcp_azure_devops.features.work_items.formatting import (
+    OUTPUT_FORMATS,
+    format_work_items,
+)
+from mcp_azure_devops.features.work_items.mirror import (
+    WorkItemMirror,
+    get_mirror,
+)
+from mcp_azure_devops.features.work_items.wiql import (
+    WiqlNotSupportedError,
+    run_wiql_on_mirror,
+)
+from mcp_azure_devops.utils.azure_client import get_cache_scope
+from mcp_azure_devops.utils.cache import TTLCache
+from mcp_azure_devops.utils.concurrency import (
+    make_progress_callback,
+    run_blocking,
 )
-from mcp_azure_devops.features.work_items.formatting import format_work_item
 
+_SELECT_PATTERN = re.compile(r"\s*SELECT\s+(.*?)\s+FROM\s",
+                             re.IGNORECASE | re.DOTALL)
+
+# Paging state for query results, keyed by continuation token
+_cursors = TTLCache(ttl=900, max_entries=256)
+
+# Work items fetched for recent queries, keyed by organization, PAT,
+# projection and work item ID. The WIQL query itself always runs so results
+# match the current state; cached items are revalidated against their
+# current System.Rev before being reused.
+_item_cache = TTLCache(
+    ttl=float(os.environ.get("AZURE_DEVOPS_QUERY_CACHE_TTL", 300)),
+    max_entries=int(os.environ.get("AZURE_DEVOPS_QUERY_CACHE_SIZE", 5000)),
+)
+_revalidation_stats = {"revalidated": 0, "refetched": 0}
+_stats_lock = threading.Lock()
 
-def _query_work_items_impl(query: str, top: int, 
-                           wit_client: WorkItemTrackingClient) -> str:
+
+def _is_select_all(query: str) -> bool:
     """
-    Implementation of query_work_items that operates with a client.
+    Check whether a WIQL query selects all fields.
+    
+    Args:
+        query: The WIQL query string
+        
+    Returns:
+        True if the SELECT list is "*"
+    """
+    match = _SELECT_PATTERN.match(query)
+    return bool(match) and match.group(1).strip() == "*"
+
+
+def _get_selected_fields(query: str, wiql_result) -> Optional[list[str]]:
+    """
+    Get the field reference names from the WIQL SELECT list.
+    
+    Args:
+        query: The WIQL query string
+        wiql_result: Result of query_by_wiql
+        
+    Returns:
+        List of field reference names, or None if all fields were selected
+    """
+    if _is_select_all(query):
+        return None
+    
+    columns = getattr(wiql_result, "columns", None) or []
+    selected = [column.reference_name for column in columns
+                if getattr(column, "reference_name", None)]
+    return selected or None
+
+
+def _run_wiql(
+    query: str,
+    top: int,
+    wit_client: WorkItemTrackingClient
+) -> tuple[list[int], Optional[list[str]]]:
+    """
+    Run a WIQL query and return the matching IDs.
     
     Args:
         query: The WIQL query string
         top: Maximum number of results to return
         wit_client: Work item tracking client
-            
+        
     Returns:
-        Formatted string containing work item details
+        Tuple of (work item IDs in query order, fields in the SELECT list
+        or None for all fields)
     """
-    
     # Create the WIQL query
     wiql = Wiql(query=query)
     
     # Execute the query
-    wiql_results = wit_client.query_by_wiql(wiql, top=top).work_items
+    wiql_result = wit_client.query_by_wiql(wiql, top=top)
+    work_item_ids = [int(res.id) for res in wiql_result.work_items or []]
+    
+    return work_item_ids, _get_selected_fields(query, wiql_result)
+
+
+def _run_wiql_locally(
+    query: str,
+    top: int,
+    wit_client: WorkItemTrackingClient
+) -> Optional[tuple[list[int], Optional[list[str]]]]:
+    """
+    Run a WIQL query against the local mirror if possible.
+    
+    Args:
+        query: The WIQL query string
+        top: Maximum number of results to return
+        wit_client: Work item tracking client used to sync a stale project
+        
+    Returns:
+        Tuple of (work item IDs in query order, fields in the SELECT list or
+        None for all fields), or None if the query must run on the server
+    """
+    mirror = get_mirror()
+    if mirror is None:
+        return None
+    try:
+        return run_wiql_on_mirror(mirror, query, top, wit_client)
+    except WiqlNotSupportedError:
+        return None
+
+
+def find_work_item_ids(
+    query: str,
+    top: int,
+    wit_client: WorkItemTrackingClient,
+    use_mirror: bool = False
+) -> list[int]:
+    """
+    Get the IDs of the work items matching a WIQL query.
+    
+    Args:
+        query: The WIQL query string
+        top: Maximum number of results to return
+        wit_client: Work item tracking client
+        use_mirror: Whether to evaluate the query against the local mirror
+            when it is supported there
+            
+    Returns:
+        Work item IDs in query order
+    """
+    local_result = (_run_wiql_locally(query, top, wit_client)
+                    if use_mirror else None)
+    return (local_result or _run_wiql(query, top, wit_client))[0]
+
+
+def _item_cache_prefix(
+    fields: Optional[list[str]],
+    relations: bool
+) -> str:
+    """
+    Build the item cache key prefix for a projection.
     
-    if not wiql_results:
-        return "No work items found matching the query."
+    Args:
+        fields: Explicitly requested fields, if any
+        relations: Whether relations are included
+        
+    Returns:
+        Key prefix identifying the organization, PAT and projection, with
+        case differences normalized away
+    """
+    projection = ",".join(sorted(f.lower() for f in fields)) if fields else "*"
+    return f"{get_cache_scope(include_pat=True)}|{projection}|{relations}"
+
+
+def _get_page_work_items(
+    page_ids: list[int],
+    wit_client: WorkItemTrackingClient,
+    expand: Optional[str],
+    request_fields: Optional[list[str]],
+    cache_prefix: str,
+    use_cache: bool = True,
+    progress: Optional[Callable[[int, int], None]] = None,
+    mirror: Optional[WorkItemMirror] = None
+) -> tuple[list, list[str]]:
+    """
+    Get work items for a page, reusing cached items that are unchanged.
+    
+    Items found in a fresh project of the mirror are read locally. Cached
+    items are checked by fetching only their System.Rev; items whose
+    revision changed, and items not cached yet, are fetched in full and
+    cached.
+    
+    Args:
+        page_ids: Work item IDs for the page in query order
+        wit_client: Work item tracking client
+        expand: Expand parameter for full fetches
+        request_fields: Fields parameter for full fetches
+        cache_prefix: Item cache key prefix of the projection
+        use_cache: Whether to reuse cached items
+        progress: Optional progress callback for full fetches
+        mirror: Optional work item mirror to read items from first
+        
+    Returns:
+        Tuple of (work items in page order, error messages)
+    """
+    mirrored = mirror.get_work_items(page_ids, wit_client) if mirror else {}
+    items = {}
+    stale_ids = []
+    for item_id in page_ids:
+        if item_id in mirrored:
+            continue
+        cached = _item_cache.get(f"{cache_prefix}|{item_id}") \
+            if use_cache else None
+        if cached is None:
+            stale_ids.append(item_id)
+        else:
+            items[item_id] = cached
+    errors = []
     
-    # Get the work items from the results
-    work_item_ids = [int(res.id) for res in wiql_results]
-    work_items = wit_client.get_work_items(ids=work_item_ids,
-                                           expand="all",
-                                           error_policy="omit")
+    cached_count = len(items)
+    if items:
+        revisions, errors = get_work_items_batched(
+            wit_client, list(items), fields=["System.Rev"])
+        current_revs = {work_item.id: work_item.rev
+                        for work_item in revisions}
+        changed = 0
+        for item_id in list(items):
+            if item_id not in current_revs:
+                # Deleted or inaccessible now; drop it from the results
+                del items[item_id]
+            elif current_revs[item_id] != items[item_id].rev:
+                stale_ids.append(item_id)
+                changed += 1
+        with _stats_lock:
+            _revalidation_stats["revalidated"] += cached_count
+            _revalidation_stats["refetched"] += changed
     
-    # Use the standard formatting for all work items
+    if stale_ids:
+        work_items, fetch_errors = get_work_items_batched(
+            wit_client, stale_ids, expand=expand, fields=request_fields,
+            progress=progress)
+        errors.extend(fetch_errors)
+        remember_work_item_projects(work_items)
+        for work_item in work_items:
+            items[work_item.id] = work_item
+            _item_cache.set(f"{cache_prefix}|{work_item.id}", work_item)
+    
+    items.update(mirrored)
+    return [items[item_id] for item_id in page_ids if item_id in items], errors
+
+
+def get_query_cache_stats() -> dict:
+    """
+    Get query result cache statistics.
+    
+    Returns:
+        Dictionary with hits, misses, cached work items, and the number of
+        cached work items revalidated and refetched
+    """
+    stats = _item_cache.stats()
+    with _stats_lock:
+        stats.update(_revalidation_stats)
+    return stats
+
+
+def _query_work_items_impl(
+    query: Optional[str],
+    top: int,
+    wit_client: WorkItemTrackingClient,
+    fields: Optional[list[str]] = None,
+    relations: bool = False,
+    page_size: Optional[int] = None,
+    continuation_token: Optional[str] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    output_format: str = "markdown",
+    use_cache: bool = True,
+    use_mirror: bool = False
+) -> str:
+    """
+    Implementation of query_work_items that operates with a client.
+    
+    Args:
+        query: The WIQL query string. Only needed without a continuation
+            token.
+        top: Maximum number of results to return
+        wit_client: Work item tracking client
+        fields: Optional list of field reference names to retrieve. Defaults
+            to the fields in the WIQL SELECT list.
+        relations: Whether to include relations and links
+        page_size: Optional number of work items to return per page
+        continuation_token: Token returned by a previous page. When given,
+            the query, fields and relations of that page are reused.
+        progress: Optional callback called with (items fetched, total) as
+            batches complete
+        output_format: "markdown", "table" or "jsonl"
+        use_cache: Whether to reuse recently fetched work items that have
+            not changed since
+        use_mirror: Whether to evaluate the query against the local mirror
+            when it is supported there, and read work items from the mirror
+            when their project is fresh (only without relations)
+            
+    Returns:
+        Formatted string containing work item details
+    """
+    if page_size is not None and page_size < 1:
+        return "Error: page_size must be positive"
+    
+    if continuation_token:
+        cursor = _cursors.get(continuation_token)
+        if cursor is None:
+            return ("Error: Continuation token is invalid or has expired. "
+                    "Run the query again.")
+        work_item_ids = cursor["ids"]
+        offset = cursor["offset"]
+        fields = cursor["fields"]
+        relations = cursor["relations"]
+        page_size = cursor["page_size"]
+        output_format = cursor["output_format"]
+        use_cache = cursor["use_cache"]
+        use_mirror = cursor["use_mirror"]
+    elif not query:
+        return "Error: Either a query or a continuation token is required."
+    else:
+        # The IDs are always queried so the results match the current state
+        local_result = (_run_wiql_locally(query, top, wit_client)
+                        if use_mirror else None)
+        work_item_ids, selected_fields = (
+            local_result or _run_wiql(query, top, wit_client))
+        offset = 0
+        
+        if not work_item_ids:
+            return "No work items found matching the query."
+        
+        # Only retrieve the fields that were asked for
+        if fields is None:
+            fields = selected_fields
+    
+    expand, request_fields = get_expand_and_fields(fields, relations)
+    mirror = get_mirror() if use_mirror and not relations else None
+    
+    # Get the work items for this page, reusing unchanged cached items
+    end = offset + page_size if page_size else len(work_item_ids)
+    page_ids = work_item_ids[offset:end]
+    work_items, errors = _get_page_work_items(
+        page_ids, wit_client, expand, request_fields,
+        _item_cache_prefix(fields, relations), use_cache, progress, mirror)
+    
+    # Format all work items in the requested output format
     formatted_results = []
-    for work_item in work_items:
-        if work_item:
-            formatted_results.append(format_work_item(work_item))
+    if work_items:
+        formatted_results.append(
+            format_work_items(work_items, output_format, fields))
+    
+    # Report failed batches after whatever could be retrieved
+    formatted_results.extend(errors)
+    
+    # Hand out a token for the next page if there is one
+    if end < len(work_item_ids):
+        next_token = secrets.token_urlsafe(16)
+        _cursors.set(next_token, {
+            "ids": work_item_ids,
+            "offset": end,
+            "fields": fields,
+            "relations": relations,
+            "page_size": page_size,
+            "output_format": output_format,
+            "use_cache": use_cache,
+            "use_mirror": use_mirror,
+        })
+        formatted_results.append(
+            f"---\nShowing items {offset + 1}-{end} of "
+            f"{len(work_item_ids)}. More results are available: call "
+            f"query_work_items with continuation_token=\"{next_token}\"")
     
     return "\n\n".join(formatted_results)
 
@@ -61,7 +398,18 @@ def register_tools(mcp) -> None:
     """
     
     @mcp.tool()
-    def query_work_items(query: str, top: Optional[int] = None) -> str:
+    async def query_work_items(
+        query: Optional[str] = None,
+        top: Optional[int] = None,
+        fields: Optional[list[str]] = None,
+        relations: bool = False,
+        page_size: Optional[int] = None,
+        continuation_token: Optional[str] = None,
+        output_format: str = "markdown",
+        use_cache: bool = True,
+        use_mirror: bool = False,
+        ctx: Context = None
+    ) -> str:
         """
         Searches for work items using Work Item Query Language (WIQL).
         
@@ -77,15 +425,47 @@ def register_tools(mcp) -> None:
         
         Args:
             query: The WIQL query string (e.g., "SELECT * FROM workitems 
-                WHERE [System.State] = 'Active'")
+                WHERE [System.State] = 'Active'"). Not needed when a
+                continuation_token is given.
             top: Maximum number of results to return (default: 30)
+            fields: Optional list of field reference names to return.
+                Defaults to the fields in the SELECT list, or all fields
+                for "SELECT *".
+            relations: Whether to include related items and links
+                (default: False)
+            page_size: Optional number of work items per page. When more
+                results remain, the output ends with a continuation token.
+            continuation_token: Token from a previous page to fetch the next
+                page. The original query and its settings are reused.
+            output_format: "markdown" for full details (default), "table"
+                for one compact row per work item, or "jsonl" for one JSON
+                object per line. Use "table" for large result sets.
+            use_cache: Whether to reuse recently fetched work items
+                (default: True). The query always runs; cached items are
+                checked against their current revision and only changed
+                items are re-downloaded.
+            use_mirror: Whether to answer from the local work item mirror
+                when it is enabled and recently synced (default: False).
+                Queries limited to one mirrored project with
+                [System.TeamProject] = '...' that use only =, <>, <, >, <=,
+                >=, IN, CONTAINS, UNDER, @Me, @Today and ORDER BY run
+                locally; other queries run on the server. Work items are
+                read from the mirror only with relations=False.
                 
         Returns:
             Formatted string containing detailed information for each matching
-            work item, with all fields and values formatted as markdown
+            work item, with the selected fields and values formatted as
+            markdown, followed by a continuation token when more pages remain
         """
+        if output_format not in OUTPUT_FORMATS:
+            return (f"Error: Unknown output format '{output_format}'. Valid "
+                    f"formats are: {', '.join(OUTPUT_FORMATS)}")
         try:
             wit_client = get_work_item_client()
-            return _query_work_items_impl(query, top or 30, wit_client)
+            return await run_blocking(
+                _query_work_items_impl, query, top or 30, wit_client,
+                fields, relations, page_size, continuation_token,
+                make_progress_callback(ctx), output_format, use_cache,
+                use_mirror)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
@@ -3,49 +3,86 @@ Read operations for Azure DevOps work items.
 
 This module provides MCP tools for retrieving work item information.
 """
+from typing import Optional
+
 from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
+    get_expand_and_fields,
     get_work_item_client,
+    get_work_items_batched,
+    remember_work_item_projects,
+)
+from mcp_azure_devops.features.work_items.formatting import (
+    OUTPUT_FORMATS,
+    format_work_items,
 )
-from mcp_azure_devops.features.work_items.formatting import format_work_item
+from mcp_azure_devops.features.work_items.mirror import get_mirror
+from mcp_azure_devops.utils.concurrency import async_tool
 
 
 def _get_work_item_impl(item_id: int | list[int], 
-                        wit_client: WorkItemTrackingClient) -> str:
+                        wit_client: WorkItemTrackingClient,
+                        fields: Optional[list[str]] = None,
+                        relations: bool = True,
+                        output_format: str = "markdown",
+                        use_mirror: bool = False) -> str:
     """
     Implementation of work item retrieval.
     
     Args:
         item_id: The work item ID or list of IDs
         wit_client: Work item tracking client
+        fields: Optional list of field reference names to retrieve
+        relations: Whether to include relations and links
+        output_format: "markdown", "table" or "jsonl"
+        use_mirror: Whether to read work items from the local mirror when
+            their project is fresh there. The mirror has no relations, so it
+            is only used when relations is False.
             
     Returns:
         Formatted string containing work item information
     """
+    expand, request_fields = get_expand_and_fields(fields, relations)
+    mirror = get_mirror() if use_mirror and not relations else None
     try:
         if isinstance(item_id, int):
             # Handle single work item
-            work_item = wit_client.get_work_item(item_id, expand="all")
-            return format_work_item(work_item)
+            mirrored = (mirror.get_work_items([item_id], wit_client)
+                        if mirror else {})
+            if item_id in mirrored:
+                return format_work_items([mirrored[item_id]], output_format,
+                                         fields)
+            
+            work_item = wit_client.get_work_item(item_id,
+                                                 fields=request_fields,
+                                                 expand=expand)
+            remember_work_item_projects([work_item])
+            return format_work_items([work_item], output_format, fields)
         else:
-            # Handle list of work items
-            work_items = wit_client.get_work_items(ids=item_id,
-                                                   error_policy="omit",
-                                                   expand="all")
+            # Handle list of work items, fetching those not mirrored
+            mirrored = (mirror.get_work_items(item_id, wit_client)
+                        if mirror else {})
+            missing = [i for i in item_id if i not in mirrored]
+            fetched, errors = (get_work_items_batched(
+                wit_client, missing, expand=expand, fields=request_fields)
+                if missing else ([], []))
+            remember_work_item_projects(fetched)
             
-            if not work_items:
+            by_id = dict(mirrored)
+            by_id.update((work_item.id, work_item) for work_item in fetched)
+            work_items = [by_id[i] for i in item_id if i in by_id]
+            
+            if not work_items and not errors:
                 return "No work items found."
                 
             formatted_results = []
-            for work_item in work_items:
-                if work_item:  # Skip None values (failed retrievals)
-                    formatted_results.append(format_work_item(work_item))
+            if work_items:
+                formatted_results.append(
+                    format_work_items(work_items, output_format, fields))
             
-            if not formatted_results:
-                return "No valid work items found with the provided IDs."
-                
+            formatted_results.extend(errors)
             return "\n\n".join(formatted_results)
     except Exception as e:
         if isinstance(item_id, int):
@@ -62,7 +99,14 @@ def register_tools(mcp) -> None:
     """
     
     @mcp.tool()
-    def get_work_item(id: int | list[int]) -> str:
+    @async_tool
+    def get_work_item(
+        id: int | list[int],
+        fields: Optional[list[str]] = None,
+        relations: bool = True,
+        output_format: str = "markdown",
+        use_mirror: bool = False
+    ) -> str:
         """
         Retrieves detailed information about one or multiple work items.
         
@@ -74,14 +118,31 @@ def register_tools(mcp) -> None:
         
         Args:
             id: The work item ID or a list of work item IDs
+            fields: Optional list of field reference names to return (e.g.,
+                ["System.Title", "System.State", "System.AssignedTo"]).
+                All fields are returned when omitted.
+            relations: Whether to include related items and links
+                (default: True)
+            output_format: "markdown" for full details (default), "table"
+                for one compact row per work item, or "jsonl" for one JSON
+                object per line
+            use_mirror: Whether to answer from the local work item mirror
+                when it is enabled and recently synced (default: False).
+                Only used with relations=False, since the mirror stores no
+                links. Items not in the mirror are retrieved as usual.
             
         Returns:
             Formatted string containing comprehensive information for the
-            requested work item(s), including all system and custom fields,
-            formatted as markdown with clear section headings
+            requested work item(s), including all system and custom fields
+            (or only the requested ones), formatted as markdown with clear
+            section headings
         """
+        if output_format not in OUTPUT_FORMATS:
+            return (f"Error: Unknown output format '{output_format}'. Valid "
+                    f"formats are: {', '.join(OUTPUT_FORMATS)}")
         try:
             wit_client = get_work_item_client()
-            return _get_work_item_impl(id, wit_client)
+            return _get_work_item_impl(id, wit_client, fields, relations,
+                                       output_format, use_mirror)
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
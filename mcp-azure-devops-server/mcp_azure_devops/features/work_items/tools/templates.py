@@ -9,8 +9,11 @@ from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
+    MetadataFailure,
+    get_cached_metadata,
     get_work_item_client,
 )
+from mcp_azure_devops.utils.concurrency import async_tool
 
 
 def _format_table(headers, rows):
@@ -66,7 +69,8 @@ def _get_work_item_templates_impl(
         if not templates:
             scope = (f"work item type '{work_item_type}' in " 
                     if work_item_type else "")
-            return f"No templates found for {scope}team {team_display}."
+            return MetadataFailure(
+                f"No templates found for {scope}team {team_display}.")
         
         # Create header
         project_display = (team_context.get('project') or 
@@ -88,7 +92,7 @@ def _get_work_item_templates_impl(
         
         return f"{header}\n\n" + _format_table(headers, rows)
     except Exception as e:
-        return f"Error retrieving templates: {str(e)}"
+        return MetadataFailure(f"Error retrieving templates: {str(e)}")
 
 
 def _get_work_item_template_impl(team_context: dict, template_id: str,
@@ -99,11 +103,13 @@ def _get_work_item_template_impl(team_context: dict, template_id: str,
         template = wit_client.get_template(team_ctx, template_id)
         
         if not template:
-            return f"Template with ID '{template_id}' not found."
+            return MetadataFailure(
+                f"Template with ID '{template_id}' not found.")
         
         return _format_work_item_template(template)
     except Exception as e:
-        return f"Error retrieving template '{template_id}': {str(e)}"
+        return MetadataFailure(
+            f"Error retrieving template '{template_id}': {str(e)}")
 
 
 def register_tools(mcp) -> None:
@@ -115,6 +121,7 @@ def register_tools(mcp) -> None:
     """
     
     @mcp.tool()
+    @async_tool
     def get_work_item_templates(
         team_context: dict, 
         work_item_type: Optional[str]
@@ -141,12 +148,17 @@ def register_tools(mcp) -> None:
         """
         try:
             wit_client = get_work_item_client()
-            return _get_work_item_templates_impl(
-                team_context, work_item_type, wit_client)
+            key_parts = [team_context.get(key) for key in
+                         ("project", "project_id", "team", "team_id")]
+            return get_cached_metadata(
+                "work_item_templates", key_parts + [work_item_type],
+                lambda: _get_work_item_templates_impl(
+                    team_context, work_item_type, wit_client))
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
     
     @mcp.tool()
+    @async_tool
     def get_work_item_template(team_context: dict, template_id: str) -> str:
         """
         Gets detailed information about a specific work item template.
@@ -0,0 +1,212 @@
+"""
+Hierarchy operations for Azure DevOps work items.
+
+This module provides MCP tools for walking work item hierarchies.
+"""
+from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+from mcp_azure_devops.features.work_items.common import (
+    AzureDevOpsClientError,
+    get_work_item_client,
+    get_work_items_batched,
+    remember_work_item_projects,
+)
+from mcp_azure_devops.utils.concurrency import async_tool
+
+# Link type from a parent work item to its children
+CHILD_LINK_TYPE = "System.LinkTypes.Hierarchy-Forward"
+
+# Limits protecting against very large hierarchies
+MAX_TREE_DEPTH = 10
+DEFAULT_MAX_TREE_ITEMS = 500
+
+
+def _get_child_ids(work_item: WorkItem) -> list[int]:
+    """
+    Get the IDs of a work item's children from its relations.
+    
+    Args:
+        work_item: Work item retrieved with relations
+        
+    Returns:
+        List of child work item IDs
+    """
+    child_ids = []
+    for relation in work_item.relations or []:
+        if relation.rel == CHILD_LINK_TYPE and relation.url:
+            try:
+                child_ids.append(int(relation.url.rstrip("/").split("/")[-1]))
+            except ValueError:
+                continue
+    return child_ids
+
+
+def _format_tree_node(work_item: WorkItem) -> str:
+    """
+    Format a work item as a compact tree line.
+    
+    Args:
+        work_item: Work item to format
+        
+    Returns:
+        Line with ID, type, title, state and assignee
+    """
+    fields = work_item.fields or {}
+    details = [str(fields.get("System.State", "Unknown"))]
+    assigned_to = fields.get("System.AssignedTo")
+    if isinstance(assigned_to, dict):
+        assigned_to = assigned_to.get("displayName")
+    if assigned_to:
+        details.append(str(assigned_to))
+    
+    return (f"#{work_item.id} [{fields.get('System.WorkItemType', '?')}] "
+            f"{fields.get('System.Title', '')} ({', '.join(details)})")
+
+
+def _get_work_item_tree_impl(
+    root_ids: list[int],
+    wit_client: WorkItemTrackingClient,
+    max_depth: int = 3,
+    max_items: int = DEFAULT_MAX_TREE_ITEMS
+) -> str:
+    """
+    Implementation of work item hierarchy retrieval.
+    
+    The hierarchy is walked breadth first. All work items of a level are
+    retrieved together with their relations in batched requests, and the
+    child links found on them make up the next level.
+    
+    Args:
+        root_ids: IDs of the work items at the top of the tree
+        wit_client: Work item tracking client
+        max_depth: Number of levels below the roots to retrieve
+        max_items: Maximum number of work items to retrieve
+        
+    Returns:
+        Indented tree of work items
+    """
+    max_depth = max(0, min(max_depth, MAX_TREE_DEPTH))
+    
+    items = {}
+    children = {}
+    seen = set(root_ids)
+    errors = []
+    level_ids = list(dict.fromkeys(root_ids))
+    depth = 0
+    truncated = False
+    
+    while level_ids:
+        work_items, level_errors = get_work_items_batched(
+            wit_client, level_ids, expand="relations")
+        errors.extend(level_errors)
+        remember_work_item_projects(work_items)
+        
+        next_ids = []
+        for work_item in work_items:
+            items[work_item.id] = work_item
+            children[work_item.id] = _get_child_ids(work_item)
+            if depth >= max_depth:
+                continue
+            for child_id in children[work_item.id]:
+                # Skip items already reached through another path
+                if child_id in seen:
+                    continue
+                if len(seen) >= max_items:
+                    truncated = True
+                    break
+                seen.add(child_id)
+                next_ids.append(child_id)
+        
+        level_ids = next_ids
+        depth += 1
+    
+    lines = []
+    shown = set()
+    
+    def render(item_id: int, level: int) -> None:
+        indent = "  " * level
+        if item_id in shown:
+            lines.append(f"{indent}- #{item_id} (already shown above)")
+            return
+        work_item = items.get(item_id)
+        if work_item is None:
+            lines.append(f"{indent}- #{item_id} (not retrieved)")
+            return
+        
+        shown.add(item_id)
+        lines.append(f"{indent}- {_format_tree_node(work_item)}")
+        child_ids = children.get(item_id, [])
+        if level >= max_depth:
+            if child_ids:
+                lines.append(f"{indent}  - ... {len(child_ids)} more "
+                             f"children (max depth reached)")
+            return
+        for child_id in child_ids:
+            if child_id in seen:
+                render(child_id, level + 1)
+            elif truncated:
+                lines.append(f"{indent}  - #{child_id} (item limit reached)")
+    
+    for root_id in dict.fromkeys(root_ids):
+        render(root_id, 0)
+    
+    result = [f"# Work Item Tree ({len(items)} work items)", ""]
+    result.extend(lines)
+    if truncated:
+        result.append(f"\nStopped after {max_items} work items. Use a lower "
+                      f"max_depth or start from a lower-level work item.")
+    if errors:
+        result.append("")
+        result.extend(errors)
+    return "\n".join(result)
+
+
+def register_tools(mcp) -> None:
+    """
+    Register work item hierarchy tools with the MCP server.
+    
+    Args:
+        mcp: The FastMCP server instance
+    """
+    
+    @mcp.tool()
+    @async_tool
+    def get_work_item_tree(
+        id: int | list[int],
+        max_depth: int = 3,
+        max_items: int = DEFAULT_MAX_TREE_ITEMS
+    ) -> str:
+        """
+        Retrieves the hierarchy of child work items below a work item.
+        
+        Use this tool when you need to:
+        - See the full breakdown of an epic or feature
+        - Find all tasks under a user story
+        - Review the state and ownership of everything below a work item
+        
+        IMPORTANT: Each level of the hierarchy is retrieved with one batched
+        request, so whole trees are much cheaper to get with this tool than
+        by calling get_work_item for each child.
+        
+        Args:
+            id: The ID of the work item at the top of the tree, or a list
+                of IDs
+            max_depth: Number of levels below the top work item to retrieve
+                (default: 3, maximum: 10)
+            max_items: Maximum number of work items to retrieve
+                (default: 500)
+                
+        Returns:
+            Indented tree with one line per work item showing its ID, type,
+            title, state and assignee
+        """
+        try:
+            wit_client = get_work_item_client()
+            root_ids = id if isinstance(id, list) else [id]
+            return _get_work_item_tree_impl(root_ids, wit_client, max_depth,
+                                            max_items)
+        except AzureDevOpsClientError as e:
+            return f"Error: {str(e)}"
+        except Exception as e:
+            return f"Error retrieving work item tree: {str(e)}"
@@ -7,12 +7,18 @@ from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 
 from mcp_azure_devops.features.work_items.common import (
     AzureDevOpsClientError,
+    MetadataFailure,
+    get_cached_metadata,
     get_work_item_client,
 )
+from mcp_azure_devops.features.work_items.resolver import (
+    resolve_project_process,
+    resolve_work_item_type_reference,
+)
 from mcp_azure_devops.utils.azure_client import (
-    get_core_client,
     get_work_item_tracking_process_client,
 )
+from mcp_azure_devops.utils.concurrency import async_tool
 
 
 def _format_table(headers, rows):
@@ -63,7 +69,8 @@ def _get_work_item_types_impl(
     work_item_types = wit_client.get_work_item_types(project)
     
     if not work_item_types:
-        return f"No work item types found in project {project}."
+        return MetadataFailure(
+            f"No work item types found in project {project}.")
     
     headers = ["Name", "Reference Name", "Description"]
     
@@ -84,7 +91,8 @@ def _get_work_item_type_impl(project: str, type_name: str,
     work_item_type = wit_client.get_work_item_type(project, type_name)
     
     if not work_item_type:
-        return f"Work item type '{type_name}' not found in project {project}."
+        return MetadataFailure(
+            f"Work item type '{type_name}' not found in project {project}.")
     
     return _format_work_item_type(work_item_type)
 
@@ -93,23 +101,20 @@ def _get_work_item_type_fields_impl(project: str, type_name: str,
                                    wit_client: WorkItemTrackingClient) -> str:
     """Implementation of work item type fields retrieval using process API."""
     try:
-        # Get the work item type to get its reference name
-        wit = wit_client.get_work_item_type(project, type_name)
-        if not wit:
-            return (f"Work item type '{type_name}' not found in "
-                    f"project {project}.")
-        
-        wit_ref_name = wit.reference_name
+        # Resolve the work item type reference name and project process
+        wit_ref_name = resolve_work_item_type_reference(
+            project, type_name, wit_client)
+        if not wit_ref_name:
+            return MetadataFailure(
+                f"Work item type '{type_name}' not found in project "
+                f"{project}.")
         
-        # Get project process info
-        core_client = get_core_client()
-        project_details = core_client.get_project(
-            project, include_capabilities=True)
-        process_id = project_details.capabilities.get(
-            "processTemplate", {}).get("templateTypeId")
+        process = resolve_project_process(project)
+        process_id = process["process_id"] if process else None
         
         if not process_id:
-            return f"Could not determine process ID for project {project}"
+            return MetadataFailure(
+                f"Could not determine process ID for project {project}")
         
         # Get process client and fields for this work item type
         process_client = get_work_item_tracking_process_client()
@@ -117,8 +122,9 @@ def _get_work_item_type_fields_impl(project: str, type_name: str,
             process_id, wit_ref_name)
         
         if not fields:
-            return (f"No fields found for work item type '{type_name}' "
-                   f"in project {project}.")
+            return MetadataFailure(
+                f"No fields found for work item type '{type_name}' in "
+                f"project {project}.")
         
         headers = ["Name", "Reference Name", "Type", "Required", "Read Only"]
         
@@ -134,8 +140,9 @@ def _get_work_item_type_fields_impl(project: str, type_name: str,
         return (f"# Fields for Work Item Type: {type_name}\n\n" + 
                 _format_table(headers, rows))
     except Exception as e:
-        return (f"Error retrieving fields for work item type '{type_name}' "
-                f"in project '{project}': {str(e)}")
+        return MetadataFailure(
+            f"Error retrieving fields for work item type '{type_name}' in "
+            f"project '{project}': {str(e)}")
 
 
 def _get_work_item_type_field_impl(
@@ -147,23 +154,20 @@ def _get_work_item_type_field_impl(
     """Implementation of work item type field detail retrieval using process
     API."""
     try:
-        # Get the work item type to get its reference name
-        wit = wit_client.get_work_item_type(project, type_name)
-        if not wit:
-            return (f"Work item type '{type_name}' not found in "
-                    f"project {project}.")
-        
-        wit_ref_name = wit.reference_name
+        # Resolve the work item type reference name and project process
+        wit_ref_name = resolve_work_item_type_reference(
+            project, type_name, wit_client)
+        if not wit_ref_name:
+            return MetadataFailure(
+                f"Work item type '{type_name}' not found in project "
+                f"{project}.")
         
-        # Get project process info
-        core_client = get_core_client()
-        project_details = core_client.get_project(
-            project, include_capabilities=True)
-        process_id = project_details.capabilities.get(
-            "processTemplate", {}).get("templateTypeId")
+        process = resolve_project_process(project)
+        process_id = process["process_id"] if process else None
         
         if not process_id:
-            return f"Could not determine process ID for project {project}"
+            return MetadataFailure(
+                f"Could not determine process ID for project {project}")
         
         # Get process client and field details
         process_client = get_work_item_tracking_process_client()
@@ -176,16 +180,18 @@ def _get_work_item_type_field_impl(
             field_ref = next((f.reference_name for f in all_fields 
                              if f.name.lower() == field_name.lower()), None)
             if not field_ref:
-                return (f"Field '{field_name}' not found for work item type "
-                        f"'{type_name}' in project '{project}'.")
+                return MetadataFailure(
+                    f"Field '{field_name}' not found for work item type "
+                    f"'{type_name}' in project '{project}'.")
             field_name = field_ref
         
         field = process_client.get_work_item_type_field(
             process_id, wit_ref_name, field_name)
         
         if not field:
-            return (f"Field '{field_name}' not found for work item type "
-                    f"'{type_name}' in project '{project}'.")
+            return MetadataFailure(
+                f"Field '{field_name}' not found for work item type "
+                f"'{type_name}' in project '{project}'.")
         
         # Format field details
         result = [f"# Field: {field.name}"]
@@ -214,8 +220,9 @@ def _get_work_item_type_field_impl(
         
         return "\n".join(result)
     except Exception as e:
-        return (f"Error retrieving field '{field_name}' for work item type "
-                f"'{type_name}' in project '{project}': {str(e)}")
+        return MetadataFailure(
+            f"Error retrieving field '{field_name}' for work item type "
+            f"'{type_name}' in project '{project}': {str(e)}")
 
 
 def register_tools(mcp) -> None:
@@ -227,6 +234,7 @@ def register_tools(mcp) -> None:
     """
     
     @mcp.tool()
+    @async_tool
     def get_work_item_types(project: str) -> str:
         """
         Gets a list of all work item types in a project.
@@ -245,11 +253,14 @@ def register_tools(mcp) -> None:
         """
         try:
             wit_client = get_work_item_client()
-            return _get_work_item_types_impl(project, wit_client)
+            return get_cached_metadata(
+                "work_item_types", [project],
+                lambda: _get_work_item_types_impl(project, wit_client))
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
     
     @mcp.tool()
+    @async_tool
     def get_work_item_type(project: str, type_name: str) -> str:
         """
         Gets detailed information about a specific work item type.
@@ -274,6 +285,7 @@ def register_tools(mcp) -> None:
             return f"Error: {str(e)}"
     
     @mcp.tool()
+    @async_tool
     def get_work_item_type_fields(project: str, type_name: str) -> str:
         """
         Gets a list of all fields for a specific work item type.
@@ -293,12 +305,15 @@ def register_tools(mcp) -> None:
         """
         try:
             wit_client = get_work_item_client()
-            return _get_work_item_type_fields_impl(
-                project, type_name, wit_client)
+            return get_cached_metadata(
+                "work_item_type_fields", [project, type_name],
+                lambda: _get_work_item_type_fields_impl(
+                    project, type_name, wit_client))
         except AzureDevOpsClientError as e:
             return f"Error: {str(e)}"
     
     @mcp.tool()
+    @async_tool
     def get_work_item_type_field(
         project: str, 
         type_name: str, 
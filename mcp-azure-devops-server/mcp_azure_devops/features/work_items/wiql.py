@@ -0,0 +1,458 @@
+"""
+Local evaluation of WIQL queries over the work item mirror.
+
+This module translates a subset of WIQL into SQL over the mirror's SQLite
+store. The supported subset is:
+
+- SELECT with a field list or *, FROM WorkItems
+- WHERE with AND, OR, NOT and parentheses
+- Operators =, <>, <, >, <=, >=, IN, NOT IN, CONTAINS, NOT CONTAINS, UNDER
+  and NOT UNDER, comparing a field with a string, number, @Me or
+  @Today [+/- days]
+- ORDER BY with ASC and DESC
+
+A query is only evaluated locally when it is limited to a single project by
+a top-level [System.TeamProject] = '...' condition and that project is
+mirrored with at least one work item. Anything else raises
+WiqlNotSupportedError so the caller can send the query to the server
+instead.
+"""
+import os
+import re
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
+from mcp_azure_devops.features.work_items.mirror import WorkItemMirror
+
+_TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<field>\[[^\]]+\])
+      | (?P<string>'(?:[^']|'')*'|"(?:[^"]|"")*")
+      | (?P<number>\d+(?:\.\d+)?)
+      | (?P<op><>|!=|<=|>=|=|<|>|\(|\)|,|\+|-|\*)
+      | (?P<macro>@\w+)
+      | (?P<word>[A-Za-z_][\w.]*)
+    )""", re.VERBOSE)
+
+_FIELD_NAME_PATTERN = re.compile(r"^[A-Za-z_][\w.]*$")
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Canonical names of common fields, since WIQL field names are not case
+# sensitive but the mirrored field names are
+_KNOWN_FIELDS = {name.lower(): name for name in [
+    "System.Id", "System.Rev", "System.Title", "System.State",
+    "System.Reason", "System.WorkItemType", "System.TeamProject",
+    "System.AreaPath", "System.IterationPath", "System.AssignedTo",
+    "System.CreatedBy", "System.ChangedBy", "System.CreatedDate",
+    "System.ChangedDate", "System.Tags", "System.Parent",
+    "System.BoardColumn", "Microsoft.VSTS.Common.Priority",
+    "Microsoft.VSTS.Common.Severity", "Microsoft.VSTS.Common.ClosedDate",
+    "Microsoft.VSTS.Common.ResolvedDate", "Microsoft.VSTS.Common.ActivatedBy",
+    "Microsoft.VSTS.Common.ResolvedBy", "Microsoft.VSTS.Common.ClosedBy",
+    "Microsoft.VSTS.Scheduling.StoryPoints",
+    "Microsoft.VSTS.Scheduling.Effort",
+    "Microsoft.VSTS.Scheduling.RemainingWork",
+    "Microsoft.VSTS.Scheduling.OriginalEstimate",
+    "Microsoft.VSTS.Scheduling.CompletedWork",
+]}
+
+# Fields holding identity references; they are compared by unique name when
+# the value looks like an email address and by display name otherwise
+_IDENTITY_FIELDS = {
+    "System.AssignedTo", "System.CreatedBy", "System.ChangedBy",
+    "Microsoft.VSTS.Common.ActivatedBy", "Microsoft.VSTS.Common.ResolvedBy",
+    "Microsoft.VSTS.Common.ClosedBy",
+}
+
+_COMPARISON_OPERATORS = ("=", "<>", "<", ">", "<=", ">=")
+
+
+class WiqlNotSupportedError(Exception):
+    """Exception raised for WIQL that cannot be evaluated locally."""
+    pass
+
+
+def _field_sql(field_name: str) -> str:
+    """
+    Get the SQL expression reading a field from the mirror.
+    
+    Args:
+        field_name: Field reference name
+        
+    Returns:
+        SQL expression
+    """
+    if field_name == "System.Id":
+        return "id"
+    if field_name == "System.Rev":
+        return "rev"
+    return f"json_extract(fields, '$.\"{field_name}\"')"
+
+
+def _text_sql(field_name: str) -> str:
+    """Get the case-insensitive SQL expression for a field."""
+    return f"lower({_field_sql(field_name)})"
+
+
+def _identity_sql(field_name: str, value: str) -> tuple[str, str]:
+    """
+    Get the SQL expression and value for comparing an identity field.
+    
+    Args:
+        field_name: Identity field reference name
+        value: Display name, email address or "Name <email>"
+        
+    Returns:
+        Tuple of (SQL expression, lower-cased value to compare with)
+    """
+    match = re.search(r"<([^>]+)>", value)
+    if match:
+        value = match.group(1)
+    part = "uniqueName" if "@" in value else "displayName"
+    path = f"$.\"{field_name}\""
+    return (f"lower(coalesce(json_extract(fields, '{path}.{part}'), "
+            f"json_extract(fields, '{path}')))", value.lower())
+
+
+class _WiqlParser:
+    """Recursive descent parser producing SQL from a WIQL query."""
+    
+    def __init__(self, query: str, today: date, me: Optional[str]):
+        self.tokens = self._tokenize(query)
+        self.pos = 0
+        self.today = today
+        self.me = me
+    
+    @staticmethod
+    def _tokenize(query: str) -> list[tuple[str, str]]:
+        """Split a query into (kind, text) tokens."""
+        tokens = []
+        pos = 0
+        query = query.rstrip()
+        while pos < len(query):
+            match = _TOKEN_PATTERN.match(query, pos)
+            if not match or match.end() == pos:
+                raise WiqlNotSupportedError(
+                    f"Unexpected text at position {pos}")
+            tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            pos = match.end()
+        return tokens
+    
+    def _peek(self) -> tuple[Optional[str], str]:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return None, ""
+    
+    def _next(self) -> tuple[Optional[str], str]:
+        token = self._peek()
+        self.pos += 1
+        return token
+    
+    def _is_word(self, *words: str) -> bool:
+        kind, text = self._peek()
+        return kind == "word" and text.upper() in words
+    
+    def _expect_word(self, word: str) -> None:
+        if not self._is_word(word):
+            raise WiqlNotSupportedError(f"Expected {word}")
+        self.pos += 1
+    
+    def _expect_op(self, op: str) -> None:
+        if self._peek() != ("op", op):
+            raise WiqlNotSupportedError(f"Expected '{op}'")
+        self.pos += 1
+    
+    def _field(self) -> str:
+        kind, text = self._next()
+        if kind == "field":
+            text = text[1:-1].strip()
+        elif kind != "word":
+            raise WiqlNotSupportedError("Expected a field name")
+        if not _FIELD_NAME_PATTERN.match(text):
+            raise WiqlNotSupportedError(f"Unsupported field name '{text}'")
+        return _KNOWN_FIELDS.get(text.lower(), text)
+    
+    def _value(self):
+        """Parse a literal or macro into a str, int, float or date."""
+        kind, text = self._next()
+        if kind == "string":
+            return text[1:-1].replace(text[0] * 2, text[0])
+        if kind == "number":
+            return float(text) if "." in text else int(text)
+        if (kind, text) == ("op", "-") and self._peek()[0] == "number":
+            return -self._value()
+        if kind == "macro" and text.lower() == "@me":
+            if not self.me:
+                raise WiqlNotSupportedError(
+                    "@Me requires AZURE_DEVOPS_USER_EMAIL")
+            return self.me
+        if kind == "macro" and text.lower() == "@today":
+            offset = 0
+            if self._peek() in (("op", "+"), ("op", "-")):
+                sign = 1 if self._next()[1] == "+" else -1
+                kind, text = self._next()
+                if kind != "number" or "." in text:
+                    raise WiqlNotSupportedError("Expected a number of days")
+                offset = sign * int(text)
+            return self.today + timedelta(days=offset)
+        raise WiqlNotSupportedError(f"Unsupported value '{text}'")
+    
+    def parse(self) -> dict:
+        """
+        Parse the whole query.
+        
+        Returns:
+            Dictionary with fields (None for *), where and params,
+            project and order_by
+        """
+        self._expect_word("SELECT")
+        fields = None
+        if self._peek() == ("op", "*"):
+            self.pos += 1
+        else:
+            fields = [self._field()]
+            while self._peek() == ("op", ","):
+                self.pos += 1
+                fields.append(self._field())
+        
+        self._expect_word("FROM")
+        self._expect_word("WORKITEMS")
+        
+        where, params, project = "1", [], None
+        if self._is_word("WHERE"):
+            self.pos += 1
+            where, params, project = self._or()
+        
+        order_by = []
+        if self._is_word("ORDER"):
+            self.pos += 1
+            self._expect_word("BY")
+            while True:
+                field_name = self._field()
+                direction = "ASC"
+                if self._is_word("ASC", "DESC"):
+                    direction = self._next()[1].upper()
+                order_by.append((field_name, direction))
+                if self._peek() != ("op", ","):
+                    break
+                self.pos += 1
+        
+        if self.pos != len(self.tokens):
+            raise WiqlNotSupportedError(
+                f"Unsupported clause '{self._peek()[1]}'")
+        
+        return {"fields": fields, "where": where, "params": params,
+                "project": project, "order_by": order_by}
+    
+    def _or(self) -> tuple[str, list, Optional[str]]:
+        sql, params, project = self._and()
+        parts = [sql]
+        while self._is_word("OR"):
+            self.pos += 1
+            sql, more_params, _ = self._and()
+            parts.append(sql)
+            params = params + more_params
+            project = None
+        if len(parts) == 1:
+            return sql, params, project
+        return f"({' OR '.join(parts)})", params, project
+    
+    def _and(self) -> tuple[str, list, Optional[str]]:
+        sql, params, project = self._not()
+        parts = [sql]
+        while self._is_word("AND"):
+            self.pos += 1
+            sql, more_params, more_project = self._not()
+            parts.append(sql)
+            params = params + more_params
+            project = project or more_project
+        return f"({' AND '.join(parts)})", params, project
+    
+    def _not(self) -> tuple[str, list, Optional[str]]:
+        if self._is_word("NOT"):
+            self.pos += 1
+            sql, params, _ = self._not()
+            return f"NOT {sql}", params, None
+        if self._peek() == ("op", "("):
+            self.pos += 1
+            result = self._or()
+            self._expect_op(")")
+            return result
+        return self._predicate()
+    
+    def _operator(self) -> tuple[str, bool]:
+        """Parse an operator into (operator, negated)."""
+        negated = False
+        if self._is_word("NOT"):
+            self.pos += 1
+            negated = True
+        kind, text = self._next()
+        if kind == "op" and text in _COMPARISON_OPERATORS and not negated:
+            return text, False
+        if kind == "op" and text == "!=" and not negated:
+            return "<>", False
+        if kind == "word" and text.upper() in ("IN", "CONTAINS", "UNDER"):
+            return text.upper(), negated
+        raise WiqlNotSupportedError(f"Unsupported operator '{text}'")
+    
+    def _predicate(self) -> tuple[str, list, Optional[str]]:
+        field_name = self._field()
+        operator, negated = self._operator()
+        
+        if operator == "IN":
+            self._expect_op("(")
+            values = [self._value()]
+            while self._peek() == ("op", ","):
+                self.pos += 1
+                values.append(self._value())
+            self._expect_op(")")
+            value = None
+            sql, params = _compare_in(field_name, values)
+        else:
+            value = self._value()
+            sql, params = _compare(field_name, operator, value)
+        
+        project = None
+        if (field_name == "System.TeamProject" and operator == "="
+                and not negated and isinstance(value, str)):
+            project = value
+        
+        if negated:
+            sql = f"NOT coalesce({sql}, 0)"
+        return sql, params, project
+
+
+def _compare(field_name: str, operator: str, value) -> tuple[str, list]:
+    """
+    Build the SQL for comparing a field with a value.
+    
+    Args:
+        field_name: Field reference name
+        operator: =, <>, <, >, <=, >=, CONTAINS or UNDER
+        value: String, number or date to compare with
+        
+    Returns:
+        Tuple of (SQL condition, parameters)
+    """
+    if isinstance(value, str) and _DATE_PATTERN.match(value):
+        value = date.fromisoformat(value)
+    
+    if isinstance(value, date):
+        # Dates are compared by day, like WIQL does for date-only values
+        if operator not in _COMPARISON_OPERATORS:
+            raise WiqlNotSupportedError(f"{operator} is not valid for dates")
+        column = f"substr({_field_sql(field_name)}, 1, 10)"
+        return _with_empty(column, operator, value.isoformat())
+    
+    if isinstance(value, (int, float)):
+        if operator not in _COMPARISON_OPERATORS:
+            raise WiqlNotSupportedError(
+                f"{operator} is not valid for numbers")
+        return _with_empty(_field_sql(field_name), operator, value)
+    
+    if value == "" and operator in ("=", "<>"):
+        empty = f"coalesce({_field_sql(field_name)}, '') = ''"
+        return (empty if operator == "=" else f"NOT {empty}"), []
+    
+    if field_name in _IDENTITY_FIELDS and operator in ("=", "<>"):
+        column, value = _identity_sql(field_name, value)
+    else:
+        column, value = _text_sql(field_name), value.lower()
+    
+    if operator == "CONTAINS":
+        return f"instr({column}, ?) > 0", [value]
+    if operator == "UNDER":
+        return (f"({column} = ? OR substr({column}, 1, ?) = ?)",
+                [value, len(value) + 1, value + "\\"])
+    return _with_empty(column, operator, value)
+
+
+def _with_empty(column: str, operator: str, value) -> tuple[str, list]:
+    """Build a comparison where <> also matches empty fields, as in WIQL."""
+    if operator == "<>":
+        return f"({column} IS NULL OR {column} <> ?)", [value]
+    return f"{column} {operator} ?", [value]
+
+
+def _compare_in(field_name: str, values: list) -> tuple[str, list]:
+    """Build the SQL for an IN list."""
+    if all(isinstance(value, (int, float)) for value in values):
+        column = _field_sql(field_name)
+    elif all(isinstance(value, str) for value in values):
+        if field_name in _IDENTITY_FIELDS:
+            conditions = []
+            params = []
+            for value in values:
+                column, value = _identity_sql(field_name, value)
+                conditions.append(f"{column} = ?")
+                params.append(value)
+            return f"({' OR '.join(conditions)})", params
+        column = _text_sql(field_name)
+        values = [value.lower() for value in values]
+    else:
+        raise WiqlNotSupportedError("IN lists must be all strings or numbers")
+    return (f"{column} IN ({', '.join('?' * len(values))})", values)
+
+
+def _order_sql(order_by: list[tuple[str, str]]) -> str:
+    """Build the ORDER BY clause, ending with the ID as WIQL does."""
+    terms = []
+    for field_name, direction in order_by:
+        if field_name in _IDENTITY_FIELDS:
+            terms.append(f"lower(coalesce(json_extract(fields, "
+                         f"'$.\"{field_name}\".displayName'), "
+                         f"{_field_sql(field_name)})) {direction}")
+        elif field_name == "System.Id":
+            terms.append(f"id {direction}")
+        else:
+            terms.append(f"{_field_sql(field_name)} {direction}")
+    if not any(field_name == "System.Id" for field_name, _ in order_by):
+        terms.append("id ASC")
+    return ", ".join(terms)
+
+
+def run_wiql_on_mirror(
+    mirror: WorkItemMirror,
+    query: str,
+    top: int,
+    wit_client: WorkItemTrackingClient
+) -> tuple[list[int], Optional[list[str]]]:
+    """
+    Evaluate a WIQL query against the mirror.
+    
+    Args:
+        mirror: Work item mirror
+        query: The WIQL query string
+        top: Maximum number of results to return
+        wit_client: Work item tracking client used to sync the project if
+            its mirror is stale
+            
+    Returns:
+        Tuple of (matching work item IDs, fields in the SELECT list or None
+        for all fields)
+        
+    Raises:
+        WiqlNotSupportedError: If the query uses unsupported WIQL, is not
+            limited to a single project or the project is not mirrored or
+            has no mirrored work items
+    """
+    # Mirrored dates are UTC, so @Today is the current UTC date
+    parsed = _WiqlParser(query, datetime.now(timezone.utc).date(),
+                         os.environ.get("AZURE_DEVOPS_USER_EMAIL")).parse()
+    if not parsed["project"]:
+        raise WiqlNotSupportedError(
+            "Query is not limited to a single project")
+    if not mirror.refresh(wit_client, parsed["project"]):
+        raise WiqlNotSupportedError(
+            f"Project '{parsed['project']}' is not mirrored")
+    if not mirror.has_work_items(parsed["project"]):
+        raise WiqlNotSupportedError(
+            f"Project '{parsed['project']}' has no mirrored work items")
+    
+    sql = (f"SELECT id FROM work_items WHERE project = ? AND "
+           f"{parsed['where']} ORDER BY {_order_sql(parsed['order_by'])} "
+           f"LIMIT ?")
+    rows = mirror.select(sql, [parsed["project"]] + parsed["params"] + [top])
+    return [row[0] for row in rows], parsed["fields"]
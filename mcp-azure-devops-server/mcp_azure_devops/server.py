@@ -4,6 +4,8 @@ Azure DevOps MCP Server
 A simple MCP server that exposes Azure DevOps capabilities.
 """
 import argparse
+import os
+import threading
 
 from mcp.server.fastmcp import FastMCP
 
@@ -11,6 +13,7 @@ from mcp.server.fastmcp import FastMCP
 
 from mcp_azure_devops.utils import register_all_prompts
 from mcp_azure_devops.features import register_all
+from mcp_azure_devops.features.teams.tools import warm_up_team_cache
 
 
 
@@ -21,13 +24,32 @@ mcp = FastMCP("Azure DevOps")
 register_all(mcp)
 register_all_prompts(mcp)
 
+def _warm_up():
+    """Warm the team cache, ignoring failures."""
+    try:
+        warm_up_team_cache()
+    except Exception:
+        pass
+
+
 def main():
     """Entry point for the command-line script."""
     parser = argparse.ArgumentParser(
         description="Run the Azure DevOps MCP server")
     # Add more command-line arguments as needed
     
-    parser.parse_args()  # Store args if needed later
+    parser.add_argument(
+        "--warm-up", action="store_true",
+        default=os.environ.get("AZURE_DEVOPS_WARM_UP", "").lower() in
+        ("1", "true", "yes"),
+        help="Prefetch all teams, iterations and area paths in the "
+             "background on startup (or set AZURE_DEVOPS_WARM_UP=true)")
+    
+    args = parser.parse_args()
+    
+    if args.warm_up:
+        # Warm the team cache without delaying the server start
+        threading.Thread(target=_warm_up, daemon=True).start()
     
     # Start the server
     mcp.run()
@@ -2,9 +2,17 @@
 Azure DevOps client utilities.
 
 This module provides helper functions for connecting to Azure DevOps.
+
+Connections and clients are pooled for the lifetime of the process. Each
+pooled connection is keyed by organization URL and a hash of the PAT, and
+each client within it by its client type, so repeated tool calls reuse the
+same HTTP session and resource-area lookups instead of rebuilding them.
 """
+import hashlib
 import os
-from typing import Optional, Tuple
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
 
 from azure.devops.connection import Connection
 from azure.devops.v7_1.core import CoreClient
@@ -13,6 +21,9 @@ from azure.devops.v7_1.work_item_tracking_process import (
 )
 from msrest.authentication import BasicAuthentication
 
+# Seconds a pooled connection may stay unused before it is closed
+DEFAULT_IDLE_TIMEOUT = 900
+
 
 def get_credentials() -> Tuple[Optional[str], Optional[str]]:
     """
@@ -26,9 +37,179 @@ def get_credentials() -> Tuple[Optional[str], Optional[str]]:
     return pat, organization_url
 
 
+def _hash_pat(pat: str) -> str:
+    """
+    Hash a PAT so it can be used as a cache key without being stored.
+    
+    Args:
+        pat: Personal access token
+        
+    Returns:
+        Hex digest of the token
+    """
+    return hashlib.sha256(pat.encode("utf-8")).hexdigest()
+
+
+def get_cache_scope(include_pat: bool = False) -> str:
+    """
+    Get the cache key prefix identifying the configured organization.
+    
+    Args:
+        include_pat: Whether to also identify the PAT, for data that depends
+            on the permissions of the caller
+    
+    Returns:
+        Normalized organization URL, followed by a hash of the PAT if
+        requested
+    """
+    pat, organization_url = get_credentials()
+    scope = (organization_url or "").rstrip("/").lower()
+    if include_pat:
+        scope += f"|{_hash_pat(pat or '')[:16]}"
+    return scope
+
+
+def _close_client(client: Any) -> None:
+    """
+    Close the HTTP session held by a client, ignoring failures.
+    
+    Args:
+        client: Azure DevOps client or connection
+    """
+    service_client = getattr(client, "_client", None)
+    if service_client is None:
+        return
+    try:
+        service_client.close()
+    except Exception:
+        pass
+
+
+class _PooledConnection:
+    """A connection together with the clients created from it."""
+    
+    def __init__(self, connection: Connection):
+        self.connection = connection
+        self.clients: Dict[str, Any] = {}
+        self.last_used = time.monotonic()
+    
+    def close(self) -> None:
+        """Close the connection and every client created from it."""
+        for client in self.clients.values():
+            _close_client(client)
+        self.clients.clear()
+        _close_client(self.connection)
+
+
+class ConnectionPool:
+    """
+    Thread-safe registry of Azure DevOps connections and clients.
+    
+    Entries are keyed by (organization URL, PAT hash) and clients within an
+    entry by client type. HTTP keep-alive is enabled on every client so the
+    underlying session is reused across requests. Entries unused for longer
+    than the idle timeout are closed, as are entries for an organization
+    whose PAT has been rotated.
+    """
+    
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._entries: Dict[Tuple[str, str], _PooledConnection] = {}
+        self._lock = threading.Lock()
+    
+    def _evict_idle(self, now: float) -> None:
+        """Close entries that have not been used within the idle timeout."""
+        for key, entry in list(self._entries.items()):
+            if now - entry.last_used > self.idle_timeout:
+                entry.close()
+                del self._entries[key]
+    
+    def _get_entry(self, organization_url: str, pat: str) -> _PooledConnection:
+        """Get or create the pooled entry. Must be called with the lock."""
+        now = time.monotonic()
+        self._evict_idle(now)
+        
+        key = (organization_url.rstrip("/"), _hash_pat(pat))
+        entry = self._entries.get(key)
+        if entry is None:
+            # A new PAT for a known organization means the old one was
+            # rotated, so connections built with it are no longer valid
+            for stale_key in [k for k in self._entries if k[0] == key[0]]:
+                self._entries.pop(stale_key).close()
+            
+            credentials = BasicAuthentication('', pat)
+            connection = Connection(base_url=organization_url,
+                                    creds=credentials)
+            connection._config.keep_alive = True
+            entry = _PooledConnection(connection)
+            self._entries[key] = entry
+        
+        entry.last_used = now
+        return entry
+    
+    def get_connection(self, organization_url: str, pat: str) -> Connection:
+        """
+        Get the pooled connection for an organization and PAT.
+        
+        Args:
+            organization_url: Azure DevOps organization URL
+            pat: Personal access token
+            
+        Returns:
+            Connection object
+        """
+        with self._lock:
+            return self._get_entry(organization_url, pat).connection
+    
+    def get_client(self, organization_url: str, pat: str,
+                   client_type: str) -> Any:
+        """
+        Get a pooled client for an organization and PAT.
+        
+        Args:
+            organization_url: Azure DevOps organization URL
+            pat: Personal access token
+            client_type: Name of the client factory method, e.g.
+                "get_core_client"
+                
+        Returns:
+            Client instance or None if the factory returned no client
+        """
+        with self._lock:
+            entry = self._get_entry(organization_url, pat)
+            client = entry.clients.get(client_type)
+            if client is None:
+                client = getattr(entry.connection.clients, client_type)()
+                if client is None:
+                    return None
+                client.config.keep_alive = True
+                entry.clients[client_type] = client
+            return client
+    
+    def invalidate(self, organization_url: Optional[str] = None) -> None:
+        """
+        Close pooled connections so they are rebuilt on next use.
+        
+        Args:
+            organization_url: Only invalidate connections for this
+                organization. Invalidates everything when omitted.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if (organization_url is None or
+                        key[0] == organization_url.rstrip("/")):
+                    self._entries.pop(key).close()
+
+
+_pool = ConnectionPool(
+    idle_timeout=float(os.environ.get("AZURE_DEVOPS_CONNECTION_IDLE_TIMEOUT",
+                                      DEFAULT_IDLE_TIMEOUT))
+)
+
+
 def get_connection() -> Optional[Connection]:
     """
-    Create a connection to Azure DevOps.
+    Get the pooled connection to Azure DevOps.
     
     Returns:
         Connection object or None if credentials are missing
@@ -38,8 +219,37 @@ def get_connection() -> Optional[Connection]:
     if not pat or not organization_url:
         return None
     
-    credentials = BasicAuthentication('', pat)
-    return Connection(base_url=organization_url, creds=credentials)
+    return _pool.get_connection(organization_url, pat)
+
+
+def get_client(client_type: str) -> Any:
+    """
+    Get a pooled Azure DevOps client.
+    
+    Args:
+        client_type: Name of the client factory method, e.g.
+            "get_core_client"
+            
+    Returns:
+        Client instance or None if credentials are missing or the client
+        cannot be created
+    """
+    pat, organization_url = get_credentials()
+    
+    if not pat or not organization_url:
+        return None
+    
+    return _pool.get_client(organization_url, pat, client_type)
+
+
+def invalidate_connections(organization_url: Optional[str] = None) -> None:
+    """
+    Close pooled connections so they are rebuilt on next use.
+    
+    Args:
+        organization_url: Only invalidate connections for this organization
+    """
+    _pool.invalidate(organization_url)
 
 
 def get_core_client() -> CoreClient:
@@ -60,7 +270,7 @@ def get_core_client() -> CoreClient:
             "environment variables."
         )
     
-    core_client = connection.clients.get_core_client()
+    core_client = get_client("get_core_client")
     
     if not core_client:
         raise Exception("Failed to get Core client.")
@@ -86,7 +296,7 @@ def get_work_item_tracking_process_client() -> WorkItemTrackingProcessClient:
             "environment variables."
         )
     
-    process_client = connection.clients.get_work_item_tracking_process_client()
+    process_client = get_client("get_work_item_tracking_process_client")
     
     if not process_client:
         raise Exception("Failed to get Work Item Tracking Process client.")
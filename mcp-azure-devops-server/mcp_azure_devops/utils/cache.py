@@ -0,0 +1,278 @@
+"""
+Caching utilities for Azure DevOps data.
+
+This module provides a thread-safe, size-bounded TTL cache that can
+optionally persist its entries to disk so they survive server restarts and
+refresh entries in the background before they expire, and a singleflight
+helper that lets concurrent callers share one in-flight computation.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+class _Call:
+    """An in-flight call whose result is shared with waiting callers."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    De-duplicate concurrent calls for the same key.
+    
+    The first caller for a key runs the function; callers arriving while it
+    is still running wait and receive the same result or exception.
+    """
+    
+    def __init__(self):
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run fn for key, or wait for the call already in flight.
+        
+        Args:
+            key: Key identifying the call
+            fn: Function to run
+            
+        Returns:
+            The result of fn
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+        
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL.
+    
+    When a persist path is given, entries are loaded from that JSON file on
+    creation and written back after every change, so cached values must be
+    JSON serializable. Concurrent misses for the same key share a single
+    call to the factory.
+    
+    When refresh_ahead is set, a get_or_set hit on an entry expiring within
+    that many seconds returns the cached value and recomputes it on a
+    background thread, so frequently used entries never expire.
+    """
+    
+    def __init__(self, ttl: float, max_entries: int = 512,
+                 persist_path: Optional[str] = None,
+                 refresh_ahead: float = 0):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.persist_path = persist_path
+        self.refresh_ahead = refresh_ahead
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._inflight = SingleFlight()
+        self._refreshing: set = set()
+        self._load()
+    
+    def _load(self) -> None:
+        """Load unexpired entries from the persist path if it exists."""
+        if not self.persist_path or not os.path.exists(self.persist_path):
+            return
+        try:
+            with open(self.persist_path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        now = time.time()
+        for key, (expires_at, value) in stored.items():
+            if expires_at > now:
+                self._entries[key] = (expires_at, value)
+        self._trim()
+    
+    def _save(self) -> None:
+        """Write the current entries to the persist path."""
+        if not self.persist_path:
+            return
+        temp_path = f"{self.persist_path}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(dict(self._entries), f)
+            os.replace(temp_path, self.persist_path)
+        except (OSError, TypeError):
+            pass
+    
+    def _trim(self) -> None:
+        """Evict least recently used entries beyond the size limit."""
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def _lookup(self, key: str) -> Optional[Any]:
+        """Get an unexpired value without updating statistics."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in the cache.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, value)
+            self._entries.move_to_end(key)
+            self._trim()
+            self._save()
+    
+    def get_or_set(self, key: str, factory: Callable[[], Any],
+                   cacheable: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Get a cached value, computing and storing it on a miss.
+        
+        Args:
+            key: Cache key
+            factory: Function called to compute the value on a miss
+            cacheable: Optional predicate deciding whether a computed value
+                should be stored (e.g. to skip error results)
+                
+        Returns:
+            The cached or newly computed value
+        """
+        value = self.get(key)
+        if value is not None:
+            if self.refresh_ahead:
+                self._refresh_if_expiring(key, factory, cacheable)
+            return value
+        
+        def compute() -> Any:
+            # Another caller may have filled the entry while we waited
+            value = self._lookup(key)
+            if value is not None:
+                return value
+            value = factory()
+            if value is not None and (cacheable is None or cacheable(value)):
+                self.set(key, value)
+            return value
+        
+        return self._inflight.do(key, compute)
+    
+    def _refresh_if_expiring(
+        self,
+        key: str,
+        factory: Callable[[], Any],
+        cacheable: Optional[Callable[[Any], bool]]
+    ) -> None:
+        """Recompute an entry on a background thread if it expires soon."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if (entry is None or key in self._refreshing or
+                    entry[0] - time.time() > self.refresh_ahead):
+                return
+            self._refreshing.add(key)
+            self.refreshes += 1
+        
+        def refresh() -> None:
+            try:
+                value = factory()
+                if value is not None and (cacheable is None or
+                                          cacheable(value)):
+                    self.set(key, value)
+            except Exception:
+                # The cached value stays until it expires
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+        
+        threading.Thread(target=refresh, daemon=True).start()
+    
+    def invalidate(self, prefix: str = "") -> int:
+        """
+        Remove cached entries.
+        
+        Args:
+            prefix: Only remove keys starting with this prefix. Removes
+                everything when empty.
+                
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+            if keys:
+                self._save()
+            return len(keys)
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with hit, miss, background refresh and size counts
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "size": len(self._entries),
+            }
@@ -0,0 +1,161 @@
+"""
+Concurrency utilities for Azure DevOps tools.
+
+The azure-devops SDK is synchronous, so tools run their blocking calls on
+worker threads to keep the server's event loop free to handle other
+requests. The number of tool calls running at once is bounded by the
+AZURE_DEVOPS_MAX_CONCURRENCY environment variable.
+"""
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, List, Optional
+
+from anyio import CapacityLimiter, from_thread, to_thread
+
+# Default number of tool calls allowed to run at the same time
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Default number of pages fetched at the same time by fetch_all_pages
+DEFAULT_PAGE_WORKERS = 4
+
+_limiter: Optional[CapacityLimiter] = None
+
+
+def _get_limiter() -> CapacityLimiter:
+    """
+    Get the limiter shared by all tool calls.
+    
+    The limiter is created lazily because it must be created while an event
+    loop is running.
+    
+    Returns:
+        CapacityLimiter instance
+    """
+    global _limiter
+    if _limiter is None:
+        _limiter = CapacityLimiter(
+            int(os.environ.get("AZURE_DEVOPS_MAX_CONCURRENCY",
+                               DEFAULT_MAX_CONCURRENCY)))
+    return _limiter
+
+
+async def run_blocking(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run a blocking function on a worker thread.
+    
+    Args:
+        func: Function to run
+        *args: Positional arguments for the function
+        **kwargs: Keyword arguments for the function
+        
+    Returns:
+        The function's result
+    """
+    return await to_thread.run_sync(
+        functools.partial(func, *args, **kwargs), limiter=_get_limiter())
+
+
+def async_tool(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Turn a blocking tool function into an async tool.
+    
+    The wrapper keeps the wrapped function's name, docstring and signature,
+    so FastMCP builds the same tool schema from it.
+    
+    Args:
+        func: Blocking tool function
+        
+    Returns:
+        Async function running func on a worker thread
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_blocking(func, *args, **kwargs)
+    
+    return wrapper
+
+
+def make_progress_callback(ctx: Any) -> Optional[Callable[[int, int], None]]:
+    """
+    Build a progress callback that worker threads can call.
+    
+    The callback forwards progress to the MCP client as progress
+    notifications. It must be called from a thread started by run_blocking.
+    Failures to report progress are ignored.
+    
+    Args:
+        ctx: FastMCP Context of the current request, or None
+        
+    Returns:
+        Callback taking (progress, total), or None if there is no context
+    """
+    if ctx is None:
+        return None
+    
+    def report(progress: int, total: int) -> None:
+        try:
+            from_thread.run(ctx.report_progress, progress, total)
+        except Exception:
+            pass
+    
+    return report
+
+
+def fetch_all_pages(
+    fetch_page: Callable[[int, int], Optional[list]],
+    page_size: int,
+    max_items: Optional[int] = None,
+    max_workers: int = DEFAULT_PAGE_WORKERS,
+    key: Optional[Callable[[Any], Hashable]] = None
+) -> List[Any]:
+    """
+    Fetch every page of an API paged with skip and top.
+    
+    The first page is fetched alone, so small collections cost one request.
+    After a full page, the following pages are fetched max_workers at a
+    time until a page comes back short. When a key function is given,
+    items already returned on an earlier page are dropped, so a collection
+    changing while it is read does not produce duplicates.
+    
+    Args:
+        fetch_page: Function called with (skip, top) returning one page
+        page_size: Number of items requested per page
+        max_items: Optional maximum number of items to return
+        max_workers: Number of pages fetched at the same time
+        key: Optional function returning an item's unique key
+        
+    Returns:
+        Items of all pages in order
+    """
+    items = []
+    seen = set()
+    
+    def add(page: list) -> None:
+        for item in page:
+            if key is not None:
+                item_key = key(item)
+                if item_key in seen:
+                    continue
+                seen.add(item_key)
+            items.append(item)
+    
+    first_page = fetch_page(0, page_size) or []
+    add(first_page)
+    done = len(first_page) < page_size
+    skip = page_size
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        while not done and (max_items is None or len(items) < max_items):
+            skips = [skip + i * page_size for i in range(max_workers)]
+            pages = executor.map(
+                lambda page_skip: fetch_page(page_skip, page_size) or [],
+                skips)
+            for page in pages:
+                add(page)
+                if len(page) < page_size:
+                    done = True
+                    break
+            skip += page_size * max_workers
+    
+    return items[:max_items] if max_items is not None else items
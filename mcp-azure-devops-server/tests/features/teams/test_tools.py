@@ -0,0 +1,111 @@
+from datetime import datetime, timezone
+
+import pytest
+from azure.devops.v7_1.core.models import IdentityRef, TeamMember, WebApiTeam
+from azure.devops.v7_1.work.models import (
+    TeamFieldValue,
+    TeamFieldValues,
+    TeamIterationAttributes,
+    TeamSettingsIteration,
+)
+
+from mcp_azure_devops.features.teams import tools
+from mcp_azure_devops.features.teams.common import team_cache
+
+TEAM = WebApiTeam(id="t1", name="Web", project_id="p1", project_name="Contoso")
+
+
+class FakeCoreClient:
+    def __init__(self):
+        self.member_calls = 0
+
+    def get_teams(self, project_id, mine=None, top=None, skip=None):
+        return [TEAM] if not skip else []
+
+    def get_all_teams(self, mine=None, top=None, skip=None):
+        return [TEAM] if not skip else []
+
+    def get_team_members_with_extended_properties(self, project_id, team_id,
+                                                  top=None, skip=None):
+        self.member_calls += 1
+        return [
+            TeamMember(identity=IdentityRef(
+                id="u1", display_name="Jamie Reyes",
+                unique_name="jamie@contoso.com"), is_team_admin=True),
+            TeamMember(identity=IdentityRef(
+                id="u2", display_name="Alex Kim",
+                unique_name="alex@contoso.com"), is_team_admin=False),
+        ]
+
+
+class FakeWorkClient:
+    def __init__(self):
+        self.iteration_calls = 0
+
+    def get_team_field_values(self, team_context):
+        return TeamFieldValues(default_value="Contoso\\Web", values=[
+            TeamFieldValue(value="Contoso\\Web", include_children=True),
+            TeamFieldValue(value="Contoso\\Shared", include_children=False),
+        ])
+
+    def get_team_iterations(self, team_context, timeframe=None):
+        self.iteration_calls += 1
+        return [TeamSettingsIteration(
+            id="i1", name="Sprint 1", path="Contoso\\Sprint 1",
+            attributes=TeamIterationAttributes(
+                start_date=datetime(2025, 3, 3, tzinfo=timezone.utc),
+                finish_date=datetime(2025, 3, 14, tzinfo=timezone.utc),
+                time_frame="current"))]
+
+
+@pytest.fixture
+def clients(monkeypatch):
+    team_cache.invalidate()
+    core_client, work_client = FakeCoreClient(), FakeWorkClient()
+    monkeypatch.setattr(tools, "get_core_client", lambda: core_client)
+    monkeypatch.setattr(tools, "get_work_client", lambda: work_client)
+    yield core_client, work_client
+    team_cache.invalidate()
+
+
+def test_team_details_are_formatted_from_cached_data(clients):
+    core_client, work_client = clients
+
+    result = tools._get_all_team_details_impl(core_client, "Contoso")
+
+    assert result.splitlines()[2:] == [
+        "## Web (Contoso)",
+        "Members (2): Jamie Reyes (admin), Alex Kim",
+        "Area Paths (default Contoso\\Web): Contoso\\Web (incl. sub-areas), "
+        "Contoso\\Shared",
+        "Iterations (1): Sprint 1 (2025-03-03 to 2025-03-14, current)",
+    ]
+
+
+def test_single_team_tools_reuse_the_cached_data(clients):
+    core_client, work_client = clients
+    tools._get_all_team_details_impl(core_client, "Contoso")
+
+    members = tools._get_team_members_impl("p1", "t1")
+    iterations = tools._get_team_iterations_impl("p1", "t1")
+
+    assert core_client.member_calls == 1
+    assert work_client.iteration_calls == 1
+    assert "# Member: Jamie Reyes" in members
+    assert "Team Administrator: Yes" in members
+    assert "# Iteration: Sprint 1" in iterations
+
+
+def test_failed_lookups_are_reported_and_not_cached(clients, monkeypatch):
+    core_client, work_client = clients
+
+    def fail(team_context, timeframe=None):
+        raise RuntimeError("TF401027: access denied")
+
+    monkeypatch.setattr(work_client, "get_team_iterations", fail)
+    result = tools._get_all_team_details_impl(core_client, "Contoso")
+
+    assert "Iterations: Error: TF401027: access denied" in result
+    assert tools._get_team_iterations_impl("p1", "t1") == (
+        "Error retrieving team iterations: TF401027: access denied")
+    assert tools.warm_up_team_cache() == {"teams": 1, "failed": 1}
@@ -0,0 +1,45 @@
+import pytest
+from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
+
+from mcp_azure_devops.features.work_items.mirror import WorkItemMirror
+
+
+class FakeReportingClient:
+    """Client returning reporting revision pages deserialized by the SDK."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.tokens = []
+        self._sdk = WorkItemTrackingClient(base_url="https://dev.azure.com/x")
+
+    def read_reporting_revisions_get(self, project=None,
+                                     continuation_token=None, **kwargs):
+        self.tokens.append(continuation_token)
+        page = self.pages[len(self.tokens) - 1]
+        return self._sdk._deserialize("ReportingWorkItemRevisionsBatch",
+                                      page)
+
+
+@pytest.fixture
+def reporting_client():
+    return FakeReportingClient
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    return WorkItemMirror(str(tmp_path / "mirror.db"))
+
+
+@pytest.fixture
+def synced_mirror(mirror):
+    """Get a function that syncs work items into the mirror."""
+    def sync(work_items, project="Contoso"):
+        mirror.sync(FakeReportingClient([{
+            "values": [{"id": item_id, "rev": 1,
+                        "fields": {"System.TeamProject": project, **fields}}
+                       for item_id, fields in work_items.items()],
+            "continuationToken": "1;1",
+            "isLastBatch": True,
+        }]), project)
+        return mirror
+    return sync
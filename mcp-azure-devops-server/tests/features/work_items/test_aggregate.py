@@ -0,0 +1,77 @@
+import pytest
+from azure.devops.v7_1.work_item_tracking.models import (
+    WorkItem,
+    WorkItemQueryResult,
+    WorkItemReference,
+)
+
+from mcp_azure_devops.features.work_items.tools.aggregate import (
+    _aggregate_work_items_impl,
+)
+
+
+class FakeServerClient:
+    """Client answering WIQL queries and work item reads from a dict."""
+
+    def __init__(self, work_items):
+        self.work_items = work_items
+        self.queries = []
+
+    def query_by_wiql(self, wiql, top=None):
+        self.queries.append(wiql.query)
+        return WorkItemQueryResult(work_items=[
+            WorkItemReference(id=item_id) for item_id in self.work_items])
+
+    def get_work_items(self, ids, expand=None, fields=None,
+                       error_policy=None):
+        return [WorkItem(id=item_id, fields={
+            name: value for name, value in self.work_items[item_id].items()
+            if name in fields}) for item_id in ids]
+
+
+@pytest.fixture
+def mirror(synced_mirror, monkeypatch):
+    mirror = synced_mirror({
+        1: {"System.State": "Active",
+            "Microsoft.VSTS.Scheduling.StoryPoints": 3},
+        2: {"System.State": "Active",
+            "Microsoft.VSTS.Scheduling.StoryPoints": 5},
+        3: {"System.State": "Closed",
+            "Microsoft.VSTS.Scheduling.StoryPoints": 8},
+    })
+    monkeypatch.setenv("AZURE_DEVOPS_MIRROR_PATH", mirror.path)
+    return mirror
+
+
+def test_aggregates_mirror_rows(mirror):
+    client = FakeServerClient({})
+
+    result = _aggregate_work_items_impl(
+        "[System.TeamProject] = 'Contoso'", ["system.state"],
+        ["count", "sum(microsoft.vsts.scheduling.storypoints)"], client,
+        use_mirror=True)
+
+    assert client.queries == []
+    assert result.splitlines()[:4] == [
+        "| System.State | count | "
+        "sum(Microsoft.VSTS.Scheduling.StoryPoints) |",
+        "| ---- | ---- | ---- |",
+        "| Active | 2 | 8 |",
+        "| Closed | 1 | 8 |",
+    ]
+    assert "3 work items in 2 groups." in result
+
+
+def test_project_without_mirrored_rows_is_aggregated_on_server(mirror):
+    client = FakeServerClient({
+        7: {"System.State": "New", "Microsoft.VSTS.Common.Priority": 2},
+        8: {"System.State": "New", "Microsoft.VSTS.Common.Priority": 4},
+    })
+
+    result = _aggregate_work_items_impl(
+        "[System.TeamProject] = 'Fabrikam'", ["System.State"],
+        ["count", "avg(Microsoft.VSTS.Common.Priority)"], client,
+        use_mirror=True)
+
+    assert len(client.queries) == 1
+    assert "| New | 2 | 3 |" in result
@@ -0,0 +1,17 @@
+from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+from mcp_azure_devops.features.work_items.formatting import WorkItemFormatter
+
+
+def test_identity_after_plain_dict_of_same_field():
+    formatter = WorkItemFormatter("table", ["System.AssignedTo"])
+    work_items = [
+        WorkItem(id=1, fields={"System.AssignedTo": {"id": "u0"}}),
+        WorkItem(id=2, fields={"System.AssignedTo": {
+            "displayName": "Jamie Reyes", "uniqueName": "jamie@contoso.com"}}),
+    ]
+
+    rows = formatter.format_table(work_items).splitlines()[2:]
+
+    assert rows == ["| 1 | id: u0 |",
+                    "| 2 | Jamie Reyes (jamie@contoso.com) |"]
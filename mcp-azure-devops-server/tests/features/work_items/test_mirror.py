@@ -0,0 +1,122 @@
+import json
+
+import pytest
+
+# Pages returned by GET _apis/wit/reporting/workitemrevisions with
+# includeLatestOnly, includeDeleted, includeIdentityRef and $expand=fields
+RECORDED_PAGES = [
+    {
+        "values": [
+            {
+                "id": 101,
+                "rev": 3,
+                "fields": {
+                    "System.Id": 101,
+                    "System.TeamProject": "Contoso",
+                    "System.WorkItemType": "Bug",
+                    "System.State": "Active",
+                    "System.Title": "Login fails",
+                    "System.AssignedTo": {
+                        "displayName": "Jamie Reyes",
+                        "uniqueName": "jamie@contoso.com",
+                    },
+                    "System.ChangedDate": "2025-03-02T09:15:00.000Z",
+                },
+            },
+            {
+                "id": 102,
+                "rev": 1,
+                "fields": {
+                    "System.Id": 102,
+                    "System.TeamProject": "Contoso",
+                    "System.WorkItemType": "Task",
+                    "System.State": "New",
+                    "System.Title": "Write docs",
+                    "System.ChangedDate": "2025-03-03T10:00:00.000Z",
+                },
+            },
+        ],
+        "nextLink": "https://dev.azure.com/contoso/Contoso/_apis/wit/"
+                    "reporting/workItemRevisions?continuationToken=1%3B2",
+        "continuationToken": "1;2",
+        "isLastBatch": False,
+    },
+    {
+        "values": [
+            {
+                "id": 102,
+                "rev": 2,
+                "fields": {
+                    "System.Id": 102,
+                    "System.TeamProject": "Contoso",
+                    "System.WorkItemType": "Task",
+                    "System.State": "Closed",
+                    "System.Title": "Write docs",
+                    "System.ChangedDate": "2025-03-04T11:30:00.000Z",
+                },
+            },
+            {
+                "id": 103,
+                "rev": 4,
+                "fields": {
+                    "System.Id": 103,
+                    "System.TeamProject": "Contoso",
+                    "System.IsDeleted": True,
+                },
+            },
+        ],
+        "continuationToken": "1;4",
+        "isLastBatch": True,
+    },
+]
+
+
+def test_sync_stores_rows_from_recorded_payload(mirror, reporting_client):
+    client = reporting_client(RECORDED_PAGES)
+
+    result = mirror.sync(client, "Contoso")
+
+    assert result["stored"] == 3
+    assert result["deleted"] == 1
+    assert result["batches"] == 2
+    assert client.tokens == [None, "1;2"]
+    rows = mirror.select(
+        "SELECT id, project, rev, fields FROM work_items ORDER BY id", [])
+    assert [(row[0], row[1], row[2]) for row in rows] == [
+        (101, "Contoso", 3), (102, "Contoso", 2)]
+    assert json.loads(rows[1][3])["System.State"] == "Closed"
+    assert mirror.select(
+        "SELECT watermark FROM sync_state WHERE project = ?",
+        ["Contoso"]) == [("1;4",)]
+    assert mirror.is_fresh("Contoso")
+
+
+def test_incremental_sync_starts_from_watermark(mirror, reporting_client):
+    mirror.sync(reporting_client(RECORDED_PAGES), "Contoso")
+    client = reporting_client([{"values": [], "continuationToken": "1;4",
+                                "isLastBatch": True}])
+
+    result = mirror.sync(client, "Contoso")
+
+    assert client.tokens == ["1;4"]
+    assert result["recorded"]
+    assert mirror.is_fresh("Contoso")
+
+
+def test_sync_without_data_is_not_recorded(mirror, reporting_client):
+    result = mirror.sync(reporting_client([{}]), "Contoso")
+
+    assert not result["recorded"]
+    assert not mirror.is_fresh("Contoso")
+    assert mirror.status() == []
+
+
+def test_failed_sync_is_not_recorded(mirror):
+    class FailingClient:
+        def read_reporting_revisions_get(self, **kwargs):
+            raise RuntimeError("TF400813: not authorized")
+
+    with pytest.raises(RuntimeError):
+        mirror.sync(FailingClient(), "Contoso")
+
+    assert not mirror.is_fresh("Contoso")
@@ -0,0 +1,168 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from mcp_azure_devops.features.work_items.tools.query import (
+    _run_wiql_locally,
+)
+from mcp_azure_devops.features.work_items.wiql import (
+    WiqlNotSupportedError,
+    run_wiql_on_mirror,
+)
+
+JAMIE = {"displayName": "Jamie Reyes", "uniqueName": "jamie@contoso.com"}
+ALEX = {"displayName": "Alex Kim", "uniqueName": "alex@contoso.com"}
+
+
+def _days_ago(days):
+    moment = datetime.now(timezone.utc) - timedelta(days=days)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+@pytest.fixture
+def mirror(synced_mirror):
+    return synced_mirror({
+        1: {"System.WorkItemType": "Bug", "System.State": "Active",
+            "System.Title": "Login fails", "System.AssignedTo": JAMIE,
+            "System.AreaPath": "Contoso\\Web",
+            "Microsoft.VSTS.Common.Priority": 1,
+            "System.ChangedDate": _days_ago(0)},
+        2: {"System.WorkItemType": "Task", "System.State": "New",
+            "System.Title": "Write docs",
+            "System.AreaPath": "Contoso\\Web\\UI",
+            "Microsoft.VSTS.Common.Priority": 2,
+            "System.ChangedDate": _days_ago(3)},
+        3: {"System.WorkItemType": "Bug", "System.State": "Closed",
+            "System.Title": "Crash after login", "System.AssignedTo": ALEX,
+            "System.AreaPath": "Contoso\\Api",
+            "Microsoft.VSTS.Common.Priority": 3,
+            "System.ChangedDate": _days_ago(10)},
+        4: {"System.WorkItemType": "Epic", "System.State": "Active",
+            "System.Title": "Website redesign", "System.AssignedTo": JAMIE,
+            "System.AreaPath": "Contoso\\Website",
+            "Microsoft.VSTS.Common.Priority": 2,
+            "System.ChangedDate": _days_ago(30)},
+    })
+
+
+def _ids(mirror, where, order_by=""):
+    query = (f"SELECT [System.Id] FROM WorkItems WHERE "
+             f"[System.TeamProject] = 'Contoso' AND {where} {order_by}")
+    ids, _ = run_wiql_on_mirror(mirror, query, 100, None)
+    return ids
+
+
+@pytest.mark.parametrize("where, expected", [
+    ("[System.State] = 'active'", [1, 4]),
+    ("[System.State] <> 'Active'", [2, 3]),
+    ("[System.State] IN ('New', 'Closed')", [2, 3]),
+    ("[System.State] NOT IN ('New', 'Closed')", [1, 4]),
+    ("[System.Title] CONTAINS 'LOGIN'", [1, 3]),
+    ("[System.Title] NOT CONTAINS 'login'", [2, 4]),
+    ("[System.AreaPath] UNDER 'Contoso\\Web'", [1, 2]),
+    ("[System.AreaPath] NOT UNDER 'Contoso\\Web'", [3, 4]),
+    ("[Microsoft.VSTS.Common.Priority] <= 2", [1, 2, 4]),
+    ("([System.State] = 'New' OR [System.WorkItemType] = 'Epic')", [2, 4]),
+    ("NOT [System.WorkItemType] = 'Bug'", [2, 4]),
+])
+def test_operators(mirror, where, expected):
+    assert _ids(mirror, where) == expected
+
+
+@pytest.mark.parametrize("where, expected", [
+    ("[System.AssignedTo] = ''", [2]),
+    ("[System.AssignedTo] <> ''", [1, 3, 4]),
+    ("[System.Title] = ''", []),
+])
+def test_empty_values(mirror, where, expected):
+    assert _ids(mirror, where) == expected
+
+
+@pytest.mark.parametrize("where, expected", [
+    ("[System.AssignedTo] = 'Jamie Reyes'", [1, 4]),
+    ("[System.AssignedTo] = 'JAMIE@contoso.com'", [1, 4]),
+    ("[System.AssignedTo] = 'Alex Kim <alex@contoso.com>'", [3]),
+    ("[System.AssignedTo] <> 'Jamie Reyes'", [2, 3]),
+    ("[System.AssignedTo] IN ('Alex Kim', 'jamie@contoso.com')",
+     [1, 3, 4]),
+])
+def test_identities(mirror, where, expected):
+    assert _ids(mirror, where) == expected
+
+
+def test_me_uses_configured_email(mirror, monkeypatch):
+    monkeypatch.setenv("AZURE_DEVOPS_USER_EMAIL", "alex@contoso.com")
+    assert _ids(mirror, "[System.AssignedTo] = @Me") == [3]
+
+
+def test_me_without_email_is_not_supported(mirror, monkeypatch):
+    monkeypatch.delenv("AZURE_DEVOPS_USER_EMAIL", raising=False)
+    with pytest.raises(WiqlNotSupportedError):
+        _ids(mirror, "[System.AssignedTo] = @Me")
+
+
+@pytest.mark.parametrize("where, expected", [
+    ("[System.ChangedDate] = @Today", [1]),
+    ("[System.ChangedDate] >= @Today - 5", [1, 2]),
+    ("[System.ChangedDate] < @Today-7", [3, 4]),
+    ("[System.ChangedDate] <= @Today + 1", [1, 2, 3, 4]),
+])
+def test_today(mirror, where, expected):
+    assert _ids(mirror, where) == expected
+
+
+@pytest.mark.parametrize("order_by, expected", [
+    ("ORDER BY [Microsoft.VSTS.Common.Priority] DESC", [3, 2, 4, 1]),
+    ("ORDER BY [System.ChangedDate]", [4, 3, 2, 1]),
+    ("ORDER BY [System.AssignedTo] ASC, [System.Id] DESC", [2, 3, 4, 1]),
+])
+def test_order_by(mirror, order_by, expected):
+    assert _ids(mirror, "[System.Id] > 0", order_by) == expected
+
+
+def test_select_list_and_top(mirror):
+    ids, fields = run_wiql_on_mirror(
+        mirror,
+        "SELECT [system.title], [System.State] FROM WorkItems "
+        "WHERE [System.TeamProject] = 'Contoso' ORDER BY [System.Id] DESC",
+        2, None)
+    assert ids == [4, 3]
+    assert fields == ["System.Title", "System.State"]
+
+
+@pytest.mark.parametrize("query", [
+    "SELECT [System.Id] FROM WorkItems WHERE [System.State] = 'Active'",
+    "SELECT [System.Id] FROM WorkItems WHERE "
+    "[System.TeamProject] = 'Contoso' OR [System.State] = 'Active'",
+    "SELECT [System.Id] FROM WorkItemLinks WHERE "
+    "[System.TeamProject] = 'Contoso'",
+    "SELECT [System.Id] FROM WorkItems WHERE "
+    "[System.TeamProject] = 'Contoso' ASOF '2024-01-01'",
+    "SELECT [System.Id] FROM WorkItems WHERE "
+    "[System.TeamProject] = 'Contoso' AND [System.State] EVER 'Active'",
+    "SELECT [System.Id] FROM WorkItems WHERE "
+    "[System.TeamProject] = 'Contoso' AND [System.Title] = @Project",
+    "SELECT [System.Id] FROM WorkItems WHERE "
+    "[System.TeamProject] = 'Contoso' AND [System.ChangedDate] "
+    "CONTAINS @Today",
+    "SELECT [System.Id] FROM WorkItems WHERE "
+    "[System.TeamProject] = 'Fabrikam'",
+])
+def test_unsupported_queries_are_rejected(mirror, query):
+    with pytest.raises(WiqlNotSupportedError):
+        run_wiql_on_mirror(mirror, query, 100, None)
+
+
+def test_project_without_mirrored_rows_runs_on_server(mirror, monkeypatch):
+    mirror._db.execute(
+        "INSERT INTO sync_state (project, watermark, synced_at) "
+        "VALUES ('Fabrikam', '1;1', strftime('%s', 'now'))")
+    mirror._db.commit()
+    assert mirror.is_fresh("Fabrikam")
+    monkeypatch.setenv("AZURE_DEVOPS_MIRROR_PATH", mirror.path)
+
+    query = ("SELECT [System.Id] FROM WorkItems "
+             "WHERE [System.TeamProject] = 'Fabrikam'")
+    assert _run_wiql_locally(query, 100, None) is None
+    assert _run_wiql_locally(query.replace("Fabrikam", "Contoso"), 100,
+                             None) == ([1, 2, 3, 4], ["System.Id"])